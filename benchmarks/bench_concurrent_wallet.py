@@ -0,0 +1,104 @@
+import argparse
+import pathlib
+import sys
+import threading
+import time
+from collections.abc import Callable
+
+from benchmarks.harness import Measurement, report, save_results
+from benchmarks.synthetic import generate_transactions
+from src.common.types import Transaction
+from src.concurrent_wallet import ConcurrentWallet
+from src.wallet import Wallet
+
+ProcessTransaction = Callable[..., bool]
+
+
+def global_lock() -> ProcessTransaction:
+	"""
+	Serializes every transaction of a new plain wallet behind one lock, the simplest thread-safe alternative.
+
+	Returns:
+		ProcessTransaction: A `process_transaction` that holds the lock for the whole call.
+	"""
+	wallet, lock = Wallet(transaction_list=[]), threading.Lock()
+
+	def process_transaction(*args: object) -> bool:
+		with lock:
+			return wallet.process_transaction(*args)
+
+	return process_transaction
+
+
+def striped() -> ProcessTransaction:
+	"""
+	Creates a new wallet with per-currency locks.
+
+	Returns:
+		ProcessTransaction: The wallet's own `process_transaction`.
+	"""
+	return ConcurrentWallet(transaction_list=[]).process_transaction
+
+
+def submit_concurrently(process_transaction: ProcessTransaction, ledgers: list[list[Transaction]]) -> float:
+	"""
+	Submits one ledger per thread and times until every thread is done.
+
+	Args:
+		process_transaction (ProcessTransaction): The method each thread calls.
+		ledgers (list[list[Transaction]]): The transactions of each thread.
+
+	Returns:
+		float: The wall time, in seconds.
+	"""
+	barrier = threading.Barrier(len(ledgers) + 1)
+
+	def submit(transactions: list[Transaction]) -> None:
+		barrier.wait()
+
+		for transaction in transactions:
+			process_transaction(*transaction)
+
+	workers = [threading.Thread(target=submit, args=(ledger,)) for ledger in ledgers]
+
+	for worker in workers:
+		worker.start()
+
+	barrier.wait()
+	start = time.perf_counter()
+
+	for worker in workers:
+		worker.join()
+
+	return time.perf_counter() - start
+
+
+def main() -> None:
+	"""
+	Compares per-currency locking with one global lock as the number of submitting threads grows.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark the concurrent wallet against a globally locked wallet.")
+	parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+	parser.add_argument("--per-thread", type=int, default=100_000)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+	sys.stdout.write(f"GIL {'enabled' if gil else 'disabled'}\n")
+	measurements: list[Measurement] = []
+
+	for threads in args.threads:
+		ledgers = [list(generate_transactions(args.per_thread, seed=seed)) for seed in range(threads)]
+		rows = threads * args.per_thread
+
+		for make in (global_lock, striped):
+			seconds = min(submit_concurrently(make(), ledgers) for _ in range(args.repeat))
+			measurements.append(Measurement(f"{make.__name__}_{threads}_threads", rows, seconds, rows / seconds))
+			report(measurements[-1])
+
+	save_results(args.output, "concurrent_wallet", measurements)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,91 @@
+import argparse
+import pathlib
+import sys
+from functools import partial
+
+from benchmarks.harness import measure, report, save_results
+from benchmarks.synthetic import generate_transactions
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.editable_ledger import EditableLedger
+from src.wallet import Wallet
+
+EDIT_POSITIONS = (("start", 0.0), ("middle", 0.5), ("end", 0.999))
+"""Where in the ledger the edits are made, as a fraction of its length."""
+
+
+def rebuild(transactions: list[Transaction]) -> Wallet:
+	"""
+	Replays the whole ledger, as a correction required before the ledger was editable.
+
+	Args:
+		transactions (list[Transaction]): The ledger.
+
+	Returns:
+		Wallet: The wallet after the ledger.
+	"""
+	return Wallet(transaction_list=transactions)
+
+
+def amend(ledger: EditableLedger, index: int) -> int:
+	"""
+	Raises the amount of a transaction by one cent, then restores it.
+
+	Args:
+		ledger (EditableLedger): The ledger to edit.
+		index (int): The position of the transaction.
+
+	Returns:
+		int: The number of transactions recomputed by both edits.
+	"""
+	original = ledger[index]
+	recomputed = ledger.update(index, original._replace(amount=original.amount + 0.01))
+	return recomputed + ledger.update(index, original)
+
+
+def insert_and_delete(ledger: EditableLedger, index: int) -> int:
+	"""
+	Inserts a missed deposit, then deletes it again.
+
+	Args:
+		ledger (EditableLedger): The ledger to edit.
+		index (int): The position of the deposit.
+
+	Returns:
+		int: The number of transactions recomputed by both edits.
+	"""
+	recomputed = ledger.insert(index, Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 10.0))
+	return recomputed + ledger.delete(index)
+
+
+def main() -> None:
+	"""
+	Compares a full rebuild with edits made through an `EditableLedger` at the start, middle and end of the ledger.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark incremental edits of a ledger against a full rebuild.")
+	parser.add_argument("--size", type=int, default=1_000_000)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	transactions = list(generate_transactions(args.size, seed=args.seed))
+	measurements = [measure("rebuild", args.size, partial(rebuild, transactions), repeat=args.repeat, memory=False)]
+	report(measurements[-1])
+
+	ledger = EditableLedger.from_transactions(transactions)
+
+	for label, fraction in EDIT_POSITIONS:
+		index = int(fraction * (args.size - 1))
+
+		for name, edit in (("amend", amend), ("insert_delete", insert_and_delete)):
+			recomputed = edit(ledger, index)
+			measurements.append(measure(f"{name}_{label}", 2, partial(edit, ledger, index), repeat=args.repeat, memory=False))
+			report(measurements[-1])
+			sys.stdout.write(f"  recomputed {recomputed} transactions\n")
+
+	save_results(args.output, "editable_ledger", measurements)
+
+
+if __name__ == "__main__":
+	main()
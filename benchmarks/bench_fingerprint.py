@@ -0,0 +1,102 @@
+import argparse
+import pathlib
+import sys
+from functools import partial
+
+from benchmarks.harness import measure, report, save_results
+from benchmarks.synthetic import generate_transactions
+from src.common.types import Transaction, TransactionBatch
+from src.fingerprint import MerkleTree, first_divergence, ledger_fingerprint
+
+
+class CountingTree:
+	"""
+	Serves the nodes of a tree while counting the hashes fetched, as a remote replica would be asked for them.
+	"""
+
+	def __init__(self, tree: MerkleTree) -> None:
+		"""
+		Wraps a tree.
+
+		Args:
+			tree (MerkleTree): The tree to serve.
+		"""
+		self.tree = tree
+		self.fetched = 0
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of leaves.
+
+		Returns:
+			int: The number of chunks.
+		"""
+		return len(self.tree)
+
+	def node(self, level: int, index: int) -> bytes:
+		"""
+		Returns the hash of a node, counting the fetch.
+
+		Args:
+			level (int): The level of the node, 0 for the leaves.
+			index (int): The position of the node in its level.
+
+		Returns:
+			bytes: The node's hash.
+		"""
+		self.fetched += 1
+		return self.tree.node(level, index)
+
+
+def compare_rows(local: list[Transaction], remote: list[Transaction]) -> int | None:
+	"""
+	Finds the first differing row by comparing every row, as reconciliation worked without fingerprints.
+
+	Args:
+		local (list[Transaction]): One ledger.
+		remote (list[Transaction]): The other ledger.
+
+	Returns:
+		int | None: The first differing row, or None when the ledgers are equal.
+	"""
+	return next((row for row, (mine, theirs) in enumerate(zip(local, remote, strict=True)) if mine != theirs), None)
+
+
+def main() -> None:
+	"""
+	Times fingerprinting a ledger, then compares locating a single changed row by fingerprint and row by row.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark Merkle fingerprints for reconciling ledgers.")
+	parser.add_argument("--size", type=int, default=1_000_000)
+	parser.add_argument("--chunk-size", type=int, default=4096)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	transactions = list(generate_transactions(args.size, seed=args.seed))
+	batch = TransactionBatch.from_transactions(transactions)
+	changed = list(transactions)
+	row = int(0.9 * (args.size - 1))
+	changed[row] = changed[row]._replace(amount=changed[row].amount + 0.01)
+
+	local = ledger_fingerprint(batch, chunk_size=args.chunk_size)
+	remote = CountingTree(ledger_fingerprint(changed, chunk_size=args.chunk_size))
+	chunk = first_divergence(local, remote)
+
+	measurements = [
+		measure("fingerprint_transactions", args.size, partial(ledger_fingerprint, transactions, chunk_size=args.chunk_size), repeat=args.repeat),
+		measure("fingerprint_batch", args.size, partial(ledger_fingerprint, batch, chunk_size=args.chunk_size), repeat=args.repeat),
+		measure("locate_by_rows", args.size, partial(compare_rows, transactions, changed), repeat=args.repeat, memory=False),
+		measure("locate_by_fingerprint", len(local), partial(first_divergence, local, remote.tree), repeat=args.repeat, memory=False),
+	]
+
+	for measurement in measurements:
+		report(measurement)
+
+	sys.stdout.write(f"Row {row} found in chunk {chunk} of {len(local)} after fetching {remote.fetched} remote hashes\n")
+	save_results(args.output, "fingerprint", measurements)
+
+
+if __name__ == "__main__":
+	main()
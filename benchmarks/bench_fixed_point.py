@@ -0,0 +1,112 @@
+import argparse
+import pathlib
+import sys
+import tempfile
+from collections.abc import Iterator
+from decimal import Decimal
+from functools import partial
+
+from benchmarks.harness import Measurement, measure, report, save_results
+from benchmarks.synthetic import generate_transactions, write_csv
+from src.common.types import Transaction
+from src.fixed_point import CURRENCY_SCALES, FixedPointWallet, parse_minor_units_transaction, to_minor_units
+from src.streaming import TransactionParser, iter_csv, parse_transaction
+from src.wallet import Wallet
+
+
+def representable_transactions(count: int, seed: int) -> Iterator[Transaction]:
+	"""
+	Generates a synthetic ledger whose amounts fit the minor unit of their currency, so both backends see the same values.
+
+	Args:
+		count (int): The number of transactions to generate.
+		seed (int): The random seed.
+
+	Yields:
+		Transaction: Each transaction, with a float amount.
+	"""
+	for wallet_action, currency, amount in generate_transactions(count, seed=seed, failing_ratio=0.3):
+		scale = min(CURRENCY_SCALES[currency], 8)
+		yield Transaction(wallet_action, currency, round(amount, scale) or 10**-scale)
+
+
+def replay_float(transactions: list[Transaction]) -> Wallet:
+	"""
+	Replays the ledger through the float wallet.
+
+	Args:
+		transactions (list[Transaction]): The ledger, with float amounts.
+
+	Returns:
+		Wallet: The wallet after the ledger.
+	"""
+	return Wallet(transaction_list=transactions)
+
+
+def replay_fixed_point(transactions: list[Transaction]) -> FixedPointWallet:
+	"""
+	Replays the ledger through the fixed-point wallet.
+
+	Args:
+		transactions (list[Transaction]): The ledger, with amounts in minor units.
+
+	Returns:
+		FixedPointWallet: The wallet after the ledger.
+	"""
+	return FixedPointWallet(transaction_list=transactions)
+
+
+def parse_csv(path: pathlib.Path, parse: TransactionParser = parse_transaction) -> list[Transaction]:
+	"""
+	Parses the whole CSV ledger.
+
+	Args:
+		path (pathlib.Path): The ledger file.
+		parse (TransactionParser, optional): The row parser. Defaults to `parse_transaction`.
+
+	Returns:
+		list[Transaction]: The parsed transactions.
+	"""
+	return list(iter_csv(path, parse=parse))
+
+
+def main() -> None:
+	"""
+	Compares the float and fixed-point backends on replay and CSV parsing, and reports the float drift.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark the fixed-point ledger backend against floats.")
+	parser.add_argument("--size", type=int, default=1_000_000)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	transactions = list(representable_transactions(args.size, args.seed))
+	minor = [Transaction(a, c, to_minor_units(x, c)) for a, c, x in transactions]
+	measurements: list[Measurement] = []
+
+	with tempfile.TemporaryDirectory() as tmp:
+		path = pathlib.Path(tmp) / "ledger.csv"
+		write_csv(path, transactions)
+
+		for name, func in (
+			("replay_float", partial(replay_float, transactions)),
+			("replay_fixed_point", partial(replay_fixed_point, minor)),
+			("parse_csv_float", partial(parse_csv, path)),
+			("parse_csv_fixed_point", partial(parse_csv, path, parse_minor_units_transaction)),
+		):
+			measurements.append(measure(name, args.size, func, repeat=args.repeat, memory=False))
+			report(measurements[-1])
+
+	float_wallet, exact_wallet = replay_float(transactions), replay_fixed_point(minor)
+
+	for currency, exact in sorted(exact_wallet.balance.items()):
+		drift = Decimal(float_wallet.state[currency]) - exact
+		sys.stdout.write(f"{currency}: exact {exact}, float drift {drift:.3e}\n")
+
+	sys.stdout.write(f"rejections: float {float_wallet.rejections.total}, fixed point {exact_wallet.rejections.total}\n")
+	save_results(args.output, "fixed_point", measurements)
+
+
+if __name__ == "__main__":
+	main()
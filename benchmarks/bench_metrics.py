@@ -0,0 +1,76 @@
+import argparse
+import pathlib
+import sys
+from functools import partial
+from types import MethodType
+
+from benchmarks.harness import Measurement, measure, report, save_results
+from benchmarks.synthetic import generate_transactions
+from src.common.types import Transaction
+from src.metrics import WalletMetrics
+from src.wallet import Wallet
+
+
+def replay(transactions: list[Transaction], *, metrics: bool, reference: bool = False) -> None:
+	"""
+	Feeds the ledger to an empty wallet one `process_transaction` call at a time.
+
+	Args:
+		transactions (list[Transaction]): The ledger to replay.
+		metrics (bool): Whether the wallet is instrumented.
+		reference (bool, optional): Whether to call the class function directly, bypassing any instrumentation. Defaults to False.
+	"""
+	wallet = Wallet(transaction_list=[], metrics=WalletMetrics() if metrics else None)
+	process_transaction = MethodType(Wallet.process_transaction, wallet) if reference else wallet.process_transaction
+
+	for wallet_action, currency, amount in transactions:
+		process_transaction(wallet_action, currency, amount, verbose=False)
+
+
+def main() -> None:
+	"""
+	Measures the cost of `WalletMetrics`, disabled and enabled, against the uninstrumented method.
+
+	Raises:
+		AssertionError: If a wallet without metrics does not use the plain method.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark the overhead of Wallet metrics.")
+	parser.add_argument("--size", type=int, default=1_000_000)
+	parser.add_argument("--rounds", type=int, default=5, help="Interleaved rounds, the fastest of which is kept per mode.")
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	disabled = Wallet(transaction_list=[])
+
+	# Without metrics the wallet keeps the class method itself, so there is no wrapper or flag check to pay for.
+	if disabled.process_transaction.__func__ is not Wallet.process_transaction:
+		raise AssertionError("Wallets without metrics must keep the plain process_transaction method")
+
+	transactions = list(generate_transactions(args.size, failing_ratio=0.3))
+	modes = {
+		"reference": partial(replay, transactions, metrics=False, reference=True),
+		"metrics_disabled": partial(replay, transactions, metrics=False),
+		"metrics_enabled": partial(replay, transactions, metrics=True),
+	}
+	best: dict[str, Measurement] = {}
+
+	for _ in range(args.rounds):
+		for name, func in modes.items():
+			measurement = measure(name, args.size, func, repeat=1, memory=False)
+
+			if name not in best or measurement.seconds < best[name].seconds:
+				best[name] = measurement
+
+	for measurement in best.values():
+		report(measurement)
+
+	reference = best["reference"].seconds
+
+	for name in ("metrics_disabled", "metrics_enabled"):
+		sys.stdout.write(f"{name} overhead: {(best[name].seconds / reference - 1) * 100:+.1f}%\n")
+
+	save_results(args.output, "metrics", list(best.values()))
+
+
+if __name__ == "__main__":
+	main()
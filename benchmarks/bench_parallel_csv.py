@@ -0,0 +1,73 @@
+import argparse
+import os
+import pathlib
+import tempfile
+from collections import deque
+from functools import partial
+
+from benchmarks.harness import Measurement, measure, report, save_results
+from benchmarks.synthetic import generate_transactions, write_csv
+from src.parallel_csv import DEFAULT_CHUNK_BYTES, iter_csv_chunks
+from src.streaming import iter_csv
+
+
+def parse_sequential(path: pathlib.Path) -> None:
+	"""
+	Parses the file with the single-core streaming parser.
+
+	Args:
+		path (pathlib.Path): The ledger file.
+	"""
+	deque(iter_csv(path), maxlen=0)
+
+
+def parse_parallel(path: pathlib.Path, processes: int, chunk_bytes: int) -> None:
+	"""
+	Parses the file into columnar chunks in a process pool.
+
+	Args:
+		path (pathlib.Path): The ledger file.
+		processes (int): The number of worker processes.
+		chunk_bytes (int): The approximate size of each parsed range.
+	"""
+	deque(iter_csv_chunks(path, processes=processes, chunk_bytes=chunk_bytes), maxlen=0)
+
+
+def main() -> None:
+	"""
+	Compares `streaming.iter_csv` with `parallel_csv.iter_csv_chunks` at increasing process counts.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark parallel CSV parsing.")
+	parser.add_argument("--size", type=int, default=2_000_000)
+	parser.add_argument("--processes", type=int, nargs="+", default=sorted({1, 2, os.cpu_count() or 1}))
+	parser.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	measurements: list[Measurement] = []
+
+	with tempfile.TemporaryDirectory() as tmp:
+		path = pathlib.Path(tmp) / "ledger.csv"
+		write_csv(path, generate_transactions(args.size))
+
+		measurements.append(measure("iter_csv", args.size, partial(parse_sequential, path), repeat=args.repeat, memory=False))
+		report(measurements[-1])
+
+		for processes in args.processes:
+			measurements.append(
+				measure(
+					f"parallel_csv[{processes}]",
+					args.size,
+					partial(parse_parallel, path, processes, args.chunk_bytes),
+					repeat=args.repeat,
+					memory=False,
+				),
+			)
+			report(measurements[-1])
+
+	save_results(args.output, "parallel_csv", measurements)
+
+
+if __name__ == "__main__":
+	main()
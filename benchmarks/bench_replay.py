@@ -0,0 +1,131 @@
+import argparse
+import pathlib
+import tempfile
+import warnings
+from functools import partial
+
+from benchmarks.harness import Measurement, measure, report, save_results
+from benchmarks.synthetic import generate_transactions, write_csv, write_json
+from src import cli
+from src.asset_wallet import AssetWallet
+from src.common.enums import CurrencyEnum
+from src.common.types import Transaction, TransactionBatch
+from src.wallet import Wallet
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def wallet_construction(transactions: list[Transaction]) -> None:
+	"""
+	Builds a wallet from the full transaction list, as `cli.main` does.
+
+	Args:
+		transactions (list[Transaction]): The ledger to replay.
+	"""
+	with warnings.catch_warnings():
+		warnings.simplefilter("ignore")
+		Wallet(transaction_list=transactions)
+
+
+def process_transaction_loop(transactions: list[Transaction]) -> None:
+	"""
+	Feeds the ledger to an empty wallet one `process_transaction` call at a time.
+
+	Args:
+		transactions (list[Transaction]): The ledger to replay.
+	"""
+	wallet = Wallet(transaction_list=[])
+	process_transaction = wallet.process_transaction
+
+	with warnings.catch_warnings():
+		warnings.simplefilter("ignore")
+
+		for wallet_action, currency, amount in transactions:
+			process_transaction(wallet_action, currency, amount)
+
+
+def asset_batch_replay(batch: TransactionBatch) -> None:
+	"""
+	Replays the ledger from its integer columns into an array-backed `AssetWallet`.
+
+	Args:
+		batch (TransactionBatch): The ledger to replay.
+	"""
+	AssetWallet(transaction_list=()).process_batch(batch, validated=True)
+
+
+def parse_currency_mix(text: str) -> dict[CurrencyEnum, float]:
+	"""
+	Parses a currency mix such as `BTC=2,ETH=1,USD=1`.
+
+	Args:
+		text (str): The mix to parse.
+
+	Returns:
+		dict[CurrencyEnum, float]: The relative weight of each currency.
+	"""
+	mix = {}
+
+	for part in text.split(","):
+		name, _, weight = part.partition("=")
+		mix[CurrencyEnum[name.strip().upper()]] = float(weight or 1)
+
+	return mix
+
+
+def main() -> None:
+	"""
+	Runs the replay and parsing benchmarks over increasing ledger sizes and saves the results.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark Wallet replay and file parsing at scale.")
+	parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--currency-mix", type=parse_currency_mix, default=None, help="Relative weights, e.g. BTC=2,ETH=1,USD=1.")
+	parser.add_argument("--withdraw-ratio", type=float, default=0.3)
+	parser.add_argument("--failing-ratio", type=float, default=0.1, help="Share of withdrawals exceeding the balance.")
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--no-memory", action="store_true", help="Skip the extra traced run that records peak memory.")
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	measurements: list[Measurement] = []
+
+	for size in args.sizes:
+		transactions = list(
+			generate_transactions(
+				size,
+				seed=args.seed,
+				currency_mix=args.currency_mix,
+				withdraw_ratio=args.withdraw_ratio,
+				failing_ratio=args.failing_ratio,
+			),
+		)
+
+		# Each size is repeated less often as it grows, so the largest ones stay within minutes.
+		repeat = max(1, args.repeat if size <= 100_000 else 1)
+
+		with tempfile.TemporaryDirectory() as tmp:
+			csv_path, json_path = pathlib.Path(tmp) / "ledger.csv", pathlib.Path(tmp) / "ledger.json"
+			write_csv(csv_path, transactions)
+			write_json(json_path, transactions)
+
+			cases = [
+				("wallet_construction", partial(wallet_construction, transactions)),
+				("process_transaction", partial(process_transaction_loop, transactions)),
+				("asset_wallet.process_batch", partial(asset_batch_replay, TransactionBatch.from_transactions(transactions))),
+				("cli.parse_csv", partial(cli.parse_csv, csv_path)),
+				("cli.parse_json", partial(cli.parse_json, json_path)),
+			]
+
+			for name, func in cases:
+				measurement = measure(name, size, func, repeat=repeat, memory=not args.no_memory)
+				measurements.append(measurement)
+				report(measurement)
+
+		del transactions
+
+	save_results(args.output, "replay", measurements)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,69 @@
+import argparse
+import pathlib
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from benchmarks.harness import Measurement, measure, report, save_results
+from benchmarks.synthetic import generate_transactions
+from src.common.types import AccountTransaction
+from src.sharding import DEFAULT_SHARDS_PER_PROCESS, Shard, replay_accounts, replay_shard, shard_accounts
+
+
+def replay_shards(shards: list[Shard], processes: int) -> None:
+	"""
+	Replays already encoded shards, in-process or in a process pool, as `replay_accounts` does after partitioning.
+
+	Args:
+		shards (list[Shard]): The shards to replay.
+		processes (int): The number of worker processes, 1 for in-process.
+	"""
+	if processes == 1:
+		list(map(replay_shard, shards))
+		return
+
+	with ProcessPoolExecutor(max_workers=processes) as pool:
+		list(pool.map(replay_shard, shards))
+
+
+def main() -> None:
+	"""
+	Times the serial partitioning of a multi-account dump separately from the replay of its shards.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark partitioning and replaying a multi-account dump.")
+	parser.add_argument("--size", type=int, default=1_000_000)
+	parser.add_argument("--accounts", type=int, default=10_000)
+	parser.add_argument("--processes", type=int, nargs="+", default=[1, 4])
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	rng = random.Random(args.seed)  # noqa: S311
+	dump = [AccountTransaction(f"acct-{rng.randrange(args.accounts)}", *tx) for tx in generate_transactions(args.size, seed=args.seed)]
+	measurements: list[Measurement] = []
+
+	for processes in args.processes:
+		shard_count = 1 if processes == 1 else processes * DEFAULT_SHARDS_PER_PROCESS
+		_, shards = shard_accounts(dump, shard_count)
+
+		measurements += [
+			measure(f"partition_{processes}_processes", args.size, partial(shard_accounts, dump, shard_count), repeat=args.repeat, memory=False),
+			measure(f"replay_shards_{processes}_processes", args.size, partial(replay_shards, shards, processes), repeat=args.repeat, memory=False),
+			measure(
+				f"replay_accounts_{processes}_processes",
+				args.size,
+				partial(replay_accounts, dump, processes=processes),
+				repeat=args.repeat,
+				memory=False,
+			),
+		]
+
+	for measurement in measurements:
+		report(measurement)
+
+	save_results(args.output, "sharding", measurements)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,94 @@
+import argparse
+import pathlib
+import tempfile
+from functools import partial
+
+import numpy as np
+from numpy.typing import NDArray
+
+from benchmarks.harness import Measurement, measure, report, save_results
+from benchmarks.synthetic import generate_transactions
+from src.common.enums import CurrencyEnum
+from src.valuation import PriceCache, PriceSeries, value_wallets, write_price_series
+from src.wallet import Wallet
+
+DAY = 86_400
+
+
+def value_in_loops(wallets: list[Wallet], prices: dict[str, PriceSeries], timestamps: NDArray[np.int64]) -> list[list[float]]:
+	"""
+	Values every wallet at every timestamp by reading its balance and multiplying in Python.
+
+	Args:
+		wallets (list[Wallet]): The wallets.
+		prices (dict[str, PriceSeries]): The price series of each currency but USD.
+		timestamps (NDArray[np.int64]): The timestamps.
+
+	Returns:
+		list[list[float]]: The value of each wallet at each timestamp.
+	"""
+	table = {currency: series.as_of(timestamps).tolist() for currency, series in prices.items()}
+	table[CurrencyEnum.USD] = [1.0] * len(timestamps)
+
+	return [
+		[sum(amount * table[currency][column] for currency, amount in wallet.balance.items()) for column in range(len(timestamps))]
+		for wallet in wallets
+	]
+
+
+def load_cached(cache: PriceCache, paths: dict[str, pathlib.Path]) -> dict[str, PriceSeries]:
+	"""
+	Loads the price series through the cache.
+
+	Args:
+		cache (PriceCache): The cache.
+		paths (dict[str, pathlib.Path]): The price file of each currency.
+
+	Returns:
+		dict[str, PriceSeries]: The price series.
+	"""
+	return cache.load(paths)
+
+
+def main() -> None:
+	"""
+	Compares matrix valuation with per-wallet Python loops, and times cold and cached price loading.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark batch portfolio valuation.")
+	parser.add_argument("--wallets", type=int, default=1_000)
+	parser.add_argument("--days", type=int, default=5 * 365)
+	parser.add_argument("--seed", type=int, default=0)
+	parser.add_argument("--repeat", type=int, default=3)
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	rng = np.random.default_rng(args.seed)
+	wallets = [Wallet(transaction_list=generate_transactions(50, seed=args.seed + i)) for i in range(args.wallets)]
+	timestamps = np.arange(args.days, dtype=np.int64) * DAY
+	# Prices are observed hourly, so every daily lookup is a binary search in a series 24 times longer.
+	hours = np.arange(args.days * 24, dtype=np.int64) * 3600
+	prices = {currency: PriceSeries(hours, np.exp(np.cumsum(rng.normal(0, 0.01, len(hours))))) for currency in (CurrencyEnum.BTC, CurrencyEnum.ETH)}
+	# Valuations count one row per wallet and day, price loads one row per price read.
+	cells = args.wallets * args.days
+	measurements: list[Measurement] = []
+
+	with tempfile.TemporaryDirectory() as tmp:
+		paths = {currency: pathlib.Path(tmp) / f"{currency}.bin" for currency in prices}
+
+		for currency, path in paths.items():
+			write_price_series(path, prices[currency])
+
+		for name, rows, func in (
+			("python_loops", cells, partial(value_in_loops, wallets, prices, timestamps)),
+			("value_wallets", cells, partial(value_wallets, wallets, prices, timestamps)),
+			("load_prices_cold", len(hours) * len(paths), partial(load_cached, PriceCache(capacity=1), paths)),
+			("load_prices_cached", len(hours) * len(paths), partial(load_cached, PriceCache(), paths)),
+		):
+			measurements.append(measure(name, rows, func, repeat=args.repeat, memory=False))
+			report(measurements[-1])
+
+	save_results(args.output, "valuation", measurements)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,73 @@
+import argparse
+import pathlib
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.harness import Measurement, report, save_results
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.wal import DEFAULT_MAX_BATCH, DEFAULT_MAX_DELAY, DurableWallet
+
+
+def commit_concurrently(directory: pathlib.Path, threads: int, per_thread: int, *, max_delay: float, max_batch: int) -> int:
+	"""
+	Commits deposits from several threads to a fresh durable wallet.
+
+	Args:
+		directory (pathlib.Path): An empty directory for the wallet.
+		threads (int): The number of concurrent callers.
+		per_thread (int): The number of transactions committed by each caller.
+		max_delay (float): The group commit latency budget, in seconds.
+		max_batch (int): The largest number of records synced together.
+
+	Returns:
+		int: The number of syncs performed.
+	"""
+	with DurableWallet.open(directory, max_delay=max_delay, max_batch=max_batch) as wallet:
+
+		def caller() -> None:
+			for _ in range(per_thread):
+				wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 0.5)
+
+		workers = [threading.Thread(target=caller) for _ in range(threads)]
+
+		for worker in workers:
+			worker.start()
+
+		for worker in workers:
+			worker.join()
+
+		return wallet.log.syncs
+
+
+def main() -> None:
+	"""
+	Compares group commit with one sync per transaction, for the same concurrent load.
+	"""
+	parser = argparse.ArgumentParser(description="Benchmark write-ahead log group commit against per-transaction fsync.")
+	parser.add_argument("--threads", type=int, default=32)
+	parser.add_argument("--per-thread", type=int, default=200)
+	parser.add_argument("--max-delay", type=float, default=DEFAULT_MAX_DELAY)
+	parser.add_argument("--directory", type=pathlib.Path, default=None, help="Where to write the logs. Defaults to a temporary directory.")
+	parser.add_argument("--output", type=pathlib.Path, default=pathlib.Path("benchmark_results.json"))
+	args = parser.parse_args()
+
+	rows = args.threads * args.per_thread
+	measurements: list[Measurement] = []
+
+	with tempfile.TemporaryDirectory(dir=args.directory) as tmp:
+		for name, max_batch in (("fsync_per_transaction", 1), ("group_commit", DEFAULT_MAX_BATCH)):
+			start = time.perf_counter()
+			syncs = commit_concurrently(pathlib.Path(tmp) / name, args.threads, args.per_thread, max_delay=args.max_delay, max_batch=max_batch)
+			seconds = time.perf_counter() - start
+
+			measurements.append(Measurement(name, rows, seconds, rows / seconds))
+			report(measurements[-1])
+			sys.stdout.write(f"{name}: {rows / syncs:.1f} transactions per fsync\n")
+
+	save_results(args.output, "wal", measurements)
+
+
+if __name__ == "__main__":
+	main()
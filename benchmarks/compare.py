@@ -0,0 +1,56 @@
+import argparse
+import json
+import pathlib
+import sys
+
+
+def load(path: str | pathlib.Path) -> dict[tuple[str, int], dict]:
+	"""
+	Reads a results file written by `harness.save_results`, keyed by benchmark and input size.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+
+	Returns:
+		dict[tuple[str, int], dict]: The measurements.
+	"""
+	document = json.loads(pathlib.Path(path).read_text(encoding="utf-8"))
+	return {(result["benchmark"], result["rows"]): result for result in document["results"]}
+
+
+def main() -> None:
+	"""
+	Compares two benchmark result files and exits with status 1 if any benchmark regressed beyond the threshold.
+	"""
+	parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+	parser.add_argument("baseline", type=pathlib.Path)
+	parser.add_argument("candidate", type=pathlib.Path)
+	parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown or memory growth reported as a regression.")
+	args = parser.parse_args()
+
+	baseline, candidate = load(args.baseline), load(args.candidate)
+	regressions = 0
+
+	for key in sorted(baseline.keys() & candidate.keys()):
+		old, new = baseline[key], candidate[key]
+		time_ratio = new["seconds"] / old["seconds"] if old["seconds"] else float("inf")
+		line = f"{key[0]:<28} {key[1]:>10} rows  time x{time_ratio:6.2f}"
+
+		if old.get("peak_memory_bytes") and new.get("peak_memory_bytes"):
+			memory_ratio = new["peak_memory_bytes"] / old["peak_memory_bytes"]
+			line += f"  memory x{memory_ratio:6.2f}"
+
+		else:
+			memory_ratio = 1.0
+
+		if time_ratio > 1 + args.threshold or memory_ratio > 1 + args.threshold:
+			regressions += 1
+			line += "  REGRESSION"
+
+		sys.stdout.write(line + "\n")
+
+	sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+	main()
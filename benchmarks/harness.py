@@ -0,0 +1,129 @@
+import gc
+import json
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+
+
+@dataclass(frozen=True)
+class Measurement:
+	"""
+	The timing and memory of one benchmark at one input size.
+
+	Attributes:
+		benchmark (str): The name of the benchmark.
+		rows (int): The number of transactions processed.
+		seconds (float): The best wall time over the repetitions.
+		rows_per_second (float): The throughput derived from `seconds`.
+		peak_memory_bytes (int | None): The peak memory allocated by Python during one extra run, if measured.
+	"""
+
+	benchmark: str
+	rows: int
+	seconds: float
+	rows_per_second: float
+	peak_memory_bytes: int | None = None
+
+
+def measure(
+	benchmark: str,
+	rows: int,
+	func: Callable[[], object],
+	*,
+	repeat: int = 3,
+	memory: bool = True,
+) -> Measurement:
+	"""
+	Times a callable, then optionally runs it once more under `tracemalloc` to record its peak memory.
+
+	Memory is traced in a separate run because tracing slows allocation-heavy code down several times.
+
+	Args:
+		benchmark (str): The name of the benchmark.
+		rows (int): The number of transactions processed per call.
+		func (Callable[[], object]): The code to measure.
+		repeat (int, optional): The number of timed runs, of which the fastest is kept. Defaults to 3.
+		memory (bool, optional): Whether to record peak memory. Defaults to True.
+
+	Returns:
+		Measurement: The measurement.
+	"""
+	best = float("inf")
+
+	for _ in range(repeat):
+		gc.collect()
+		start = time.perf_counter()
+		func()
+		best = min(best, time.perf_counter() - start)
+
+	peak = None
+
+	if memory:
+		gc.collect()
+		tracemalloc.start()
+
+		try:
+			func()
+			_, peak = tracemalloc.get_traced_memory()
+
+		finally:
+			tracemalloc.stop()
+
+	return Measurement(benchmark, rows, best, rows / best if best else 0.0, peak)
+
+
+def environment() -> dict:
+	"""
+	Describes the interpreter, machine and commit the benchmarks ran on.
+
+	Returns:
+		dict: The environment description.
+	"""
+	try:
+		commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()  # noqa: S607
+
+	except (OSError, subprocess.CalledProcessError):
+		commit = None
+
+	return {
+		"timestamp": datetime.now(tz=UTC).isoformat(),
+		"commit": commit,
+		"python": sys.version,
+		"implementation": platform.python_implementation(),
+		"gil_enabled": getattr(sys, "_is_gil_enabled", lambda: True)(),
+		"platform": platform.platform(),
+		"machine": platform.machine(),
+		"cpu_count": os.cpu_count(),
+	}
+
+
+def save_results(path: str | pathlib.Path, suite: str, measurements: list[Measurement]) -> None:
+	"""
+	Writes measurements and their environment to a JSON file, for later comparison with `benchmarks.compare`.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+		suite (str): The name of the benchmark suite.
+		measurements (list[Measurement]): The measurements to save.
+	"""
+	document = {"suite": suite, "environment": environment(), "results": [asdict(m) for m in measurements]}
+	pathlib.Path(path).write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+
+
+def report(measurement: Measurement) -> None:
+	"""
+	Prints a measurement as one aligned line.
+
+	Args:
+		measurement (Measurement): The measurement to print.
+	"""
+	memory = "" if measurement.peak_memory_bytes is None else f"{measurement.peak_memory_bytes / 2**20:10.1f} MiB"
+	throughput = f"{measurement.rows_per_second:14,.0f} rows/s"
+	sys.stdout.write(f"{measurement.benchmark:<28} {measurement.rows:>10} rows {measurement.seconds:10.4f} s {throughput} {memory}\n")
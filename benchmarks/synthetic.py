@@ -0,0 +1,98 @@
+import csv
+import json
+import pathlib
+import random
+from collections.abc import Iterable, Iterator, Mapping
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+
+_BLOCK = 4_096
+
+
+def generate_transactions(  # noqa: PLR0913
+	count: int,
+	*,
+	seed: int = 0,
+	currency_mix: Mapping[CurrencyEnum, float] | None = None,
+	withdraw_ratio: float = 0.3,
+	failing_ratio: float = 0.1,
+	max_amount: float = 1_000.0,
+) -> Iterator[Transaction]:
+	"""
+	Lazily generates a reproducible ledger with a controlled mix of currencies and outcomes.
+
+	The generator tracks the balance a `Wallet` would hold, so it decides up front whether each withdrawal fails: a
+	failing withdrawal asks for more than the balance, a succeeding one for at most the balance. A withdrawal meant to
+	succeed on an empty balance is emitted as a deposit instead.
+
+	Args:
+		count (int): The number of transactions to generate.
+		seed (int, optional): The random seed. Defaults to 0.
+		currency_mix (Mapping[CurrencyEnum, float] | None, optional): The relative weight of each currency. Defaults to equal weights.
+		withdraw_ratio (float, optional): The share of transactions that are withdrawals. Defaults to 0.3.
+		failing_ratio (float, optional): The share of withdrawals that exceed the balance. Defaults to 0.1.
+		max_amount (float, optional): The largest deposit. Defaults to 1_000.0.
+
+	Yields:
+		Transaction: Each generated transaction.
+	"""
+	rng = random.Random(seed)  # noqa: S311
+	mix = currency_mix or dict.fromkeys(CurrencyEnum, 1.0)
+	currencies, weights = list(mix), list(mix.values())
+	balances = dict.fromkeys(currencies, 0.0)
+
+	for start in range(0, count, _BLOCK):
+		for currency in rng.choices(currencies, weights, k=min(_BLOCK, count - start)):
+			balance = balances[currency]
+
+			if rng.random() < withdraw_ratio:
+				if rng.random() < failing_ratio:
+					yield Transaction(WalletActionEnum.WITHDRAW, currency, balance + rng.uniform(0.01, max_amount))
+					continue
+
+				if balance > 0:
+					amount = round(balance * rng.random(), 8)
+
+					if not 0 < amount <= balance:
+						amount = balance
+
+					balances[currency] = balance - amount
+					yield Transaction(WalletActionEnum.WITHDRAW, currency, amount)
+					continue
+
+			amount = round(rng.uniform(0.01, max_amount), 2)
+			balances[currency] = balance + amount
+			yield Transaction(WalletActionEnum.DEPOSIT, currency, amount)
+
+
+def write_csv(path: str | pathlib.Path, transactions: Iterable[Transaction]) -> None:
+	"""
+	Writes transactions in the CSV layout read by `cli.parse_csv`.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+		transactions (Iterable[Transaction]): The transactions to write.
+	"""
+	with pathlib.Path(path).open("w", newline="", encoding="utf-8") as f:
+		writer = csv.writer(f)
+		writer.writerow(("action", "currency", "amount"))
+		writer.writerows((action.value, currency.value, repr(amount)) for action, currency, amount in transactions)
+
+
+def write_json(path: str | pathlib.Path, transactions: Iterable[Transaction]) -> None:
+	"""
+	Writes transactions in the JSON layout read by `cli.parse_json`, one item per line and without buffering the document.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+		transactions (Iterable[Transaction]): The transactions to write.
+	"""
+	with pathlib.Path(path).open("w", encoding="utf-8") as f:
+		f.write("[")
+
+		for i, (action, currency, amount) in enumerate(transactions):
+			f.write(",\n" if i else "\n")
+			f.write(json.dumps({"action": action.value, "currency": currency.value, "amount": amount}))
+
+		f.write("\n]\n")
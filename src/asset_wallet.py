@@ -0,0 +1,279 @@
+from array import array
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field
+from typing import Self
+from warnings import warn
+
+from src.common.enums import WALLET_ACTION_CODES, WalletActionEnum
+from src.common.types import AssetRegistry, TransactionBatch
+from src.rejections import ReplayResult
+from src.wallet import Wallet
+
+_DEPOSIT = WALLET_ACTION_CODES[WalletActionEnum.DEPOSIT]
+
+
+class AssetBalances(MutableMapping[str, float]):
+	"""
+	Balances stored in a preallocated array indexed by asset ID, exposed as a mapping from symbol to balance.
+
+	Like the `defaultdict` of a plain `Wallet`, the mapping only lists the assets that were touched, and reading a
+	registered asset that was not touched gives 0.0.
+
+	Attributes:
+		assets (AssetRegistry): The registry of the asset IDs.
+		values (array): The balance of each asset, indexed by ID (typecode "d").
+		touched (bytearray): Whether each asset has been touched, indexed by ID.
+	"""
+
+	def __init__(self, assets: AssetRegistry, balances: Mapping[str, float] | None = None) -> None:
+		"""
+		Allocates a balance for every registered asset.
+
+		Args:
+			assets (AssetRegistry): The registry of the asset IDs.
+			balances (Mapping[str, float] | None, optional): Initial balances by symbol. Defaults to none.
+		"""
+		self.assets = assets
+		self.values = array("d", bytes(8 * len(assets)))
+		self.touched = bytearray(len(assets))
+		self.update(balances or {})
+
+	def reserve(self) -> None:
+		"""
+		Grows the arrays to cover assets registered since they were allocated.
+		"""
+		if (missing := len(self.assets) - len(self.values)) > 0:
+			self.values.frombytes(bytes(8 * missing))
+			self.touched.extend(bytes(missing))
+
+	def __getitem__(self, symbol: str) -> float:
+		"""
+		Returns the balance of an asset.
+
+		Args:
+			symbol (str): A registered symbol.
+
+		Returns:
+			float: The balance, 0.0 if the asset was not touched.
+		"""
+		asset = self.assets.resolve(symbol)
+		return self.values[asset] if asset < len(self.values) else 0.0
+
+	def __setitem__(self, symbol: str, balance: float) -> None:
+		"""
+		Sets the balance of an asset.
+
+		Args:
+			symbol (str): A registered symbol.
+			balance (float): The new balance.
+		"""
+		asset = self.assets.resolve(symbol)
+		self.reserve()
+		self.values[asset] = balance
+		self.touched[asset] = 1
+
+	def __delitem__(self, symbol: str) -> None:
+		"""
+		Forgets the balance of an asset.
+
+		Args:
+			symbol (str): A touched symbol.
+
+		Raises:
+			KeyError: If the asset was not touched.
+		"""
+		if symbol not in self:
+			raise KeyError(symbol)
+
+		asset = self.assets.resolve(symbol)
+		self.values[asset] = 0.0
+		self.touched[asset] = 0
+
+	def __contains__(self, symbol: object) -> bool:
+		"""
+		Tells whether an asset has been touched.
+
+		Args:
+			symbol (object): The symbol, in any spelling.
+
+		Returns:
+			bool: Whether the asset is registered and touched.
+		"""
+		if symbol not in self.assets:
+			return False
+
+		asset = self.assets.resolve(symbol)
+		return asset < len(self.touched) and bool(self.touched[asset])
+
+	def __iter__(self) -> Iterator[str]:
+		"""
+		Iterates over the touched assets, by ID.
+
+		Yields:
+			str: The canonical symbol of each touched asset.
+		"""
+		symbols, touched = self.assets.symbols, self.touched
+		asset = touched.find(1)
+
+		while asset != -1:
+			yield symbols[asset]
+			asset = touched.find(1, asset + 1)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of touched assets.
+
+		Returns:
+			int: The number of touched assets.
+		"""
+		return self.touched.count(1)
+
+	def __copy__(self) -> Self:
+		"""
+		Copies the balances, sharing the registry.
+
+		Returns:
+			Self: Independent balances over the same registry.
+		"""
+		balances = type(self)(self.assets)
+		balances.values, balances.touched = array("d", self.values), bytearray(self.touched)
+		return balances
+
+	def __repr__(self) -> str:
+		"""
+		Shows the touched balances.
+
+		Returns:
+			str: The representation.
+		"""
+		return f"{type(self).__name__}({dict(self)!r})"
+
+
+@dataclass
+class AssetWallet(Wallet):
+	"""
+	A wallet holding any asset of an `AssetRegistry`, with balances kept in an array indexed by asset ID.
+
+	Transactions name their asset by symbol, in any spelling the registry resolves. `process_batch` replays a
+	`TransactionBatch` straight from its integer columns, so the hot loop indexes arrays instead of hashing symbols.
+	The built-in currencies work as with `Wallet`, and keep appearing as `CurrencyEnum` members.
+
+	Attributes:
+		assets (AssetRegistry): The registry of the assets the wallet accepts. Defaults to the built-in currencies.
+		state (AssetBalances): The balance of each asset, converted from a plain mapping when one is given.
+	"""
+
+	assets: AssetRegistry = field(default_factory=AssetRegistry)
+
+	def __post_init__(self) -> None:
+		"""
+		Moves the initial balances into arrays, binds the rejection log to the registry, then processes the transaction list.
+		"""
+		if not isinstance(self.state, AssetBalances) or self.state.assets is not self.assets:
+			self.state = AssetBalances(self.assets, self.state)
+
+		if self.rejections.assets is None:
+			self.rejections.assets = self.assets
+
+		super().__post_init__()
+
+	def _validate_transaction(self, wallet_action: WalletActionEnum, currency: str, amount: float) -> None:
+		"""
+		Validates a transaction's parameters against the registry.
+
+		Args:
+			wallet_action (WalletActionEnum): The action to validate.
+			currency (str): The asset symbol to validate.
+			amount (float): The amount to validate.
+
+		Raises:
+			ValueError: If the asset is not registered.
+		"""
+		self._validate_wallet_action(wallet_action)
+
+		if currency not in self.assets:
+			raise ValueError(f"Unsupported currency: {currency}")
+
+		self._validate_amount(amount)
+
+	def _apply(self, wallet_action: WalletActionEnum, currency: str, amount: float, *, verbose: bool | None = None) -> bool:
+		"""
+		Applies a transaction that is already known to be valid.
+
+		Args:
+			wallet_action (WalletActionEnum): The action to perform.
+			currency (str): The asset symbol.
+			amount (float): The amount to transact.
+			verbose (bool | None, optional): Whether to print warnings. Defaults to the wallet's `verbose`.
+
+		Returns:
+			bool: Whether the transaction was successful.
+		"""
+		asset, state = self.assets.resolve(currency), self.state
+		state.reserve()
+		values = state.values
+		self.transaction_count += 1
+		state.touched[asset] = 1
+
+		if wallet_action == WalletActionEnum.DEPOSIT:
+			values[asset] += amount
+			return True
+
+		if values[asset] < amount:
+			self.rejections.record(self.transaction_count - 1, currency, amount, values[asset])
+
+			if verbose or (verbose is None and self.verbose):
+				warn(f"Insufficient funds for withdrawal: {amount} {currency}, transaction skipped.", stacklevel=1)
+
+			return False
+
+		values[asset] -= amount
+		return True
+
+	def process_batch(self, batch: TransactionBatch, *, validated: bool = False) -> ReplayResult:
+		"""
+		Processes a batch from its integer columns, without building a transaction per row.
+
+		Instrumented wallets and wallets recording history go through `process_transactions` instead.
+
+		Args:
+			batch (TransactionBatch): The transactions, encoded with this wallet's registry or with the built-in currencies.
+			validated (bool, optional): Whether the amounts are already known to be positive. Defaults to False.
+
+		Returns:
+			ReplayResult: The number of processed and successful transactions, the balance and the rejection log.
+
+		Raises:
+			ValueError: If the batch was encoded with another registry, or holds an amount that is not positive.
+		"""
+		if batch.assets is not None and batch.assets is not self.assets:
+			raise ValueError("Batch was encoded with another asset registry")
+
+		if not validated and batch.amounts and not min(batch.amounts) > 0:
+			raise ValueError(f"Amount must be positive: {min(batch.amounts)}")
+
+		if self.metrics is not None or self.history is not None:
+			return self.process_transactions(batch, validated=True)
+
+		state, symbols, record = self.state, self.assets.symbols, self.rejections.record
+		state.reserve()
+		values, touched = state.values, state.touched
+		start = self.transaction_count
+		accepted = 0
+
+		for index, (action, asset, amount) in enumerate(zip(*batch.columns, strict=True), start):
+			touched[asset] = 1
+
+			if action == _DEPOSIT:
+				values[asset] += amount
+				accepted += 1
+
+			elif values[asset] < amount:
+				record(index, symbols[asset], amount, values[asset])
+
+			else:
+				values[asset] -= amount
+				accepted += 1
+
+		self.transaction_count = start + len(batch)
+		return ReplayResult(len(batch), accepted, self.balance, self.rejections)
@@ -0,0 +1,244 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from src.common.enums import CURRENCIES, CURRENCY_CODES, WALLET_ACTION_CODES, WALLET_ACTIONS, CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction, TransactionBatch
+
+DEFAULT_BLOCK_SIZE = 4096
+"""Number of same-currency transactions checked per vectorized step."""
+
+DEPOSIT_CODE = WALLET_ACTION_CODES[WalletActionEnum.DEPOSIT]
+WITHDRAW_CODE = WALLET_ACTION_CODES[WalletActionEnum.WITHDRAW]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+	"""
+	The outcome of replaying a batch of transactions.
+
+	Attributes:
+		state (dict[CurrencyEnum, float]): The final balance of every currency touched by the batch.
+		accepted (NDArray[np.bool_]): Per-transaction mask, `True` where the transaction was applied.
+	"""
+
+	state: dict[CurrencyEnum, float]
+	accepted: NDArray[np.bool_]
+
+	@property
+	def balance(self) -> dict[CurrencyEnum, float]:
+		"""
+		The final balance of the batch, in the same shape as `Wallet.balance`.
+
+		Returns:
+			dict[CurrencyEnum, float]: A dictionary with the balance of each currency.
+		"""
+		return dict(self.state)
+
+	@property
+	def rejected(self) -> NDArray[np.intp]:
+		"""
+		The indices of the transactions that were ignored for insufficient funds.
+
+		Returns:
+			NDArray[np.intp]: The rejected transaction indices, in ascending order.
+		"""
+		return np.flatnonzero(~self.accepted)
+
+
+def encode_transactions(
+	transactions: Iterable[Transaction],
+) -> tuple[NDArray[np.uint8], NDArray[np.uint8], NDArray[np.float64]]:
+	"""
+	Converts transactions into the columns expected by `replay_batch`.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions to encode.
+
+	Returns:
+		tuple[NDArray[np.uint8], NDArray[np.uint8], NDArray[np.float64]]: The action codes, currency codes and amounts.
+
+	Raises:
+		ValueError: If a transaction has an unsupported action or currency.
+	"""
+	if isinstance(transactions, TransactionBatch) and transactions.assets is None:
+		return (
+			np.asarray(transactions.actions, dtype=np.uint8),
+			np.asarray(transactions.currencies, dtype=np.uint8),
+			np.asarray(transactions.amounts, dtype=np.float64),
+		)
+
+	actions: list[int] = []
+	currencies: list[int] = []
+	amounts: list[float] = []
+
+	try:
+		for wallet_action, currency, amount in transactions:
+			actions.append(WALLET_ACTION_CODES[wallet_action])
+			currencies.append(CURRENCY_CODES[currency])
+			amounts.append(amount)
+
+	except KeyError as e:
+		raise ValueError(f"Unsupported transaction field: {e.args[0]}") from e
+
+	return (
+		np.asarray(actions, dtype=np.uint8),
+		np.asarray(currencies, dtype=np.uint8),
+		np.asarray(amounts, dtype=np.float64),
+	)
+
+
+def replay_batch(
+	actions: ArrayLike,
+	currencies: ArrayLike,
+	amounts: ArrayLike,
+	*,
+	initial_state: Mapping[CurrencyEnum, float] | None = None,
+	block_size: int = DEFAULT_BLOCK_SIZE,
+) -> BatchResult:
+	"""
+	Replays a batch of transactions given as columns.
+
+	Transactions are grouped per currency, since a withdrawal only depends on the balance of its own currency. Each
+	group is walked in blocks: a block is applied with a single prefix sum when none of its withdrawals can fail, and
+	with a plain loop from its first failing withdrawal otherwise. Prefix sums accumulate sequentially, so the result
+	is bit-for-bit identical to feeding the same transactions to `Wallet.process_transaction` in order.
+
+	Args:
+		actions (ArrayLike): The wallet action code of each transaction.
+		currencies (ArrayLike): The currency code of each transaction.
+		amounts (ArrayLike): The amount of each transaction.
+		initial_state (Mapping[CurrencyEnum, float] | None, optional): The balances to start from. Defaults to an empty wallet.
+		block_size (int, optional): The number of same-currency transactions checked per step. Defaults to `DEFAULT_BLOCK_SIZE`.
+
+	Returns:
+		BatchResult: The final balances and the accepted mask.
+
+	Raises:
+		ValueError: If the columns differ in length or contain an unsupported transaction.
+	"""
+	actions = np.asarray(actions)
+	currencies = np.asarray(currencies)
+	amounts = np.asarray(amounts, dtype=np.float64)
+
+	if not len(actions) == len(currencies) == len(amounts):
+		raise ValueError(f"Column lengths differ: {len(actions)}, {len(currencies)}, {len(amounts)}")
+
+	if block_size <= 0:
+		raise ValueError(f"Block size must be positive: {block_size}")
+
+	_validate_codes(actions, len(WALLET_ACTIONS), "wallet action")
+	_validate_codes(currencies, len(CURRENCIES), "currency")
+
+	invalid = np.flatnonzero(amounts <= 0)
+
+	if invalid.size:
+		raise ValueError(f"Amount must be positive: {amounts[invalid[0]]} (transaction {invalid[0]})")
+
+	state: dict[CurrencyEnum, float] = dict(initial_state or {})
+	accepted = np.ones(len(amounts), dtype=np.bool_)
+
+	order = np.argsort(currencies, kind="stable")
+	codes, starts = np.unique(currencies[order], return_index=True)
+	bounds = [*starts.tolist(), len(order)]
+
+	# Visit currencies by first appearance so `state` keeps the insertion order a Wallet would produce.
+	first_seen = [int(order[start]) for start in starts]
+
+	for group in sorted(range(len(codes)), key=first_seen.__getitem__):
+		indices = order[bounds[group] : bounds[group + 1]]
+		currency = CURRENCIES[codes[group]]
+
+		balance, rejected = _replay_currency(
+			actions[indices] == WITHDRAW_CODE,
+			amounts[indices],
+			state.get(currency, 0.0),
+			block_size,
+		)
+
+		state[currency] = balance
+		accepted[indices[rejected]] = False
+
+	return BatchResult(state=state, accepted=accepted)
+
+
+def _validate_codes(codes: NDArray[np.integer], size: int, name: str) -> None:
+	"""
+	Validates that every code indexes one of `size` enum members.
+
+	Args:
+		codes (NDArray[np.integer]): The codes to validate.
+		size (int): The number of supported members.
+		name (str): The name of the field, used in the error message.
+
+	Raises:
+		ValueError: If any code is out of range.
+	"""
+	if not codes.size:
+		return
+
+	if not np.issubdtype(codes.dtype, np.integer):
+		raise ValueError(f"Unsupported {name} codes of type {codes.dtype}")
+
+	invalid = np.flatnonzero((codes < 0) | (codes >= size))
+
+	if invalid.size:
+		raise ValueError(f"Unsupported {name} code: {codes[invalid[0]]} (transaction {invalid[0]})")
+
+
+def _replay_currency(
+	is_withdrawal: NDArray[np.bool_],
+	amounts: NDArray[np.float64],
+	balance: float,
+	block_size: int,
+) -> tuple[float, list[int]]:
+	"""
+	Replays the transactions of a single currency in order.
+
+	Args:
+		is_withdrawal (NDArray[np.bool_]): Whether each transaction is a withdrawal.
+		amounts (NDArray[np.float64]): The amount of each transaction.
+		balance (float): The balance before the first transaction.
+		block_size (int): The number of transactions checked per step.
+
+	Returns:
+		tuple[float, list[int]]: The final balance and the positions of the rejected withdrawals.
+	"""
+	signed = np.where(is_withdrawal, -amounts, amounts)
+	rejected: list[int] = []
+	total = len(amounts)
+	start = 0
+
+	while start < total:
+		stop = min(start + block_size, total)
+
+		# Accumulating from the carried balance keeps the exact addition order of a sequential replay.
+		running = np.cumsum(np.concatenate(([balance], signed[start:stop])))
+		failing = np.flatnonzero(is_withdrawal[start:stop] & (running[:-1] < amounts[start:stop]))
+
+		if not failing.size:
+			balance = float(running[-1])
+			start = stop
+			continue
+
+		first = int(failing[0])
+		balance = float(running[first])
+
+		for offset, (amount, withdrawal) in enumerate(
+			zip(amounts[start + first : stop].tolist(), is_withdrawal[start + first : stop].tolist(), strict=True),
+			start=start + first,
+		):
+			if not withdrawal:
+				balance += amount
+
+			elif balance < amount:
+				rejected.append(offset)
+
+			else:
+				balance -= amount
+
+		start = stop
+
+	return balance, rejected
@@ -0,0 +1,245 @@
+import argparse
+import pathlib
+import shutil
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import overload
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.batch import DEFAULT_BLOCK_SIZE, BatchResult, encode_transactions, replay_batch
+from src.common.enums import CURRENCIES, WALLET_ACTIONS, CurrencyEnum
+from src.common.types import Transaction
+from src.streaming import DEFAULT_CHUNK_SIZE, chunked, iter_transactions
+
+MAGIC = b"HDXLEDGR"
+"""Leading bytes of every binary ledger file."""
+
+VERSION = 1
+"""Version of the binary ledger layout written by this module."""
+
+_HEADER = struct.Struct("<8sIIQ8x")
+"""Magic, version, number of currencies known to the writer, number of transactions, padding to 32 bytes."""
+
+_AMOUNT_DTYPE = np.dtype("<f8")
+_CODE_DTYPE = np.dtype("u1")
+
+
+@dataclass(frozen=True)
+class BinaryLedger:
+	"""
+	A columnar binary ledger, memory-mapped from disk.
+
+	The file holds a 32-byte header followed by three columns: the amounts as little-endian float64, then the wallet
+	action codes and the currency codes as uint8. Every column is a read-only view into the same mapping, so opening
+	a ledger costs a header read regardless of its size and pages are only loaded as they are replayed.
+
+	Attributes:
+		actions (NDArray[np.uint8]): The wallet action code of each transaction.
+		currencies (NDArray[np.uint8]): The currency code of each transaction.
+		amounts (NDArray[np.float64]): The amount of each transaction.
+	"""
+
+	actions: NDArray[np.uint8]
+	currencies: NDArray[np.uint8]
+	amounts: NDArray[np.float64]
+
+	@classmethod
+	def open(cls, path: str | pathlib.Path) -> "BinaryLedger":
+		"""
+		Memory-maps a binary ledger file.
+
+		Args:
+			path (str | pathlib.Path): The file to open.
+
+		Returns:
+			BinaryLedger: The ledger, backed by the file.
+
+		Raises:
+			ValueError: If the file is not a binary ledger or is truncated.
+		"""
+		path = pathlib.Path(path)
+
+		with path.open("rb") as f:
+			header = f.read(_HEADER.size)
+
+		if len(header) < _HEADER.size:
+			raise ValueError(f"Not a binary ledger: {path}")
+
+		magic, version, currency_count, count = _HEADER.unpack(header)
+
+		if magic != MAGIC:
+			raise ValueError(f"Not a binary ledger: {path}")
+
+		if version != VERSION:
+			raise ValueError(f"Unsupported binary ledger version: {version}")
+
+		if currency_count > len(CURRENCIES):
+			raise ValueError(f"Binary ledger was written with {currency_count} currencies, only {len(CURRENCIES)} are supported")
+
+		size = _HEADER.size + count * (_AMOUNT_DTYPE.itemsize + 2 * _CODE_DTYPE.itemsize)
+
+		if path.stat().st_size != size:
+			raise ValueError(f"Binary ledger is truncated or corrupt: expected {size} bytes, found {path.stat().st_size}")
+
+		data = np.memmap(path, dtype=np.uint8, mode="r")
+		amounts_end = _HEADER.size + count * _AMOUNT_DTYPE.itemsize
+
+		return cls(
+			actions=data[amounts_end : amounts_end + count],
+			currencies=data[amounts_end + count :],
+			amounts=data[_HEADER.size : amounts_end].view(_AMOUNT_DTYPE),
+		)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of transactions in the ledger.
+
+		Returns:
+			int: The number of transactions.
+		"""
+		return len(self.amounts)
+
+	@overload
+	def __getitem__(self, index: int) -> Transaction: ...
+
+	@overload
+	def __getitem__(self, index: slice) -> "BinaryLedger": ...
+
+	def __getitem__(self, index: int | slice) -> "Transaction | BinaryLedger":
+		"""
+		Returns a single transaction, or a zero-copy view over a range of the ledger.
+
+		Args:
+			index (int | slice): The position of the transaction, or the range to view.
+
+		Returns:
+			Transaction | BinaryLedger: The transaction, or a ledger sharing the same mapping.
+		"""
+		if isinstance(index, slice):
+			return BinaryLedger(self.actions[index], self.currencies[index], self.amounts[index])
+
+		return Transaction(WALLET_ACTIONS[self.actions[index]], CURRENCIES[self.currencies[index]], float(self.amounts[index]))
+
+	def __iter__(self) -> Iterator[Transaction]:
+		"""
+		Lazily decodes the ledger into transactions, for replay through `Wallet`.
+
+		Yields:
+			Transaction: Each transaction, in ledger order.
+		"""
+		for start in range(0, len(self), DEFAULT_CHUNK_SIZE):
+			stop = start + DEFAULT_CHUNK_SIZE
+
+			for action, currency, amount in zip(
+				self.actions[start:stop].tolist(),
+				self.currencies[start:stop].tolist(),
+				self.amounts[start:stop].tolist(),
+				strict=True,
+			):
+				yield Transaction(WALLET_ACTIONS[action], CURRENCIES[currency], amount)
+
+	def replay(
+		self,
+		*,
+		initial_state: Mapping[CurrencyEnum, float] | None = None,
+		block_size: int = DEFAULT_BLOCK_SIZE,
+	) -> BatchResult:
+		"""
+		Replays the ledger with the batch engine, reading the mapped columns in place.
+
+		Args:
+			initial_state (Mapping[CurrencyEnum, float] | None, optional): The balances to start from. Defaults to an empty wallet.
+			block_size (int, optional): The number of same-currency transactions checked per step. Defaults to `DEFAULT_BLOCK_SIZE`.
+
+		Returns:
+			BatchResult: The final balances and the accepted mask.
+		"""
+		return replay_batch(self.actions, self.currencies, self.amounts, initial_state=initial_state, block_size=block_size)
+
+
+def write_binary_ledger(
+	path: str | pathlib.Path,
+	transactions: Iterable[Transaction],
+	*,
+	chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+	"""
+	Writes transactions to a binary ledger file in a single pass and constant memory.
+
+	Amounts are written straight after the header while the code columns are spooled to temporary files, which are
+	appended once the number of transactions is known.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+		transactions (Iterable[Transaction]): The transactions to write.
+		chunk_size (int, optional): The number of transactions encoded per step. Defaults to `DEFAULT_CHUNK_SIZE`.
+
+	Returns:
+		int: The number of transactions written.
+	"""
+	count = 0
+
+	with (
+		pathlib.Path(path).open("wb") as out,
+		tempfile.TemporaryFile() as actions_spool,
+		tempfile.TemporaryFile() as currencies_spool,
+	):
+		out.write(_HEADER.pack(MAGIC, VERSION, len(CURRENCIES), 0))
+
+		for chunk in chunked(transactions, chunk_size):
+			actions, currencies, amounts = encode_transactions(chunk)
+
+			out.write(amounts.astype(_AMOUNT_DTYPE, copy=False).tobytes())
+			actions_spool.write(actions.tobytes())
+			currencies_spool.write(currencies.tobytes())
+			count += len(chunk)
+
+		for spool in (actions_spool, currencies_spool):
+			spool.seek(0)
+			shutil.copyfileobj(spool, out)
+
+		out.seek(0)
+		out.write(_HEADER.pack(MAGIC, VERSION, len(CURRENCIES), count))
+
+	return count
+
+
+def convert_to_binary_ledger(
+	source: str | pathlib.Path,
+	destination: str | pathlib.Path,
+	*,
+	fmt: str | None = None,
+) -> int:
+	"""
+	Converts a CSV, JSON or NDJSON transactions file into a binary ledger, validating every row on the way.
+
+	Args:
+		source (str | pathlib.Path): The text file to read.
+		destination (str | pathlib.Path): The binary ledger to write.
+		fmt (str | None, optional): The format of the source file. Defaults to detecting it from the file.
+
+	Returns:
+		int: The number of transactions written.
+	"""
+	return write_binary_ledger(destination, iter_transactions(source, fmt))
+
+
+def main() -> None:
+	"""
+	Converts a transactions file into a binary ledger from the command line.
+	"""
+	parser = argparse.ArgumentParser(description="Convert a CSV/JSON/NDJSON transactions file into a binary ledger.")
+	parser.add_argument("source", type=pathlib.Path)
+	parser.add_argument("destination", type=pathlib.Path)
+	parser.add_argument("--format", choices=["csv", "json", "ndjson"], default=None)
+	args = parser.parse_args()
+
+	convert_to_binary_ledger(args.source, args.destination, fmt=args.format)
+
+
+if __name__ == "__main__":
+	main()
@@ -1,33 +1,39 @@
-import csv
-import json
+import argparse
+import os
 import pathlib
 import sys
 import tkinter as tk
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Sequence
 from tkinter import filedialog
 
 from prompt_toolkit.shortcuts import input_dialog, radiolist_dialog, yes_no_dialog
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.panel import Panel
 from rich.table import Table
 
-from src.common.enums import CurrencyEnum, WalletActionEnum
-from src.common.types import Transaction
+from src.asset_wallet import AssetWallet
+from src.common.enums import WalletActionEnum
+from src.common.types import AssetRegistry, Transaction, TransactionBatch
+from src.profiling import PipelineProfiler, Stage
+from src.streaming import load_batch
+from src.summary import LedgerSummary, summarize
 from src.wallet import Wallet
 
 console = Console()
 
+PAGE_SIZE = 20
 
-@dataclass
-class TxRow:
-	action: WalletActionEnum
-	currency: CurrencyEnum
-	amount: float
+ASSETS_FILE_ENV = "WALLET_ASSETS"
 
-	def to_transaction(self) -> Transaction:
-		return Transaction(self.action, self.currency, float(self.amount))
+
+def load_assets() -> AssetRegistry:
+	path = os.environ.get(ASSETS_FILE_ENV)
+
+	return AssetRegistry.load(path) if path else AssetRegistry()
+
+
+profiler = PipelineProfiler()
 
 
 def pick_main_flow() -> str:
@@ -63,8 +69,8 @@ def pick_action() -> WalletActionEnum:
 	return choice
 
 
-def pick_currency() -> CurrencyEnum:
-	values = [(c, c.value) for c in CurrencyEnum]
+def pick_currency(assets: AssetRegistry) -> str:
+	values = [(c, str(c)) for c in assets.symbols]
 
 	choice = radiolist_dialog(
 		title="Choose Currency",
@@ -112,74 +118,38 @@ def confirm_add_another() -> bool:
 
 
 def file_open_dialog() -> str | None:
-	root = tk.Tk()
-	root.withdraw()
-	root.update()
+	with profiler.stage("dialog", interactive=True):
+		root = tk.Tk()
+		root.withdraw()
+		root.update()
 
-	path = filedialog.askopenfilename(
-		title="Select a transactions file",
-		filetypes=[("CSV", "*.csv"), ("JSON", "*.json"), ("All Files", "*.*")],
-	)
+		path = filedialog.askopenfilename(
+			title="Select a transactions file",
+			filetypes=[("CSV", "*.csv"), ("JSON", "*.json"), ("All Files", "*.*")],
+		)
 
-	root.destroy()
+		root.destroy()
 
 	return path or None
 
 
-def parse_csv(path: str) -> list[TxRow]:
-	txs: list[TxRow] = []
-
-	with pathlib.Path(path).open("r", newline="", encoding="utf-8") as f:
-		reader = csv.DictReader(f)
-		required = {"action", "currency", "amount"}
-
-		if not required.issubset({h.lower() for h in reader.fieldnames or []}):
-			raise ValueError("CSV must include headers: action,currency,amount")
-
-		for i, row in enumerate(reader, start=2):
-			try:
-				action = WalletActionEnum[row["action"].strip().upper()]
-				currency = CurrencyEnum[row["currency"].strip().upper()]
-				amount = float(row["amount"])
-
-				if amount <= 0:
-					raise ValueError("Amount must be positive.")
-
-				txs.append(TxRow(action, currency, amount))
+def parse_csv(path: str, assets: AssetRegistry | None = None) -> TransactionBatch:
+	with profiler.stage("parse_csv") as stage:
+		batch = load_batch(path, "csv", assets=assets)
+		stage.rows = len(batch)
 
-			except Exception as e:
-				raise ValueError(f"Invalid row {i}: {e}") from e
+	return batch
 
-	return txs
-
-
-def parse_json(path: str) -> list[TxRow]:
-	with pathlib.Path(path).open("r", encoding="utf-8") as f:
-		data = json.load(f)
 
-	if not isinstance(data, list):
-		raise TypeError("JSON must be a list of transactions.")
+def parse_json(path: str, assets: AssetRegistry | None = None) -> TransactionBatch:
+	with profiler.stage("parse_json") as stage:
+		batch = load_batch(path, "json", assets=assets)
+		stage.rows = len(batch)
 
-	txs: list[TxRow] = []
-
-	for i, item in enumerate(data, start=1):
-		try:
-			action = WalletActionEnum[str(item["action"]).strip().upper()]
-			currency = CurrencyEnum[str(item["currency"]).strip().upper()]
-			amount = float(item["amount"])
+	return batch
 
-			if amount <= 0:
-				raise ValueError("Amount must be positive.")
 
-			txs.append(TxRow(action, currency, amount))
-
-		except Exception as e:
-			raise ValueError(f"Invalid item at index {i}: {e}") from e
-
-	return txs
-
-
-def load_from_file_flow() -> list[TxRow]:
+def load_from_file_flow(assets: AssetRegistry) -> TransactionBatch:
 	path = file_open_dialog()
 
 	if not path:
@@ -191,51 +161,86 @@ def load_from_file_flow() -> list[TxRow]:
 
 	try:
 		if ext == ".csv":
-			return parse_csv(path)
+			return parse_csv(path, assets)
 
 		if ext == ".json":
-			return parse_json(path)
+			return parse_json(path, assets)
 
 		with pathlib.Path(path).open("r", encoding="utf-8") as f:
 			head = f.read(1)
 			f.seek(0)
 
 			if head == "[":
-				return parse_json(path)
+				return parse_json(path, assets)
 
-			return parse_csv(path)
+			return parse_csv(path, assets)
 
 	except Exception as e:
 		console.print(f"[red]Failed to parse '{path}': {e}[/red]")
 		sys.exit(1)
 
 
-def manual_input_flow() -> list[TxRow]:
-	txs: list[TxRow] = []
+def manual_input_flow(assets: AssetRegistry) -> TransactionBatch:
+	txs = TransactionBatch(assets=assets)
 
-	while True:
-		action = pick_action()
-		currency = pick_currency()
-		amount = prompt_amount()
+	with profiler.stage("input", interactive=True) as stage:
+		while True:
+			action = pick_action()
+			currency = pick_currency(assets)
+			amount = prompt_amount()
 
-		txs.append(TxRow(action, currency, amount))
+			txs.append(Transaction(action, currency, amount))
 
-		if not confirm_add_another():
-			break
+			if not confirm_add_another():
+				break
+
+		stage.rows = len(txs)
 
 	return txs
 
 
-def render_summary(transactions: Iterable[TxRow], wallet: Wallet) -> None:
-	t = Table(title="Transactions", box=box.SIMPLE_HEAVY)
+def confirm_next_page() -> bool:
+	res = yes_no_dialog(
+		title="More Transactions",
+		text=f"Show the next {PAGE_SIZE} transactions?",
+		yes_text="Yes",
+		no_text="No",
+	).run()
+
+	return bool(res)
+
+
+def render_summary(summary: LedgerSummary, wallet: Wallet) -> None:
+	t = Table(title=f"Transactions ({summary.count})", box=box.SIMPLE_HEAVY)
 
-	t.add_column("#", justify="right", style="cyan", no_wrap=True)
 	t.add_column("Action", style="magenta")
 	t.add_column("Currency", style="green")
-	t.add_column("Amount", justify="right")
+	t.add_column("Count", justify="right", style="cyan")
+	t.add_column("Total", justify="right")
+
+	for (action, currency), count in summary.counts.items():
+		t.add_row(action.value, str(currency), str(count), f"{summary.totals[action, currency]:g}")
+
+	r = Table(title="Rejected Withdrawals", box=box.SIMPLE_HEAVY)
 
-	for i, tx in enumerate(transactions, start=1):
-		t.add_row(str(i), tx.action.value, tx.currency.value, f"{tx.amount:g}")
+	r.add_column("Currency", style="green")
+	r.add_column("Count", justify="right", style="cyan")
+	r.add_column("Total", justify="right")
+
+	for ccy, count in summary.rejected.items():
+		r.add_row(str(ccy), str(count), f"{summary.rejected_totals[ccy]:g}")
+
+	top = Table(title=f"Largest Transactions (top {summary.top_n} per currency)", box=box.SIMPLE_HEAVY)
+
+	top.add_column("#", justify="right", style="cyan", no_wrap=True)
+	top.add_column("Currency", style="green")
+	top.add_column("Action", style="magenta")
+	top.add_column("Amount", justify="right")
+	top.add_column("Status")
+
+	for ccy in wallet.balance:
+		for tx in summary.largest(ccy):
+			top.add_row(str(tx.index + 1), str(ccy), tx.wallet_action.value, f"{tx.amount:g}", "applied" if tx.accepted else "[red]rejected[/red]")
 
 	b = Table(title="Wallet Balances", box=box.SIMPLE_HEAVY)
 
@@ -243,29 +248,104 @@ def render_summary(transactions: Iterable[TxRow], wallet: Wallet) -> None:
 	b.add_column("Balance", justify="right", style="bold")
 
 	for ccy, amt in wallet.balance.items():
-		name = getattr(ccy, "value", str(ccy))
-		b.add_row(name, f"{amt:g}")
+		b.add_row(str(ccy), f"{amt:g}")
 
-	console.print(Panel.fit(t, title="[bold]Review[/bold]", border_style="blue"))
+	console.print(Panel.fit(Group(t, r, top), title="[bold]Review[/bold]", border_style="blue"))
 	console.print(Panel.fit(b, title="[bold]Result[/bold]", border_style="green"))
 
 
-def main() -> None:
-	console.print("[bold blue]Welcome to Hedix Crypto Wallet CLI![/bold blue]")
-	flow = pick_main_flow()
+def render_page(transactions: Sequence[Transaction], start: int, size: int = PAGE_SIZE) -> Table:
+	stop = min(start + size, len(transactions))
+	t = Table(title=f"Transactions {start + 1}-{stop} of {len(transactions)}", box=box.SIMPLE_HEAVY)
+
+	t.add_column("#", justify="right", style="cyan", no_wrap=True)
+	t.add_column("Action", style="magenta")
+	t.add_column("Currency", style="green")
+	t.add_column("Amount", justify="right")
+
+	# Only the requested window is decoded and rendered, whatever the size of the ledger.
+	for i, tx in enumerate(transactions[start:stop], start=start + 1):
+		t.add_row(str(i), tx.wallet_action.value, str(tx.currency), f"{tx.amount:g}")
+
+	return t
+
+
+def browse_transactions(transactions: Sequence[Transaction]) -> None:
+	for start in range(0, len(transactions), PAGE_SIZE):
+		console.print(render_page(transactions, start))
+
+		if start + PAGE_SIZE >= len(transactions) or not confirm_next_page():
+			break
+
+
+def render_profile(stages: Sequence[Stage]) -> Table:
+	t = Table(title="Profile", box=box.SIMPLE_HEAVY)
 
-	tx_rows = load_from_file_flow() if flow == "file" else manual_input_flow()
+	t.add_column("Stage", style="magenta")
+	t.add_column("Rows", justify="right", style="cyan")
+	t.add_column("Wall (s)", justify="right")
+	t.add_column("CPU (s)", justify="right")
+	t.add_column("Rows/s", justify="right")
+	t.add_column("Peak memory", justify="right")
 
-	txs = [row.to_transaction() for row in tx_rows]
+	for stage in stages:
+		memory = "-" if stage.peak_memory_bytes is None else f"{stage.peak_memory_bytes / 2**20:.1f} MiB"
+		name = f"{stage.name} (interactive)" if stage.interactive else stage.name
+		t.add_row(name, str(stage.rows), f"{stage.wall_seconds:.4f}", f"{stage.cpu_seconds:.4f}", f"{stage.rows_per_second:,.0f}", memory)
+
+	return t
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+	parser = argparse.ArgumentParser(description="Interactive Hedix crypto wallet.")
+	parser.add_argument("--profile", action="store_true", help="Report the wall time, CPU time and throughput of each stage.")
+	parser.add_argument("--profile-memory", action="store_true", help="Also trace the peak memory of each stage, which slows them down.")
+	parser.add_argument("--profile-output", type=pathlib.Path, default=None, help="Also dump cProfile statistics of the stages to this file.")
+	return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+	args = parse_args(argv)
+	profiler.enabled = args.profile or args.profile_memory or args.profile_output is not None
+	profiler.memory = args.profile_memory
+	profiler.output = args.profile_output
 
 	try:
-		wallet = Wallet(transaction_list=txs)
+		assets = load_assets()
 
-	except Exception as e:
-		console.print(f"[red]Failed to create wallet: {e}[/red]")
+	except (OSError, ValueError) as e:
+		console.print(f"[red]Failed to load the assets listed in ${ASSETS_FILE_ENV}: {e}[/red]")
 		sys.exit(1)
 
-	render_summary(tx_rows, wallet)
+	console.print("[bold blue]Welcome to Hedix Crypto Wallet CLI![/bold blue]")
+
+	# The stages measured so far are reported even when a failure exits early.
+	try:
+		flow = pick_main_flow()
+		tx_rows = load_from_file_flow(assets) if flow == "file" else manual_input_flow(assets)
+
+		try:
+			with profiler.stage("replay", rows=len(tx_rows)):
+				wallet = AssetWallet(transaction_list=(), assets=assets)
+				# Both the parsers and the manual prompts validate each transaction, so the replay skips the checks.
+				summary = summarize(tx_rows, wallet, validated=True)
+
+		except Exception as e:
+			console.print(f"[red]Failed to create wallet: {e}[/red]")
+			sys.exit(1)
+
+		with profiler.stage("render", rows=summary.count):
+			render_summary(summary, wallet)
+
+	finally:
+		if profiler.enabled:
+			profiler.finish()
+			console.print(render_profile(profiler.stages))
+
+			if profiler.output is not None:
+				console.print(f"[green]cProfile statistics written to {profiler.output}[/green]")
+
+	browse_transactions(tx_rows)
 
 
 if __name__ == "__main__":
@@ -1,2 +1,2 @@
-from .currency import CurrencyEnum
-from .wallet_action import WalletActionEnum
+from .currency import CURRENCIES, CURRENCY_CODES, CurrencyEnum
+from .wallet_action import WALLET_ACTION_CODES, WALLET_ACTIONS, WalletActionEnum
@@ -7,3 +7,10 @@ class CurrencyEnum(StrEnum):
 	USD = "USD"
 	BTC = "BTC"
 	ETH = "ETH"
+
+
+CURRENCIES: tuple[CurrencyEnum, ...] = tuple(CurrencyEnum)
+"""Supported currencies indexed by their integer code."""
+
+CURRENCY_CODES: dict[CurrencyEnum, int] = {currency: code for code, currency in enumerate(CURRENCIES)}
+"""Integer code of each supported currency, used by the columnar replay paths."""
@@ -6,3 +6,10 @@ class WalletActionEnum(StrEnum):
 
 	DEPOSIT = "DEPOSIT"
 	WITHDRAW = "WITHDRAW"
+
+
+WALLET_ACTIONS: tuple[WalletActionEnum, ...] = tuple(WalletActionEnum)
+"""Supported wallet actions indexed by their integer code."""
+
+WALLET_ACTION_CODES: dict[WalletActionEnum, int] = {action: code for code, action in enumerate(WALLET_ACTIONS)}
+"""Integer code of each supported wallet action, used by the columnar replay paths."""
@@ -1 +1,4 @@
-from .transaction import Transaction
\ No newline at end of file
+from .account_transaction import AccountTransaction
+from .asset_registry import AssetRegistry
+from .transaction import Transaction
+from .transaction_batch import TransactionBatch
\ No newline at end of file
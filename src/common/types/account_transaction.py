@@ -0,0 +1,20 @@
+from typing import NamedTuple
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+
+
+class AccountTransaction(NamedTuple):
+	"""
+	Represents a transaction tagged with the account whose wallet it applies to.
+
+	Attributes:
+		account_id (str): The account the transaction belongs to.
+		wallet_action (WalletActionEnum): The action performed in the transaction.
+		currency (CurrencyEnum): The currency involved in the transaction.
+		amount (float): The amount involved in the transaction.
+	"""
+
+	account_id: str
+	wallet_action: WalletActionEnum
+	currency: CurrencyEnum
+	amount: float
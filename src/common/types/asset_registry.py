@@ -0,0 +1,177 @@
+import pathlib
+from dataclasses import dataclass, field
+from typing import Self
+
+from src.common.enums import CURRENCIES, WalletActionEnum
+
+from .transaction import Transaction
+
+MAX_ASSETS = 1 << 16
+"""Number of assets a registry can hold, the range of the currency column of a `TransactionBatch`."""
+
+
+@dataclass
+class AssetRegistry:
+	"""
+	The assets a wallet can hold, each interned to a small dense integer ID.
+
+	A registry always starts with the built-in currencies, in `CURRENCIES` order, so their IDs are their usual
+	`CURRENCY_CODES` and they keep resolving to `CurrencyEnum` members. Further assets are plain uppercase strings,
+	interned at runtime or loaded from a file with `load`.
+
+	Resolving a symbol costs one dictionary lookup: every spelling seen so far, such as `" btc"` or a `CurrencyEnum`
+	member, is cached next to the canonical symbols.
+
+	Attributes:
+		symbols (list[str]): The canonical symbol of each asset, indexed by ID.
+	"""
+
+	symbols: list[str] = field(default_factory=lambda: list(CURRENCIES))
+	_ids: dict[str, int] = field(init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		"""
+		Indexes the initial symbols.
+
+		Raises:
+			ValueError: If a symbol is repeated or not in canonical form.
+		"""
+		self._ids = {symbol: asset for asset, symbol in enumerate(self.symbols)}
+
+		if len(self._ids) != len(self.symbols):
+			raise ValueError("Asset symbols must be unique")
+
+		for symbol in self.symbols:
+			if self.normalize(symbol) != symbol:
+				raise ValueError(f"Asset symbol is not in canonical form: {symbol!r}")
+
+	@classmethod
+	def load(cls, path: str | pathlib.Path) -> Self:
+		"""
+		Builds a registry from a text file listing one symbol per line, after the built-in currencies.
+
+		Blank lines and lines starting with `#` are skipped, and symbols already registered keep their ID.
+
+		Args:
+			path (str | pathlib.Path): The file to read.
+
+		Returns:
+			Self: The registry.
+		"""
+		registry = cls()
+
+		with pathlib.Path(path).open(encoding="utf-8") as file:
+			for line in file:
+				if (symbol := line.strip()) and not symbol.startswith("#"):
+					registry.intern(symbol)
+
+		return registry
+
+	@staticmethod
+	def normalize(symbol: str) -> str:
+		"""
+		Returns the canonical spelling of a symbol.
+
+		Args:
+			symbol (str): The symbol, case-insensitive and possibly padded with whitespace.
+
+		Returns:
+			str: The uppercase symbol, without surrounding whitespace.
+		"""
+		return str(symbol).strip().upper()
+
+	def intern(self, symbol: str) -> int:
+		"""
+		Returns the ID of a symbol, registering it first if needed.
+
+		Args:
+			symbol (str): The symbol, case-insensitive.
+
+		Returns:
+			int: The asset ID.
+
+		Raises:
+			ValueError: If the symbol is empty or contains whitespace, or if the registry is full.
+		"""
+		canonical = self.normalize(symbol)
+
+		if (asset := self._ids.get(canonical)) is not None:
+			return asset
+
+		if not canonical or len(canonical.split()) != 1:
+			raise ValueError(f"Invalid asset symbol: {symbol!r}")
+
+		if len(self.symbols) >= MAX_ASSETS:
+			raise ValueError(f"Asset registry is full ({MAX_ASSETS} assets)")
+
+		self._ids[canonical] = asset = len(self.symbols)
+		self.symbols.append(canonical)
+		return asset
+
+	def resolve(self, symbol: str) -> int:
+		"""
+		Returns the ID of a registered symbol.
+
+		Args:
+			symbol (str): The symbol, in any spelling.
+
+		Returns:
+			int: The asset ID.
+
+		Raises:
+			KeyError: If the symbol is not registered.
+		"""
+		if (asset := self._ids.get(symbol)) is not None:
+			return asset
+
+		if (asset := self._ids.get(self.normalize(symbol))) is None:
+			raise KeyError(symbol)
+
+		# Only spellings of registered symbols are cached, so the cache grows with the spellings in use, not the input.
+		self._ids[symbol] = asset
+		return asset
+
+	def parse_transaction(self, action: str, currency: str, amount: str | float) -> Transaction:
+		"""
+		Parses and validates the raw fields of a single transaction, like `streaming.parse_transaction`.
+
+		Args:
+			action (str): The wallet action name, case-insensitive.
+			currency (str): A registered symbol, case-insensitive.
+			amount (str | float): The amount, as a number or numeric string.
+
+		Returns:
+			Transaction: The parsed transaction, with the canonical symbol of its asset.
+
+		Raises:
+			ValueError: If the amount is not positive.
+		"""
+		wallet_action = WalletActionEnum[str(action).strip().upper()]
+		symbol = self.symbols[self.resolve(currency)]
+		amount = float(amount)
+
+		if amount <= 0:
+			raise ValueError("Amount must be positive.")
+
+		return Transaction(wallet_action, symbol, amount)
+
+	def __contains__(self, symbol: object) -> bool:
+		"""
+		Tells whether a symbol is registered.
+
+		Args:
+			symbol (object): The symbol, in any spelling.
+
+		Returns:
+			bool: Whether the symbol resolves to an asset.
+		"""
+		return isinstance(symbol, str) and (symbol in self._ids or self.normalize(symbol) in self._ids)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of registered assets.
+
+		Returns:
+			int: The number of assets, one more than the largest ID.
+		"""
+		return len(self.symbols)
@@ -0,0 +1,162 @@
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Self, overload
+
+from src.common.enums import CURRENCIES, CURRENCY_CODES, WALLET_ACTION_CODES, WALLET_ACTIONS
+
+from .asset_registry import AssetRegistry
+from .transaction import Transaction
+
+
+@dataclass
+class TransactionBatch:
+	"""
+	An ordered collection of transactions stored as three typed columns, about 11 bytes per transaction.
+
+	Transactions are encoded on the way in and decoded one at a time on the way out, so a batch can stand in for a
+	list of transactions anywhere an iterable or a sequence is expected, including `Wallet` and `batch.replay_batch`.
+
+	A batch bound to an `AssetRegistry` encodes currencies as its asset IDs, so it can hold any registered asset; it is meant for
+	`AssetWallet`, since the columnar replay paths only know the built-in currencies.
+
+	Attributes:
+		actions (array): The wallet action code of each transaction, indexing `WALLET_ACTIONS` (typecode "B").
+		currencies (array): The currency code of each transaction, indexing `CURRENCIES` or the registry (typecode "H").
+		amounts (array): The amount of each transaction (typecode "d").
+		assets (AssetRegistry | None): The registry of the asset IDs, if any. Defaults to None, for the built-in currencies.
+	"""
+
+	actions: array = field(default_factory=lambda: array("B"))
+	currencies: array = field(default_factory=lambda: array("H"))
+	amounts: array = field(default_factory=lambda: array("d"))
+	assets: AssetRegistry | None = None
+
+	@classmethod
+	def from_transactions(cls, transactions: Iterable[Transaction], *, assets: AssetRegistry | None = None) -> Self:
+		"""
+		Encodes transactions into a new batch, without holding them all as objects at once.
+
+		Args:
+			transactions (Iterable[Transaction]): The transactions to encode.
+			assets (AssetRegistry | None, optional): The registry to encode assets with. Defaults to the built-in currencies.
+
+		Returns:
+			Self: The batch.
+		"""
+		batch = cls(assets=assets)
+		batch.extend(transactions)
+		return batch
+
+	def append(self, transaction: Transaction) -> None:
+		"""
+		Encodes and appends one transaction.
+
+		Args:
+			transaction (Transaction): The transaction to append.
+
+		Raises:
+			ValueError: If the transaction has an unsupported action or currency.
+		"""
+		wallet_action, currency, amount = transaction
+
+		try:
+			action_code = WALLET_ACTION_CODES[wallet_action]
+			currency_code = CURRENCY_CODES[currency] if self.assets is None else self.assets.resolve(currency)
+
+		except KeyError as e:
+			raise ValueError(f"Unsupported transaction field: {e.args[0]}") from e
+
+		self.actions.append(action_code)
+		self.currencies.append(currency_code)
+		self.amounts.append(amount)
+
+	def extend(self, transactions: Iterable[Transaction]) -> None:
+		"""
+		Encodes and appends transactions. Another batch with the same registry is appended column by column, without decoding.
+
+		Args:
+			transactions (Iterable[Transaction]): The transactions to append.
+		"""
+		if isinstance(transactions, TransactionBatch) and transactions.assets is self.assets:
+			self.actions.extend(transactions.actions)
+			self.currencies.extend(transactions.currencies)
+			self.amounts.extend(transactions.amounts)
+			return
+
+		append = self.append
+
+		for transaction in transactions:
+			append(transaction)
+
+	@property
+	def _symbols(self) -> Sequence[str]:
+		"""
+		The currency or asset of each code stored in the batch.
+
+		Returns:
+			Sequence[str]: `CURRENCIES`, or the symbols of the registry.
+		"""
+		return CURRENCIES if self.assets is None else self.assets.symbols
+
+	@property
+	def columns(self) -> tuple[array, array, array]:
+		"""
+		The action codes, currency codes and amounts, as accepted by `batch.replay_batch` without copying.
+
+		Returns:
+			tuple[array, array, array]: The three columns.
+		"""
+		return self.actions, self.currencies, self.amounts
+
+	@property
+	def nbytes(self) -> int:
+		"""
+		The memory used by the columns' items.
+
+		Returns:
+			int: The size of the three columns, in bytes.
+		"""
+		return sum(len(column) * column.itemsize for column in self.columns)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of transactions in the batch.
+
+		Returns:
+			int: The number of transactions.
+		"""
+		return len(self.amounts)
+
+	@overload
+	def __getitem__(self, key: int) -> Transaction: ...
+
+	@overload
+	def __getitem__(self, key: slice) -> Self: ...
+
+	def __getitem__(self, key: int | slice) -> Transaction | Self:
+		"""
+		Decodes one transaction, or copies a range of the batch into a new batch.
+
+		Args:
+			key (int | slice): The position of a transaction, or a slice of positions.
+
+		Returns:
+			Transaction | Self: The transaction, or the batch holding the selected transactions.
+		"""
+		if isinstance(key, slice):
+			return type(self)(self.actions[key], self.currencies[key], self.amounts[key], self.assets)
+
+		return Transaction(WALLET_ACTIONS[self.actions[key]], self._symbols[self.currencies[key]], self.amounts[key])
+
+	def __iter__(self) -> Iterator[Transaction]:
+		"""
+		Decodes the transactions lazily, in order.
+
+		Yields:
+			Transaction: Each transaction.
+		"""
+		actions, currencies = WALLET_ACTIONS, self._symbols
+
+		for action, currency, amount in zip(self.actions, self.currencies, self.amounts, strict=True):
+			yield Transaction(actions[action], currencies[currency], amount)
@@ -0,0 +1,119 @@
+import threading
+from dataclasses import dataclass, field
+from warnings import warn
+
+from src.common.enums import CURRENCIES, CurrencyEnum, WalletActionEnum
+from src.wallet import Wallet
+
+
+@dataclass
+class ConcurrentWallet(Wallet):
+	"""
+	A wallet that many threads can submit transactions to at once.
+
+	Each currency has its own lock and its own transaction count, so a withdrawal checks the balance and subtracts from
+	it atomically, and transactions on different currencies share no lock or counter. `transaction_count` sums the
+	per-currency counts when read, and a separate lock is only taken to record a rejected withdrawal.
+
+	Ordering guarantee: transactions on the same currency are applied one at a time, in the order they acquire its
+	lock, and are numbered in that order within their currency; the index of a rejection is that per-currency number,
+	counted from the wallet's creation. There is no order across currencies: they commute, so at any moment the
+	balances are those of a serial replay of each currency's transactions in their own order. Transactions submitted
+	by a single thread are processed in submission order.
+
+	Metrics and balance history record every transaction from whichever thread processes it without
+	synchronization, so they are not supported.
+
+	Raises:
+		ValueError: If metrics or a balance history are requested.
+	"""
+
+	_locks: dict[CurrencyEnum, threading.Lock] = field(init=False, repr=False, compare=False)
+	_counts: dict[CurrencyEnum, list[int]] = field(init=False, repr=False, compare=False)
+	_offset: int = field(init=False, repr=False, compare=False)
+	_rejections_lock: threading.Lock = field(init=False, repr=False, compare=False)
+
+	def __post_init__(self) -> None:
+		"""
+		Creates the locks, then initializes the wallet by processing the transaction list.
+
+		Raises:
+			ValueError: If metrics or a balance history are requested.
+		"""
+		if self.metrics is not None or self.history is not None:
+			raise ValueError("Concurrent wallets do not support metrics or balance history")
+
+		self._locks = {currency: threading.Lock() for currency in CURRENCIES}
+		self._rejections_lock = threading.Lock()
+		super().__post_init__()
+
+	@property
+	def transaction_count(self) -> int:
+		"""
+		The number of transactions processed so far, including skipped withdrawals.
+
+		Returns:
+			int: The initial count plus the per-currency counts, which other threads may be increasing meanwhile.
+		"""
+		return self._offset + sum(count for (count,) in self._counts.values())
+
+	@transaction_count.setter
+	def transaction_count(self, count: int) -> None:
+		"""
+		Restarts the per-currency counts from a total.
+
+		Args:
+			count (int): The number of transactions already processed.
+		"""
+		# Each counter is a one-item list, so increments only write to an object private to their currency.
+		self._counts = {currency: [0] for currency in CURRENCIES}
+		self._offset = count
+
+	def _apply(
+		self,
+		wallet_action: WalletActionEnum,
+		currency: CurrencyEnum,
+		amount: float,
+		*,
+		verbose: bool | None = None,
+	) -> bool:
+		"""
+		Applies a transaction that is already known to be valid, holding the lock of its currency.
+
+		Args:
+			wallet_action (WalletActionEnum): The action to perform.
+			currency (CurrencyEnum): The currency to transact.
+			amount (float): The amount to transact.
+			verbose (bool | None, optional): Whether to print warnings. Defaults to the wallet's `verbose`.
+
+		Returns:
+			bool: Whether the transaction was successful.
+		"""
+		counter = self._counts[currency]
+
+		with self._locks[currency]:
+			balance = self.state[currency]
+			index = counter[0]
+			counter[0] = index + 1
+
+			if wallet_action == WalletActionEnum.DEPOSIT:
+				self.state[currency] = balance + amount
+				accepted = True
+
+			elif wallet_action == WalletActionEnum.WITHDRAW and balance >= amount:
+				self.state[currency] = balance - amount
+				accepted = True
+
+			else:
+				accepted = False
+
+		if accepted or wallet_action != WalletActionEnum.WITHDRAW:
+			return accepted
+
+		with self._rejections_lock:
+			self.rejections.record(index, currency, amount, balance)
+
+		if verbose or (verbose is None and self.verbose):
+			warn(f"Insufficient funds for withdrawal: {amount} {currency}, transaction skipped.", stacklevel=1)
+
+		return accepted
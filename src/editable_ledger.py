@@ -0,0 +1,316 @@
+from array import array
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Self
+
+from src.common.enums import CURRENCIES, CURRENCY_CODES, WALLET_ACTION_CODES, WALLET_ACTIONS, CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.rejections import RejectionLog
+from src.validation import find_invalid_rows, validate_transactions
+from src.wallet import Wallet
+
+_DEPOSIT = WALLET_ACTION_CODES[WalletActionEnum.DEPOSIT]
+
+
+@dataclass
+class EditableLedger:
+	"""
+	A ledger whose past transactions can be inserted, updated or deleted without replaying it from the start.
+
+	Alongside each transaction, the ledger stores the balance of its currency right after it and whether it was
+	accepted, so every transaction is a checkpoint for its currency. Currencies never affect each other, so an edit at
+	index `i` only recomputes the edited currency: it resumes from that currency's last transaction before `i`, and
+	walks the currency's later transactions until one ends with the same balance and the same decision as before. From
+	there on, the previous outcomes still hold, so an edit costs the transactions it actually changed, not the length
+	of the ledger. Each edit returns how many transactions it recomputed.
+
+	Recomputed balances are bit for bit those of a full `Wallet` replay, since they add the same floats in the same order.
+	"""
+
+	_actions: bytearray = field(default_factory=bytearray, repr=False)
+	_currencies: bytearray = field(default_factory=bytearray, repr=False)
+	_amounts: array = field(default_factory=lambda: array("d"), repr=False)
+	_balances: array = field(default_factory=lambda: array("d"), repr=False)
+	_accepted: bytearray = field(default_factory=bytearray, repr=False)
+	_final: dict[int, float] = field(default_factory=dict, repr=False)
+
+	@classmethod
+	def from_transactions(cls, transactions: Iterable[Transaction]) -> Self:
+		"""
+		Builds a ledger by replaying transactions once.
+
+		Args:
+			transactions (Iterable[Transaction]): The transactions, in order.
+
+		Returns:
+			Self: The ledger.
+		"""
+		ledger = cls()
+
+		for transaction in validate_transactions(transactions):
+			ledger._insert(len(ledger), transaction)
+
+		return ledger
+
+	def insert(self, index: int, transaction: Transaction) -> int:
+		"""
+		Inserts a transaction before the given index, such as a missed deposit.
+
+		Args:
+			index (int): The position of the new transaction, `len(self)` to append.
+			transaction (Transaction): The transaction to insert.
+
+		Returns:
+			int: The number of transactions recomputed.
+
+		Raises:
+			IndexError: If the index is outside the ledger.
+		"""
+		if not 0 <= index <= len(self):
+			raise IndexError(f"Insertion index {index} is outside the ledger [0, {len(self)}]")
+
+		self._validate(index, transaction)
+		return self._insert(index, transaction)
+
+	def append(self, transaction: Transaction) -> int:
+		"""
+		Appends a transaction.
+
+		Args:
+			transaction (Transaction): The transaction to append.
+
+		Returns:
+			int: The number of transactions recomputed, always 1.
+		"""
+		return self.insert(len(self), transaction)
+
+	def update(self, index: int, transaction: Transaction) -> int:
+		"""
+		Replaces a transaction, such as to amend its amount.
+
+		Args:
+			index (int): The position of the transaction.
+			transaction (Transaction): The corrected transaction.
+
+		Returns:
+			int: The number of transactions recomputed.
+		"""
+		self._check_index(index)
+		self._validate(index, transaction)
+		wallet_action, currency, amount = transaction
+		previous, code = self._currencies[index], CURRENCY_CODES[currency]
+
+		self._actions[index] = WALLET_ACTION_CODES[wallet_action]
+		self._currencies[index] = code
+		self._amounts[index] = amount
+		recomputed = self._recompute(code, index, force=True)
+
+		# Moving a transaction to another currency also changes the currency it left.
+		if previous != code:
+			recomputed += self._recompute(previous, index + 1)
+
+		return recomputed
+
+	def delete(self, index: int) -> int:
+		"""
+		Removes a transaction, such as a duplicate.
+
+		Args:
+			index (int): The position of the transaction.
+
+		Returns:
+			int: The number of transactions recomputed.
+		"""
+		self._check_index(index)
+		code = self._currencies[index]
+
+		for column in (self._actions, self._currencies, self._amounts, self._balances, self._accepted):
+			del column[index]
+
+		return self._recompute(code, index)
+
+	def _insert(self, index: int, transaction: Transaction) -> int:
+		"""
+		Inserts a transaction already known to be valid.
+
+		Args:
+			index (int): The position of the new transaction.
+			transaction (Transaction): The transaction to insert.
+
+		Returns:
+			int: The number of transactions recomputed.
+		"""
+		wallet_action, currency, amount = transaction
+		code = CURRENCY_CODES[currency]
+
+		self._actions.insert(index, WALLET_ACTION_CODES[wallet_action])
+		self._currencies.insert(index, code)
+		self._amounts.insert(index, amount)
+		self._balances.insert(index, 0.0)
+		self._accepted.insert(index, 0)
+		return self._recompute(code, index, force=True)
+
+	def _recompute(self, code: int, start: int, *, force: bool = False) -> int:
+		"""
+		Replays one currency from `start` until its outcomes match the previous ones again.
+
+		Args:
+			code (int): The currency code.
+			start (int): The first position that may have changed.
+			force (bool, optional): Whether the transaction at `start` is new or edited, so its previous outcome cannot
+				be trusted. Defaults to False.
+
+		Returns:
+			int: The number of transactions recomputed.
+		"""
+		actions, currencies, amounts, balances, accepted = self._actions, self._currencies, self._amounts, self._balances, self._accepted
+		before = currencies.rfind(code, 0, start)
+		balance = balances[before] if before != -1 else 0.0
+		position = currencies.find(code, start)
+		recomputed = 0
+
+		while position != -1:
+			amount = amounts[position]
+
+			if actions[position] == _DEPOSIT:
+				balance += amount
+				ok = True
+
+			elif balance < amount:
+				ok = False
+
+			else:
+				balance -= amount
+				ok = True
+
+			if balances[position] == balance and accepted[position] == ok and not (force and position == start):
+				return recomputed
+
+			balances[position] = balance
+			accepted[position] = ok
+			recomputed += 1
+			position = currencies.find(code, position + 1)
+
+		# The walk reached the end of the ledger, so the currency's final balance changed, or it has no transactions left.
+		if before == -1 and not recomputed:
+			self._final.pop(code, None)
+
+		else:
+			self._final[code] = balance
+
+		return recomputed
+
+	def _check_index(self, index: int) -> None:
+		"""
+		Checks that an index points to a transaction.
+
+		Args:
+			index (int): The position to check.
+
+		Raises:
+			IndexError: If the index is outside the ledger.
+		"""
+		if not 0 <= index < len(self):
+			raise IndexError(f"Transaction index {index} is outside the ledger [0, {len(self)})")
+
+	@staticmethod
+	def _validate(index: int, transaction: Transaction) -> None:
+		"""
+		Checks a transaction with the same rules as `Wallet`.
+
+		Args:
+			index (int): The position of the transaction, for the error message.
+			transaction (Transaction): The transaction to check.
+
+		Raises:
+			ValueError: If the transaction is not supported.
+		"""
+		for _, reason in find_invalid_rows([transaction]):
+			raise ValueError(f"Invalid transaction at index {index}: {reason}")
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of transactions in the ledger.
+
+		Returns:
+			int: The number of transactions.
+		"""
+		return len(self._amounts)
+
+	def __getitem__(self, index: int) -> Transaction:
+		"""
+		Returns the transaction at the given position.
+
+		Args:
+			index (int): The position of the transaction.
+
+		Returns:
+			Transaction: The transaction.
+		"""
+		self._check_index(index)
+		return Transaction(WALLET_ACTIONS[self._actions[index]], CURRENCIES[self._currencies[index]], self._amounts[index])
+
+	def __iter__(self) -> Iterator[Transaction]:
+		"""
+		Iterates over the transactions in order.
+
+		Yields:
+			Transaction: Each transaction.
+		"""
+		for action, currency, amount in zip(self._actions, self._currencies, self._amounts, strict=True):
+			yield Transaction(WALLET_ACTIONS[action], CURRENCIES[currency], amount)
+
+	def accepted(self, index: int) -> bool:
+		"""
+		Tells whether a transaction was applied or skipped for insufficient funds.
+
+		Args:
+			index (int): The position of the transaction.
+
+		Returns:
+			bool: Whether the transaction was applied.
+		"""
+		self._check_index(index)
+		return bool(self._accepted[index])
+
+	def rejected(self) -> list[int]:
+		"""
+		Lists the transactions skipped for insufficient funds.
+
+		Returns:
+			list[int]: The positions of the rejected transactions, in ascending order.
+		"""
+		mask, positions = self._accepted, []
+		position = mask.find(0)
+
+		while position != -1:
+			positions.append(position)
+			position = mask.find(0, position + 1)
+
+		return positions
+
+	@property
+	def balance(self) -> dict[CurrencyEnum, float]:
+		"""
+		Returns the balance after the last transaction, in `Wallet.balance` form.
+
+		Returns:
+			dict[CurrencyEnum, float]: The balance of each currency the ledger touches.
+		"""
+		return {CURRENCIES[code]: balance for code, balance in sorted(self._final.items())}
+
+	def to_wallet(self) -> Wallet:
+		"""
+		Builds the wallet a full replay of the ledger would give, including its rejection log, without replaying it.
+
+		Returns:
+			Wallet: The wallet after the last transaction.
+		"""
+		rejections = RejectionLog()
+
+		for position in self.rejected():
+			# A rejected withdrawal leaves the balance untouched, so its stored balance is the one it saw.
+			rejections.record(position, CURRENCIES[self._currencies[position]], self._amounts[position], self._balances[position])
+
+		return Wallet(transaction_list=(), state=defaultdict(float, self.balance), transaction_count=len(self), rejections=rejections)
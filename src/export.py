@@ -0,0 +1,278 @@
+import csv
+import json
+import pathlib
+from collections.abc import Iterable, Sequence
+from typing import Protocol, TextIO
+
+from src.common.types import Transaction
+from src.rejections import ReplayResult
+from src.streaming import chunked
+from src.wallet import Wallet
+
+EXPORT_FORMATS = ("csv", "ndjson", "arrow", "parquet")
+"""File formats written by `export_replay`. Arrow IPC and Parquet need the optional `pyarrow` package."""
+
+DEFAULT_EXPORT_CHUNK = 65_536
+"""Number of transaction outcomes buffered before they are written."""
+
+OUTCOME_COLUMNS = ("index", "action", "currency", "amount", "accepted", "balance")
+"""Columns of an export: the transaction's position, its fields, whether it was applied, and its currency's balance after it."""
+
+_SUFFIXES = {"csv": "csv", "ndjson": "ndjson", "jsonl": "ndjson", "arrow": "arrow", "feather": "arrow", "ipc": "arrow", "parquet": "parquet"}
+
+Columns = Sequence[list]
+
+
+class OutcomeWriter(Protocol):
+	"""
+	Writes chunks of transaction outcomes to a file, one list per column of `OUTCOME_COLUMNS`.
+	"""
+
+	def write(self, columns: Columns) -> None:
+		"""
+		Writes one chunk of outcomes.
+
+		Args:
+			columns (Columns): The values of each column, all of the same length.
+		"""
+
+	def close(self) -> None:
+		"""
+		Flushes and closes the file.
+		"""
+
+
+class _CsvWriter:
+	"""
+	Writes outcomes as CSV, with a header row.
+
+	Attributes:
+		file (TextIO): The file being written.
+	"""
+
+	def __init__(self, path: pathlib.Path) -> None:
+		"""
+		Opens the file and writes the header.
+
+		Args:
+			path (pathlib.Path): The file to write.
+		"""
+		self.file: TextIO = path.open("w", newline="", encoding="utf-8")
+		self._writer = csv.writer(self.file, lineterminator="\n")
+		self._writer.writerow(OUTCOME_COLUMNS)
+
+	def write(self, columns: Columns) -> None:
+		"""
+		Writes one chunk of outcomes, one row each.
+
+		Args:
+			columns (Columns): The values of each column.
+		"""
+		self._writer.writerows(zip(*columns, strict=True))
+
+	def close(self) -> None:
+		"""
+		Closes the file.
+		"""
+		self.file.close()
+
+
+class _NdjsonWriter:
+	"""
+	Writes outcomes as newline-delimited JSON, one object per transaction.
+
+	Attributes:
+		file (TextIO): The file being written.
+	"""
+
+	def __init__(self, path: pathlib.Path) -> None:
+		"""
+		Opens the file.
+
+		Args:
+			path (pathlib.Path): The file to write.
+		"""
+		self.file: TextIO = path.open("w", encoding="utf-8")
+
+	def write(self, columns: Columns) -> None:
+		"""
+		Writes one chunk of outcomes, one line each.
+
+		Args:
+			columns (Columns): The values of each column.
+		"""
+		dumps = json.dumps
+		self.file.writelines(dumps(dict(zip(OUTCOME_COLUMNS, row, strict=True))) + "\n" for row in zip(*columns, strict=True))
+
+	def close(self) -> None:
+		"""
+		Closes the file.
+		"""
+		self.file.close()
+
+
+class _ArrowWriter:
+	"""
+	Writes outcomes as record batches of an Arrow IPC file, or as row groups of a Parquet file.
+
+	Attributes:
+		schema (pyarrow.Schema): The column types.
+	"""
+
+	def __init__(self, path: pathlib.Path, fmt: str) -> None:
+		"""
+		Opens the file, importing `pyarrow` on demand.
+
+		Args:
+			path (pathlib.Path): The file to write.
+			fmt (str): "arrow" or "parquet".
+
+		Raises:
+			ImportError: If `pyarrow` is not installed.
+		"""
+		try:
+			# The optional dependency is only loaded by the formats that need it.
+			import pyarrow as pa  # noqa: PLC0415
+			import pyarrow.ipc  # noqa: PLC0415
+			import pyarrow.parquet  # noqa: PLC0415
+
+		except ImportError as e:
+			raise ImportError(f"Exporting to {fmt} needs the pyarrow package: pip install pyarrow") from e
+
+		self._pa = pa
+		self.schema = pa.schema(
+			[
+				("index", pa.int64()),
+				("action", pa.string()),
+				("currency", pa.string()),
+				("amount", pa.float64()),
+				("accepted", pa.bool_()),
+				("balance", pa.float64()),
+			],
+		)
+		self._parquet = fmt == "parquet"
+		self._writer = pyarrow.parquet.ParquetWriter(path, self.schema) if self._parquet else pyarrow.ipc.new_file(path, self.schema)
+
+	def write(self, columns: Columns) -> None:
+		"""
+		Writes one chunk of outcomes as one record batch or row group.
+
+		Args:
+			columns (Columns): The values of each column.
+		"""
+		batch = self._pa.record_batch(list(columns), schema=self.schema)
+
+		if self._parquet:
+			self._writer.write_table(self._pa.Table.from_batches([batch]))
+
+		else:
+			self._writer.write_batch(batch)
+
+	def close(self) -> None:
+		"""
+		Writes the file footer and closes the file.
+		"""
+		self._writer.close()
+
+
+def detect_export_format(path: str | pathlib.Path) -> str:
+	"""
+	Guesses the export format from a file's extension.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+
+	Returns:
+		str: One of `EXPORT_FORMATS`.
+
+	Raises:
+		ValueError: If the extension is not recognized.
+	"""
+	ext = pathlib.Path(path).suffix.lower().lstrip(".")
+
+	if ext not in _SUFFIXES:
+		raise ValueError(f"Cannot guess the export format of {path}, pass one of {EXPORT_FORMATS}")
+
+	return _SUFFIXES[ext]
+
+
+def open_writer(path: str | pathlib.Path, fmt: str | None = None) -> OutcomeWriter:
+	"""
+	Opens a writer of transaction outcomes.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+		fmt (str | None, optional): One of `EXPORT_FORMATS`. Defaults to detecting it with `detect_export_format`.
+
+	Returns:
+		OutcomeWriter: The writer, to be closed by the caller.
+
+	Raises:
+		ValueError: If the format is not supported.
+	"""
+	path = pathlib.Path(path)
+	fmt = fmt or detect_export_format(path)
+
+	if fmt == "csv":
+		return _CsvWriter(path)
+
+	if fmt == "ndjson":
+		return _NdjsonWriter(path)
+
+	if fmt in {"arrow", "parquet"}:
+		return _ArrowWriter(path, fmt)
+
+	raise ValueError(f"Unsupported export format: {fmt}")
+
+
+def export_replay(
+	transactions: Iterable[Transaction],
+	path: str | pathlib.Path,
+	wallet: Wallet | None = None,
+	*,
+	fmt: str | None = None,
+	chunk_size: int = DEFAULT_EXPORT_CHUNK,
+) -> ReplayResult:
+	"""
+	Replays transactions into a wallet and writes each one's outcome as it goes, one chunk at a time.
+
+	Only one chunk of transactions and outcomes is held at once, so memory stays flat however long the ledger is.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions, read once.
+		path (str | pathlib.Path): The file to write.
+		wallet (Wallet | None, optional): The wallet to replay into. Defaults to a new, empty wallet.
+		fmt (str | None, optional): One of `EXPORT_FORMATS`. Defaults to detecting it with `detect_export_format`.
+		chunk_size (int, optional): The number of outcomes written at a time. Defaults to `DEFAULT_EXPORT_CHUNK`.
+
+	Returns:
+		ReplayResult: The number of processed and successful transactions, the balance and the rejection log.
+	"""
+	if wallet is None:
+		wallet = Wallet(transaction_list=())
+
+	writer = open_writer(path, fmt)
+	process_transaction, state = wallet.process_transaction, wallet.state
+	processed = accepted = 0
+
+	try:
+		for chunk in chunked(transactions, chunk_size):
+			start = wallet.transaction_count
+			actions, currencies, amounts, outcomes, balances = [], [], [], [], []
+
+			for wallet_action, currency, amount in chunk:
+				outcome = process_transaction(wallet_action, currency, amount)
+				actions.append(wallet_action.value)
+				currencies.append(str(currency))
+				amounts.append(amount)
+				outcomes.append(outcome)
+				balances.append(state.get(currency, 0.0))
+
+			writer.write([list(range(start, start + len(chunk))), actions, currencies, amounts, outcomes, balances])
+			processed += len(chunk)
+			accepted += sum(outcomes)
+
+	finally:
+		writer.close()
+
+	return ReplayResult(processed, accepted, wallet.balance, wallet.rejections)
@@ -0,0 +1,284 @@
+import hashlib
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from functools import partial
+from itertools import starmap
+from typing import Protocol, Self
+
+from src.common.types import AssetRegistry, Transaction, TransactionBatch
+from src.streaming import chunked
+from src.wallet import Wallet
+
+DEFAULT_FINGERPRINT_CHUNK = 4096
+"""Number of transactions hashed into each leaf of a fingerprint."""
+
+DIGEST_SIZE = 32
+"""Size in bytes of every hash in a fingerprint."""
+
+_LEAF, _NODE = b"\x00", b"\x01"
+"""Prefixes that keep leaf hashes and node hashes from ever colliding."""
+
+
+def _hash(*parts: bytes) -> bytes:
+	"""
+	Hashes the concatenation of byte strings.
+
+	Args:
+		*parts (bytes): The byte strings.
+
+	Returns:
+		bytes: The BLAKE2b digest, `DIGEST_SIZE` bytes long.
+	"""
+	digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+	for part in parts:
+		digest.update(part)
+
+	return digest.digest()
+
+
+def _little_endian(column: array) -> bytes:
+	"""
+	Returns the bytes of a column in little-endian order, so fingerprints agree across machines.
+
+	Args:
+		column (array): The column.
+
+	Returns:
+		bytes: The column's items, little-endian.
+	"""
+	if sys.byteorder == "big" and column.itemsize > 1:
+		column = array(column.typecode, column)
+		column.byteswap()
+
+	return column.tobytes()
+
+
+def encode_chunk(transactions: Iterable[Transaction], *, assets: AssetRegistry | None = None) -> bytes:
+	"""
+	Encodes transactions canonically: action codes, then currency codes, then amounts, as little-endian columns.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions. A `TransactionBatch` is encoded without decoding it.
+		assets (AssetRegistry | None, optional): The registry to encode assets with. Defaults to the built-in currencies,
+			whose codes are the same in every registry.
+
+	Returns:
+		bytes: The encoded transactions.
+	"""
+	batch = transactions if isinstance(transactions, TransactionBatch) else TransactionBatch.from_transactions(transactions, assets=assets)
+	return b"".join(map(_little_endian, batch.columns))
+
+
+class NodeSource(Protocol):
+	"""
+	Anything that serves the nodes of a fingerprint, such as a local `MerkleTree` or a client of a remote replica.
+	"""
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of leaves.
+		"""
+
+	def node(self, level: int, index: int) -> bytes:
+		"""
+		Returns the hash of a node.
+
+		Args:
+			level (int): The level of the node, 0 for the leaves.
+			index (int): The position of the node in its level.
+		"""
+
+
+@dataclass(frozen=True)
+class MerkleTree:
+	"""
+	A Merkle tree over fixed-size chunks of a ledger or of a replay.
+
+	Leaves hash one chunk each, and every node hashes its two children. A node missing its right sibling, at the right
+	edge of a level, hashes its left child alone, so a node only ever equals a node covering the same complete range.
+
+	Attributes:
+		chunk_size (int): The number of transactions per leaf.
+		rows (int): The number of transactions fingerprinted.
+		levels (tuple[tuple[bytes, ...], ...]): The hashes of each level, from the leaves up to the root.
+	"""
+
+	chunk_size: int
+	rows: int
+	levels: tuple[tuple[bytes, ...], ...]
+
+	@classmethod
+	def from_leaves(cls, leaves: Sequence[bytes], *, chunk_size: int, rows: int) -> Self:
+		"""
+		Builds the tree above the leaf hashes.
+
+		Args:
+			leaves (Sequence[bytes]): The hash of each chunk, in order.
+			chunk_size (int): The number of transactions per leaf.
+			rows (int): The number of transactions fingerprinted.
+
+		Returns:
+			Self: The tree.
+		"""
+		levels = [tuple(leaves)]
+
+		while len(levels[-1]) > 1:
+			level = levels[-1]
+			levels.append(tuple(_hash(_NODE, *level[i : i + 2]) for i in range(0, len(level), 2)))
+
+		return cls(chunk_size, rows, tuple(levels))
+
+	@property
+	def root(self) -> bytes:
+		"""
+		The hash of the whole tree, which alone tells whether two fingerprints are equal.
+
+		Returns:
+			bytes: The root hash, or the hash of nothing for an empty ledger.
+		"""
+		return self.levels[-1][0] if self.levels[-1] else _hash(_NODE)
+
+	def node(self, level: int, index: int) -> bytes:
+		"""
+		Returns the hash of a node.
+
+		Args:
+			level (int): The level of the node, 0 for the leaves.
+			index (int): The position of the node in its level.
+
+		Returns:
+			bytes: The node's hash.
+		"""
+		return self.levels[level][index]
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of leaves.
+
+		Returns:
+			int: The number of chunks.
+		"""
+		return len(self.levels[0])
+
+
+def _complete_nodes(leaves: int) -> Iterator[tuple[int, int]]:
+	"""
+	Splits the first `leaves` leaves into the largest complete subtrees, left to right.
+
+	Args:
+		leaves (int): The number of leaves to cover.
+
+	Yields:
+		tuple[int, int]: The level and index of each subtree's root.
+	"""
+	start = 0
+
+	for level in range(leaves.bit_length() - 1, -1, -1):
+		if leaves & (1 << level):
+			yield level, start >> level
+			start += 1 << level
+
+
+def first_divergence(local: NodeSource, remote: NodeSource) -> int | None:
+	"""
+	Finds the first chunk where two fingerprints differ, comparing O(log n) hashes rather than every chunk.
+
+	The chunks both fingerprints have are covered by at most log2(n) complete subtrees, which exist with the same
+	shape in both trees. The first subtree whose roots differ is searched by descending into the child that differs,
+	left first.
+
+	Args:
+		local (NodeSource): One fingerprint.
+		remote (NodeSource): The other fingerprint, built with the same chunk size.
+
+	Returns:
+		int | None: The index of the first differing chunk, or None when the fingerprints are equal. When one
+			fingerprint extends the other, that is the first chunk the shorter one lacks.
+	"""
+	common = min(len(local), len(remote))
+
+	for top, start in _complete_nodes(common):
+		if local.node(top, start) == remote.node(top, start):
+			continue
+
+		level, index = top, start
+
+		while level:
+			level, index = level - 1, 2 * index
+
+			if local.node(level, index) == remote.node(level, index):
+				index += 1
+
+		return index
+
+	return None if len(local) == len(remote) else common
+
+
+def ledger_fingerprint(transactions: Iterable[Transaction], *, chunk_size: int = DEFAULT_FINGERPRINT_CHUNK) -> MerkleTree:
+	"""
+	Fingerprints a sequence of transactions.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions, read once. A `TransactionBatch` is sliced without decoding.
+		chunk_size (int, optional): The number of transactions per leaf. Defaults to `DEFAULT_FINGERPRINT_CHUNK`.
+
+	Returns:
+		MerkleTree: The fingerprint.
+	"""
+	if isinstance(transactions, TransactionBatch):
+		chunks = (transactions[start : start + chunk_size] for start in range(0, len(transactions), chunk_size))
+
+	else:
+		chunks = chunked(transactions, chunk_size)
+
+	leaves, rows = [], 0
+
+	for chunk in chunks:
+		leaves.append(_hash(_LEAF, encode_chunk(chunk)))
+		rows += len(chunk)
+
+	return MerkleTree.from_leaves(leaves, chunk_size=chunk_size, rows=rows)
+
+
+def encode_balance(wallet: Wallet) -> bytes:
+	"""
+	Encodes a wallet's balances canonically, sorted by currency, with every amount in its exact round-trip form.
+
+	Args:
+		wallet (Wallet): The wallet.
+
+	Returns:
+		bytes: The encoded balances.
+	"""
+	return ";".join(f"{currency}={amount}" for currency, amount in sorted(wallet.balance.items())).encode()
+
+
+def replay_fingerprint(wallet: Wallet, transactions: Iterable[Transaction], *, chunk_size: int = DEFAULT_FINGERPRINT_CHUNK) -> MerkleTree:
+	"""
+	Replays transactions into a wallet and fingerprints the replay.
+
+	Each leaf hashes a chunk of transactions, whether each of them was accepted, and the balances right after the chunk,
+	so two replays of the same ledger match leaf for leaf only if they took the same decisions and reached the same
+	balances. Any `Wallet` works, so alternative replay paths can be reconciled with the reference one.
+
+	Args:
+		wallet (Wallet): The wallet to replay into.
+		transactions (Iterable[Transaction]): The transactions, read once. Assets beyond the built-in currencies are
+			encoded with the wallet's registry, if it has one.
+		chunk_size (int, optional): The number of transactions per leaf. Defaults to `DEFAULT_FINGERPRINT_CHUNK`.
+
+	Returns:
+		MerkleTree: The fingerprint.
+	"""
+	process_transaction, assets = partial(wallet.process_transaction, verbose=False), getattr(wallet, "assets", None)
+	leaves, rows = [], 0
+
+	for chunk in chunked(transactions, chunk_size):
+		accepted = bytes(starmap(process_transaction, chunk))
+		leaves.append(_hash(_LEAF, encode_chunk(chunk, assets=assets), accepted, encode_balance(wallet)))
+		rows += len(chunk)
+
+	return MerkleTree.from_leaves(leaves, chunk_size=chunk_size, rows=rows)
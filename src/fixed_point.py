@@ -0,0 +1,181 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.rejections import RejectionLog
+from src.wallet import Wallet
+
+CURRENCY_SCALES: dict[CurrencyEnum, int] = {
+	CurrencyEnum.USD: 2,
+	CurrencyEnum.BTC: 8,
+	CurrencyEnum.ETH: 18,
+}
+"""Number of decimal places of each currency's minor unit: cents, satoshi and wei."""
+
+
+def to_minor_units(amount: str | float | Decimal, currency: CurrencyEnum) -> int:
+	"""
+	Converts an amount into an exact integer number of minor units of a currency.
+
+	Plain decimal strings are converted without going through `float` or `Decimal`. Floats are converted from their
+	shortest repr, which is the text they were parsed from whenever that text had at most 15 significant digits.
+
+	Args:
+		amount (str | float | Decimal): The amount in major units, such as "0.25".
+		currency (CurrencyEnum): The currency of the amount.
+
+	Returns:
+		int: The amount in minor units.
+
+	Raises:
+		ValueError: If the amount is not a number or has more decimals than the currency's minor unit.
+	"""
+	scale = CURRENCY_SCALES[currency]
+	text = amount.strip() if isinstance(amount, str) else repr(amount) if isinstance(amount, float) else str(amount)
+	whole, _, fraction = text.partition(".")
+
+	digits = whole + fraction
+
+	if digits.isascii() and digits.isdigit():
+		if len(fraction) > scale:
+			if fraction[scale:].strip("0"):
+				raise ValueError(f"{text} has more decimals than {currency} supports ({scale})")
+
+			fraction = fraction[:scale]
+
+		return int(whole or "0") * 10**scale + int(fraction.ljust(scale, "0") or "0")
+
+	try:
+		units = Decimal(text).scaleb(scale)
+		integral = units.to_integral_value()
+
+		if units != integral:
+			raise ValueError(f"{text} has more decimals than {currency} supports ({scale})")
+
+		return int(integral)
+
+	except (ArithmeticError, InvalidOperation) as e:
+		raise ValueError(f"Invalid amount: {text}") from e
+
+
+def from_minor_units(units: int, currency: CurrencyEnum) -> Decimal:
+	"""
+	Converts an integer number of minor units back into an exact decimal amount.
+
+	Args:
+		units (int): The amount in minor units.
+		currency (CurrencyEnum): The currency of the amount.
+
+	Returns:
+		Decimal: The amount in major units.
+	"""
+	return Decimal(units).scaleb(-CURRENCY_SCALES[currency])
+
+
+def parse_minor_units_transaction(action: str, currency: str, amount: str | float) -> Transaction:
+	"""
+	Parses and validates the raw fields of a single transaction, converting the amount straight to minor units.
+
+	Pass it as `parse=` to the parsers in `src.streaming` to feed a `FixedPointWallet`.
+
+	Args:
+		action (str): The wallet action name, case-insensitive.
+		currency (str): The currency name, case-insensitive.
+		amount (str | float): The amount in major units, as a number or numeric string.
+
+	Returns:
+		Transaction: The parsed transaction, with an integer amount in minor units.
+
+	Raises:
+		ValueError: If the amount is not positive.
+	"""
+	wallet_action = WalletActionEnum[str(action).strip().upper()]
+	currency = CurrencyEnum[str(currency).strip().upper()]
+	amount = to_minor_units(amount, currency)
+
+	if amount <= 0:
+		raise ValueError("Amount must be positive.")
+
+	return Transaction(wallet_action, currency, amount)
+
+
+@dataclass
+class ExactRejectionLog(RejectionLog):
+	"""
+	A `RejectionLog` keeping amounts as Python ints, since minor units of some currencies do not fit a float.
+	"""
+
+	_requested: list = field(default_factory=list, repr=False)
+	_available: list = field(default_factory=list, repr=False)
+
+
+@dataclass
+class FixedPointWallet(Wallet):
+	"""
+	A wallet keeping each balance as an exact integer number of minor units.
+
+	Transactions carry integer amounts in minor units, as produced by `parse_minor_units_transaction` or
+	`to_minor_units`. Additions and comparisons are exact, so long runs never drift and the insufficient-funds check
+	is never wrong at the margin. Balances are reported as exact `Decimal` amounts.
+
+	Snapshots keep the minor units as integers. `BalanceHistory` records float deltas, which are inexact above 2**53
+	minor units, so it is refused.
+
+	Attributes:
+		state (dict[CurrencyEnum, int]): The balance of each currency, in minor units.
+		rejections (RejectionLog): A bounded record of the withdrawals skipped for insufficient funds, in minor units.
+	"""
+
+	state: dict[CurrencyEnum, int] = field(default_factory=lambda: defaultdict(int))
+	rejections: RejectionLog = field(default_factory=ExactRejectionLog)
+
+	def __post_init__(self) -> None:
+		"""
+		Refuses a balance history, then initializes the wallet by processing the transaction list.
+
+		Raises:
+			ValueError: If a balance history is requested.
+		"""
+		if self.history is not None:
+			raise ValueError("Fixed-point wallets do not support balance history, which stores balances as floats")
+
+		super().__post_init__()
+
+	@staticmethod
+	def _validate_amount(amount: int) -> None:
+		"""
+		Validates that the amount is a positive integer number of minor units.
+
+		Args:
+			amount (int): The amount to validate.
+
+		Raises:
+			ValueError: If the amount is not a positive integer.
+		"""
+		if not isinstance(amount, int) or isinstance(amount, bool):
+			raise ValueError(f"Amount must be an integer number of minor units: {amount!r}")  # noqa: TRY004
+
+		if amount <= 0:
+			raise ValueError(f"Amount must be positive: {amount}")
+
+	@property
+	def minor_balance(self) -> dict[CurrencyEnum, int]:
+		"""
+		The current balance of the wallet, in minor units.
+
+		Returns:
+			dict[CurrencyEnum, int]: A dictionary with the balance of each currency.
+		"""
+		return dict(self.state)
+
+	@property
+	def balance(self) -> dict[CurrencyEnum, Decimal]:
+		"""
+		The current balance of the wallet, as exact decimal amounts.
+
+		Returns:
+			dict[CurrencyEnum, Decimal]: A dictionary with the balance of each currency.
+		"""
+		return {currency: from_minor_units(units, currency) for currency, units in self.state.items()}
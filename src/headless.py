@@ -0,0 +1,95 @@
+import argparse
+import csv
+import json
+import pathlib
+import sys
+from collections.abc import Sequence
+from typing import TextIO
+
+from src.streaming import FORMATS, detect_format, iter_transactions, stream_into_wallet
+from src.wallet import Wallet
+
+OUTPUTS = ("json", "csv")
+"""Output formats understood by `write_balance`."""
+
+
+def write_balance(wallet: Wallet, output: str, stream: TextIO) -> None:
+	"""
+	Writes the wallet's balances and transaction counts in a machine-readable form.
+
+	Args:
+		wallet (Wallet): The wallet to report.
+		output (str): One of `OUTPUTS`.
+		stream (TextIO): Where to write the report.
+	"""
+	balance = {currency.value: amount for currency, amount in sorted(wallet.balance.items())}
+
+	if output == "csv":
+		writer = csv.writer(stream, lineterminator="\n")
+		writer.writerow(("currency", "balance"))
+		writer.writerows(balance.items())
+		return
+
+	json.dump(
+		{
+			"balance": balance,
+			"processed": wallet.transaction_count,
+			"rejected": wallet.rejections.total,
+		},
+		stream,
+	)
+	stream.write("\n")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+	"""
+	Replays a transactions file without any dialog and prints the final balances.
+
+	Only the parsing and wallet modules are imported, so it starts quickly and runs in cron jobs and containers.
+
+	Args:
+		argv (Sequence[str] | None, optional): The command line arguments. Defaults to `sys.argv[1:]`.
+
+	Returns:
+		int: The exit status, 1 when the input could not be read or contains an invalid transaction.
+	"""
+	parser = argparse.ArgumentParser(description="Replay a transactions file and print the final wallet balances.")
+	parser.add_argument("--input", type=pathlib.Path, required=True)
+	parser.add_argument("--format", choices=FORMATS, default=None, help="Defaults to guessing from the file.")
+	parser.add_argument("--output", choices=OUTPUTS, default="json")
+	parser.add_argument("--processes", type=int, default=None, help="Parse a CSV file in this many worker processes.")
+	parser.add_argument("--export", type=pathlib.Path, default=None, help="Also write each transaction's outcome and balance to this file.")
+	parser.add_argument("--export-format", default=None, help="One of csv, ndjson, arrow or parquet. Defaults to guessing from the export file.")
+	args = parser.parse_args(argv)
+
+	if args.export is not None and args.processes is not None:
+		parser.error("--export replays the file in order in one process and cannot be combined with --processes")
+
+	try:
+		if args.export is not None:
+			# Exporting is optional, so its module is loaded on demand to keep startup fast.
+			from src.export import export_replay  # noqa: PLC0415
+
+			wallet = Wallet(transaction_list=())
+			export_replay(iter_transactions(args.input, args.format), args.export, wallet, fmt=args.export_format)
+
+		elif args.processes is not None and (args.format or detect_format(args.input)) == "csv":
+			# Parallel parsing needs a process pool and numpy, so they are loaded on demand.
+			from src.parallel_csv import replay_csv_parallel  # noqa: PLC0415
+
+			wallet = replay_csv_parallel(args.input, processes=args.processes)
+
+		else:
+			wallet = stream_into_wallet(args.input, fmt=args.format)
+
+	# A non-array JSON document raises TypeError, and a malformed CSV file can raise csv.Error.
+	except (OSError, ImportError, KeyError, TypeError, ValueError, csv.Error) as e:
+		sys.stderr.write(f"Failed to replay {args.input}: {e}\n")
+		return 1
+
+	write_balance(wallet, args.output, sys.stdout)
+	return 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
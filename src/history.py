@@ -0,0 +1,240 @@
+from array import array
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry
+
+if TYPE_CHECKING:
+	from src.wallet import Wallet
+
+DEFAULT_CHECKPOINT_INTERVAL = 1024
+"""Number of transactions between two balance checkpoints of a `BalanceHistory`."""
+
+ApplyTransaction = Callable[..., bool]
+
+
+@dataclass
+class BalanceHistory:
+	"""
+	An index of a wallet's balances over time, recorded while the wallet replays its transactions.
+
+	Every transaction is kept as an asset ID, the signed change it made to the balance and whether it was
+	accepted. IDs come from the wallet's `AssetRegistry` when it has one, so any registered asset is recorded, and
+	from the built-in currencies otherwise. Every `interval` transactions the whole balance is checkpointed, so a past balance is rebuilt from the
+	closest checkpoint by adding at most `interval` changes, in the same order as the wallet did, which gives exactly the
+	same floats. A larger interval keeps fewer checkpoints at the price of slower queries.
+
+	Pass an instance to `Wallet(history=...)` to record it; wallets without history pay nothing for it.
+
+	Attributes:
+		interval (int): The number of transactions between two checkpoints. Defaults to `DEFAULT_CHECKPOINT_INTERVAL`.
+		offset (int): The wallet's transaction count when recording started; indices below it are not covered.
+	"""
+
+	interval: int = DEFAULT_CHECKPOINT_INTERVAL
+	offset: int = 0
+	_assets: AssetRegistry = field(default_factory=AssetRegistry, repr=False)
+	_checkpoints: list[array] = field(default_factory=list, repr=False)
+	_currencies: array = field(default_factory=lambda: array("H"), repr=False)
+	_deltas: array = field(default_factory=lambda: array("d"), repr=False)
+	_accepted: bytearray = field(default_factory=bytearray, repr=False)
+	_first_seen: dict[int, int] = field(default_factory=dict, repr=False)
+
+	def __post_init__(self) -> None:
+		"""
+		Validates the interval.
+
+		Raises:
+			ValueError: If the interval is not positive.
+		"""
+		if self.interval <= 0:
+			raise ValueError(f"Checkpoint interval must be positive: {self.interval}")
+
+	def track(self, wallet: "Wallet") -> ApplyTransaction:
+		"""
+		Starts recording a wallet from its current state, and wraps its `_apply` step to record every transaction.
+
+		Args:
+			wallet (Wallet): The wallet to record.
+
+		Returns:
+			ApplyTransaction: The recording `_apply`, with the same signature.
+		"""
+		apply, state, interval = wallet._apply, wallet.state, self.interval  # noqa: SLF001
+		currencies, deltas, accepted_mask, first_seen = self._currencies, self._deltas, self._accepted, self._first_seen
+		self._assets = getattr(wallet, "assets", None) or self._assets
+		resolve = self._assets.resolve
+
+		self.offset = wallet.transaction_count
+		self._checkpoint(state)
+		first_seen.update(dict.fromkeys((resolve(currency) for currency in state), -1))
+
+		def tracked(wallet_action: WalletActionEnum, currency: CurrencyEnum, amount: float, *, verbose: bool | None = None) -> bool:
+			position = len(deltas)
+
+			if position and not position % interval:
+				self._checkpoint(state)
+
+			accepted = apply(wallet_action, currency, amount, verbose=verbose)
+			code = resolve(currency)
+			first_seen.setdefault(code, position)
+			currencies.append(code)
+			deltas.append((amount if wallet_action == WalletActionEnum.DEPOSIT else -amount) if accepted else 0.0)
+			accepted_mask.append(accepted)
+			return accepted
+
+		return tracked
+
+	def _checkpoint(self, state: dict[CurrencyEnum, float]) -> None:
+		"""
+		Appends the current balance of every registered asset to the checkpoints.
+
+		Args:
+			state (dict[CurrencyEnum, float]): The wallet's balances.
+		"""
+		self._checkpoints.append(array("d", (state.get(symbol, 0.0) for symbol in self._assets.symbols)))
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of recorded transactions.
+
+		Returns:
+			int: The number of transactions recorded since `offset`.
+		"""
+		return len(self._deltas)
+
+	def _position(self, index: int) -> int:
+		"""
+		Converts a wallet transaction index into a position in the recorded columns.
+
+		Args:
+			index (int): The number of wallet transactions applied, counted like `Wallet.transaction_count`.
+
+		Returns:
+			int: The number of recorded transactions applied at that index.
+
+		Raises:
+			IndexError: If the index is outside the recorded history.
+		"""
+		position = index - self.offset
+
+		if not 0 <= position <= len(self._deltas):
+			raise IndexError(f"Transaction index {index} is outside the recorded history [{self.offset}, {self.offset + len(self)}]")
+
+		return position
+
+	def _rebuild(self, position: int) -> list[float]:
+		"""
+		Rebuilds the balance of every currency after `position` recorded transactions.
+
+		Args:
+			position (int): The number of recorded transactions applied.
+
+		Returns:
+			list[float]: The balance of each asset, indexed by asset ID.
+		"""
+		block = min(position // self.interval, len(self._checkpoints) - 1)
+		balances = self._checkpoints[block].tolist()
+		# Assets registered after the checkpoint had no balance yet.
+		balances.extend([0.0] * (len(self._assets) - len(balances)))
+		start = block * self.interval
+
+		for code, delta in zip(self._currencies[start:position], self._deltas[start:position], strict=True):
+			if delta:
+				balances[code] += delta
+
+		return balances
+
+	def balance_at(self, index: int) -> dict[CurrencyEnum | str, float]:
+		"""
+		Returns the wallet balance after the given number of transactions, in `Wallet.balance` form.
+
+		Args:
+			index (int): The number of wallet transactions applied, between `offset` and `offset + len(self)`.
+
+		Returns:
+			dict[CurrencyEnum | str, float]: The balance of each currency the wallet had touched by then.
+		"""
+		position = self._position(index)
+		balances = self._rebuild(position)
+		symbols = self._assets.symbols
+		return {symbols[code]: balances[code] for code, seen in self._first_seen.items() if seen < position}
+
+	def balance_range(self, currency: CurrencyEnum | str, start: int, stop: int) -> list[float]:
+		"""
+		Returns the balance of one currency after each number of transactions in `[start, stop)`.
+
+		Args:
+			currency (CurrencyEnum | str): The currency to follow.
+			start (int): The first transaction index, counted like `Wallet.transaction_count`.
+			stop (int): The transaction index after the last one.
+
+		Returns:
+			list[float]: The balance after `start`, `start + 1`, ..., `stop - 1` transactions.
+
+		Raises:
+			ValueError: If the range is reversed.
+		"""
+		if stop < start:
+			raise ValueError(f"Range is reversed: [{start}, {stop})")
+
+		if stop == start:
+			self._position(start)
+			return []
+
+		first, last = self._position(start), self._position(stop - 1)
+		code = self._assets.resolve(currency)
+		balance = self._rebuild(first)[code]
+		balances = [balance]
+
+		for other, delta in zip(self._currencies[first:last], self._deltas[first:last], strict=True):
+			if delta and other == code:
+				balance += delta
+
+			balances.append(balance)
+
+		return balances
+
+	def accepted(self, index: int) -> bool:
+		"""
+		Tells whether a recorded transaction was applied or skipped for insufficient funds.
+
+		Args:
+			index (int): The position of the transaction among those processed by the wallet.
+
+		Returns:
+			bool: Whether the transaction was applied.
+
+		Raises:
+			IndexError: If the transaction was not recorded.
+		"""
+		position = index - self.offset
+
+		if not 0 <= position < len(self._accepted):
+			raise IndexError(f"Transaction {index} was not recorded")
+
+		return bool(self._accepted[position])
+
+	def rejected(self, start: int | None = None, stop: int | None = None) -> list[int]:
+		"""
+		Lists the transactions skipped for insufficient funds.
+
+		Args:
+			start (int | None, optional): The first transaction index to consider. Defaults to `offset`.
+			stop (int | None, optional): The transaction index after the last one to consider. Defaults to the end.
+
+		Returns:
+			list[int]: The indices of the rejected transactions, in ascending order.
+		"""
+		first = self._position(self.offset if start is None else start)
+		last = len(self) if stop is None else self._position(stop)
+		mask, indices = self._accepted, []
+		position = mask.find(0, first, last)
+
+		while position != -1:
+			indices.append(self.offset + position)
+			position = mask.find(0, position + 1, last)
+
+		return indices
@@ -0,0 +1,150 @@
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+
+DEFAULT_LATENCY_BUCKETS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 1e-4, 1e-3)
+"""Upper bounds, in seconds, of the `process_transaction` latency histogram buckets."""
+
+ProcessTransaction = Callable[..., bool]
+
+
+@dataclass
+class WalletMetrics:
+	"""
+	Counters and a latency histogram for `Wallet.process_transaction`.
+
+	Passing an instance to `Wallet(metrics=...)` wraps that wallet's `process_transaction` once, at construction.
+	Wallets without metrics keep the plain method, so the disabled mode adds no work to the hot path.
+
+	Attributes:
+		buckets (tuple[float, ...]): The latency histogram bucket upper bounds, in seconds. Defaults to `DEFAULT_LATENCY_BUCKETS`.
+		transactions (dict[tuple[WalletActionEnum, CurrencyEnum | str], int]): The number of processed transactions per action and currency.
+		rejected (dict[CurrencyEnum | str, int]): The number of withdrawals skipped for insufficient funds per currency.
+		latency_counts (list[int]): The number of calls per bucket, the last one counting calls slower than every bound.
+		latency_sum (float): The total time spent in `process_transaction`, in seconds.
+		started_at (float): The `time.monotonic` value when the metrics were created.
+	"""
+
+	buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS
+	transactions: dict[tuple[WalletActionEnum, CurrencyEnum | str], int] = field(default_factory=dict)
+	rejected: dict[CurrencyEnum | str, int] = field(default_factory=dict)
+	latency_counts: list[int] = field(default_factory=list)
+	latency_sum: float = 0.0
+	started_at: float = field(default_factory=time.monotonic)
+
+	def __post_init__(self) -> None:
+		"""
+		Sizes the histogram to the buckets.
+		"""
+		if not self.latency_counts:
+			self.latency_counts = [0] * (len(self.buckets) + 1)
+
+	def instrument(self, process_transaction: ProcessTransaction) -> ProcessTransaction:
+		"""
+		Wraps a bound `process_transaction` so every call is counted and timed.
+
+		Args:
+			process_transaction (ProcessTransaction): The method to wrap.
+
+		Returns:
+			ProcessTransaction: The instrumented method, with the same signature.
+		"""
+		transactions, rejected, latency_counts, buckets = self.transactions, self.rejected, self.latency_counts, self.buckets
+		perf_counter = time.perf_counter
+
+		def instrumented(wallet_action: WalletActionEnum, currency: CurrencyEnum, amount: float, *, verbose: bool | None = None) -> bool:
+			start = perf_counter()
+			accepted = process_transaction(wallet_action, currency, amount, verbose=verbose)
+			elapsed = perf_counter() - start
+
+			key = (wallet_action, currency)
+			transactions[key] = transactions.get(key, 0) + 1
+
+			if not accepted:
+				rejected[currency] = rejected.get(currency, 0) + 1
+
+			latency_counts[bisect_left(buckets, elapsed)] += 1
+			self.latency_sum += elapsed
+			return accepted
+
+		return instrumented
+
+	@property
+	def count(self) -> int:
+		"""
+		The number of processed transactions.
+
+		Returns:
+			int: The number of calls recorded by the histogram.
+		"""
+		return sum(self.latency_counts)
+
+	def to_dict(self) -> dict:
+		"""
+		Exports the metrics as plain JSON types, including per-second rates since the metrics were created.
+
+		Returns:
+			dict: The exported metrics.
+		"""
+		uptime = time.monotonic() - self.started_at
+		cumulative = 0
+		histogram = {}
+
+		for bound, count in zip([*map(str, self.buckets), "+Inf"], self.latency_counts, strict=True):
+			cumulative += count
+			histogram[bound] = cumulative
+
+		return {
+			"uptime_seconds": uptime,
+			"transactions": {f"{action.value}:{currency}": count for (action, currency), count in self.transactions.items()},
+			"rates_per_second": {
+				f"{action.value}:{currency}": count / uptime if uptime else 0.0 for (action, currency), count in self.transactions.items()
+			},
+			"rejected_withdrawals": {str(currency): count for currency, count in self.rejected.items()},
+			"latency_seconds": {"buckets": histogram, "sum": self.latency_sum, "count": cumulative},
+		}
+
+	def to_prometheus(self, prefix: str = "wallet") -> str:
+		"""
+		Exports the metrics in the Prometheus text exposition format.
+
+		Args:
+			prefix (str, optional): The prefix of every metric name. Defaults to "wallet".
+
+		Returns:
+			str: The exported metrics.
+		"""
+		lines = [
+			f"# HELP {prefix}_transactions_total Transactions processed, by action and currency.",
+			f"# TYPE {prefix}_transactions_total counter",
+		]
+		lines.extend(
+			f'{prefix}_transactions_total{{action="{action.value}",currency="{currency}"}} {count}'
+			for (action, currency), count in self.transactions.items()
+		)
+
+		lines += [
+			f"# HELP {prefix}_rejected_withdrawals_total Withdrawals skipped for insufficient funds, by currency.",
+			f"# TYPE {prefix}_rejected_withdrawals_total counter",
+		]
+		lines.extend(f'{prefix}_rejected_withdrawals_total{{currency="{currency}"}} {count}' for currency, count in self.rejected.items())
+
+		lines += [
+			f"# HELP {prefix}_process_transaction_seconds Latency of process_transaction.",
+			f"# TYPE {prefix}_process_transaction_seconds histogram",
+		]
+		cumulative = 0
+
+		for bound, count in zip([*map(repr, self.buckets), "+Inf"], self.latency_counts, strict=True):
+			cumulative += count
+			lines.append(f'{prefix}_process_transaction_seconds_bucket{{le="{bound}"}} {cumulative}')
+
+		lines += [
+			f"{prefix}_process_transaction_seconds_sum {self.latency_sum!r}",
+			f"{prefix}_process_transaction_seconds_count {cumulative}",
+		]
+
+		return "\n".join(lines) + "\n"
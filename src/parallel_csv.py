@@ -0,0 +1,284 @@
+import csv
+import io
+import os
+import pathlib
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from src.common.enums import CURRENCY_CODES, WALLET_ACTION_CODES
+from src.common.types import Transaction, TransactionBatch
+from src.wallet import Wallet
+
+DEFAULT_CHUNK_BYTES = 32 << 20
+"""Approximate size of the byte range parsed by each task."""
+
+DEFAULT_TASKS_PER_PROCESS = 2
+"""Number of parsed chunks allowed in flight per worker, which bounds the memory held by results not yet consumed."""
+
+_ACTION_NAMES = {action.name: code for action, code in WALLET_ACTION_CODES.items()}
+_CURRENCY_NAMES = {currency.name: code for currency, code in CURRENCY_CODES.items()}
+
+
+@dataclass
+class ColumnChunk(TransactionBatch):
+	"""
+	The transactions of one byte range of a CSV file, as a `TransactionBatch`.
+
+	Attributes:
+		start_row (int): The file line number of the first transaction, the header being line 1.
+	"""
+
+	start_row: int = 2
+
+	def to_numpy(self) -> tuple[NDArray[np.uint8], NDArray[np.uint16], NDArray[np.float64]]:
+		"""
+		Views the columns as the arrays expected by `batch.replay_batch`, without copying.
+
+		Returns:
+			tuple[NDArray[np.uint8], NDArray[np.uint16], NDArray[np.float64]]: The action codes, currency codes and amounts.
+		"""
+		return (
+			np.frombuffer(self.actions, dtype=np.uint8),
+			np.frombuffer(self.currencies, dtype=np.uint16),
+			np.frombuffer(self.amounts, dtype=np.float64),
+		)
+
+
+def split_byte_ranges(path: str | pathlib.Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> tuple[list[str], list[tuple[int, int]]]:
+	"""
+	Reads the header of a CSV file and splits the rest into byte ranges that start and end on line boundaries.
+
+	Transaction files never quote newlines, so every line is exactly one row.
+
+	Args:
+		path (str | pathlib.Path): The file to split.
+		chunk_bytes (int, optional): The approximate size of each range. Defaults to `DEFAULT_CHUNK_BYTES`.
+
+	Returns:
+		tuple[list[str], list[tuple[int, int]]]: The header fields and the `(start, end)` offsets of each range.
+
+	Raises:
+		ValueError: If the chunk size is not positive.
+	"""
+	if chunk_bytes <= 0:
+		raise ValueError(f"Chunk size must be positive: {chunk_bytes}")
+
+	with pathlib.Path(path).open("rb") as f:
+		header = next(csv.reader([f.readline().decode("utf-8")]), [])
+		start, size = f.tell(), os.fstat(f.fileno()).st_size
+		ranges = []
+
+		while start < size:
+			if start + chunk_bytes >= size:
+				end = size
+
+			else:
+				# Extend the range to the end of the line that holds its last byte.
+				f.seek(start + chunk_bytes - 1)
+				f.readline()
+				end = f.tell()
+
+			ranges.append((start, end))
+			start = end
+
+	return header, ranges
+
+
+def _parse_range(path: str, start: int, end: int, columns: tuple[int, int, int]) -> tuple[ColumnChunk, int, str | None]:
+	"""
+	Parses one byte range into columns, stopping at the first invalid row.
+
+	Args:
+		path (str): The file to read.
+		start (int): The offset of the first byte of the range.
+		end (int): The offset just past the last byte of the range.
+		columns (tuple[int, int, int]): The positions of the action, currency and amount fields.
+
+	Returns:
+		tuple[ColumnChunk, int, str | None]: The rows parsed before any error, the number of rows read including the
+			invalid one, and the error message if a row was invalid.
+	"""
+	with pathlib.Path(path).open("rb") as f:
+		f.seek(start)
+		data = f.read(end - start).decode("utf-8")
+
+	chunk = ColumnChunk()
+	actions, currencies, amounts = chunk.actions, chunk.currencies, chunk.amounts
+	action_col, currency_col, amount_col = columns
+	rows = 0
+
+	for row in csv.reader(io.StringIO(data, newline="")):
+		rows += 1
+
+		if not row:
+			continue
+
+		try:
+			action = _ACTION_NAMES[row[action_col].strip().upper()]
+			currency = _CURRENCY_NAMES[row[currency_col].strip().upper()]
+			amount = float(row[amount_col])
+
+		except Exception as e:
+			return chunk, rows, str(e)
+
+		if amount <= 0:
+			return chunk, rows, "Amount must be positive."
+
+		actions.append(action)
+		currencies.append(currency)
+		amounts.append(amount)
+
+	return chunk, rows, None
+
+
+def iter_csv_chunks(
+	path: str | pathlib.Path,
+	*,
+	processes: int | None = None,
+	chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[ColumnChunk]:
+	"""
+	Parses a CSV file with `action,currency,amount` headers in a process pool, yielding its chunks in file order.
+
+	At most `DEFAULT_TASKS_PER_PROCESS` chunks per worker are parsed ahead of the consumer.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		processes (int | None, optional): The number of worker processes. Use 1 to parse in-process. Defaults to the CPU count.
+		chunk_bytes (int, optional): The approximate size of the byte range parsed by each task. Defaults to `DEFAULT_CHUNK_BYTES`.
+
+	Yields:
+		ColumnChunk: Each parsed chunk, in file order.
+
+	Raises:
+		ValueError: If the headers are missing, the number of processes is not positive, or a row is invalid. Rows are
+			numbered as file lines, as in `streaming.iter_csv`, and the valid rows before an invalid one are yielded first.
+	"""
+	if processes is None:
+		processes = os.cpu_count() or 1
+
+	if processes <= 0:
+		raise ValueError(f"Processes must be positive: {processes}")
+
+	header, ranges = split_byte_ranges(path, chunk_bytes)
+	header = [h.strip().lower() for h in header]
+
+	try:
+		columns = tuple(header.index(name) for name in ("action", "currency", "amount"))
+
+	except ValueError as e:
+		raise ValueError("CSV must include headers: action,currency,amount") from e
+
+	path = str(path)
+	row = 2
+
+	if processes == 1:
+		results = (_parse_range(path, start, end, columns) for start, end in ranges)
+
+	else:
+		pool = ProcessPoolExecutor(max_workers=processes)
+		results = _ordered_results(pool, path, ranges, columns, processes * DEFAULT_TASKS_PER_PROCESS)
+
+	try:
+		for chunk, rows, error in results:
+			chunk.start_row = row
+
+			if len(chunk):
+				yield chunk
+
+			if error is not None:
+				raise ValueError(f"Invalid row {row + rows - 1}: {error}")
+
+			row += rows
+
+	finally:
+		if processes != 1:
+			pool.shutdown(cancel_futures=True)
+
+
+def _ordered_results(
+	pool: ProcessPoolExecutor,
+	path: str,
+	ranges: list[tuple[int, int]],
+	columns: tuple[int, int, int],
+	window: int,
+) -> Iterator[tuple[ColumnChunk, int, str | None]]:
+	"""
+	Submits the ranges to the pool, keeping at most `window` in flight, and yields their results in submission order.
+
+	Args:
+		pool (ProcessPoolExecutor): The pool to submit to.
+		path (str): The file to read.
+		ranges (list[tuple[int, int]]): The byte ranges to parse.
+		columns (tuple[int, int, int]): The positions of the action, currency and amount fields.
+		window (int): The maximum number of submitted but unconsumed ranges.
+
+	Yields:
+		tuple[ColumnChunk, int, str | None]: The result of `_parse_range` for each range.
+	"""
+	pending: deque[Future] = deque()
+
+	for start, end in ranges:
+		pending.append(pool.submit(_parse_range, path, start, end, columns))
+
+		if len(pending) >= window:
+			yield pending.popleft().result()
+
+	while pending:
+		yield pending.popleft().result()
+
+
+def iter_csv_parallel(
+	path: str | pathlib.Path,
+	*,
+	processes: int | None = None,
+	chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Iterator[Transaction]:
+	"""
+	Parses a CSV file in a process pool, yielding the same transactions as `streaming.iter_csv`.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		processes (int | None, optional): The number of worker processes. Defaults to the CPU count.
+		chunk_bytes (int, optional): The approximate size of the byte range parsed by each task. Defaults to `DEFAULT_CHUNK_BYTES`.
+
+	Yields:
+		Transaction: Each transaction, in file order.
+	"""
+	for chunk in iter_csv_chunks(path, processes=processes, chunk_bytes=chunk_bytes):
+		yield from chunk
+
+
+def replay_csv_parallel(
+	path: str | pathlib.Path,
+	wallet: Wallet | None = None,
+	*,
+	processes: int | None = None,
+	chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> Wallet:
+	"""
+	Parses a CSV file in a process pool and replays it into a wallet, one chunk at a time and in file order.
+
+	The workers already validated every row, so the chunks are replayed without the per-call checks.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		wallet (Wallet | None, optional): The wallet to apply the transactions to. Defaults to a new, empty wallet.
+		processes (int | None, optional): The number of worker processes. Defaults to the CPU count.
+		chunk_bytes (int, optional): The approximate size of the byte range parsed by each task. Defaults to `DEFAULT_CHUNK_BYTES`.
+
+	Returns:
+		Wallet: The wallet, with every transaction in the file applied.
+	"""
+	if wallet is None:
+		wallet = Wallet(transaction_list=())
+
+	for chunk in iter_csv_chunks(path, processes=processes, chunk_bytes=chunk_bytes):
+		wallet.process_transactions(chunk, validated=True)
+
+	return wallet
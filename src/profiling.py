@@ -0,0 +1,135 @@
+import cProfile
+import pathlib
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Stage:
+	"""
+	The cost of one run of a pipeline stage.
+
+	Attributes:
+		name (str): The name of the stage.
+		rows (int): The number of transactions the stage handled, set by the stage itself. Defaults to 0.
+		wall_seconds (float): The elapsed wall time. Defaults to 0.0.
+		cpu_seconds (float): The CPU time of the process during the stage. Defaults to 0.0.
+		peak_memory_bytes (int | None): The peak memory Python allocated on top of what was held when the stage
+			started, if traced. Defaults to None.
+		interactive (bool): Whether the stage waits for the user, so its times include that wait. Defaults to False.
+	"""
+
+	name: str
+	rows: int = 0
+	wall_seconds: float = 0.0
+	cpu_seconds: float = 0.0
+	peak_memory_bytes: int | None = None
+	interactive: bool = False
+
+	@property
+	def rows_per_second(self) -> float:
+		"""
+		The throughput of the stage.
+
+		Returns:
+			float: The rows handled per wall second, 0.0 for a stage without rows or time.
+		"""
+		return self.rows / self.wall_seconds if self.rows and self.wall_seconds else 0.0
+
+
+@dataclass
+class PipelineProfiler:
+	"""
+	Timers that pipeline stages run under, recording wall time, CPU time, throughput and peak memory per stage.
+
+	A disabled profiler records nothing, so the stages can keep their timers in production code. Peak memory is only
+	traced when `memory` is set, since `tracemalloc` slows allocation-heavy stages down and skews their times.
+	`cProfile` optionally runs during the stages only, and never during interactive ones, so waiting for the user
+	stays out of the dump; the times of interactive stages are still recorded, and include that wait.
+
+	Stages must not nest: each one resets the peak memory and toggles the profiler.
+
+	Attributes:
+		enabled (bool): Whether stages are measured. Defaults to False.
+		memory (bool): Whether to trace peak memory while enabled. Defaults to False.
+		output (pathlib.Path | None): Where `finish` dumps the `cProfile` statistics, readable with `pstats`. Defaults to
+			None, for no dump.
+		stages (list[Stage]): The measured stages, in the order they finished.
+	"""
+
+	enabled: bool = False
+	memory: bool = False
+	output: pathlib.Path | None = None
+	stages: list[Stage] = field(default_factory=list)
+	_profile: cProfile.Profile | None = field(default=None, init=False, repr=False)
+	_tracing: bool = field(default=False, init=False, repr=False)
+
+	@contextmanager
+	def stage(self, name: str, rows: int = 0, *, interactive: bool = False) -> Iterator[Stage]:
+		"""
+		Measures the code run in the `with` block as one stage.
+
+		Args:
+			name (str): The name of the stage.
+			rows (int, optional): The number of transactions handled, if known upfront. Defaults to 0; the block can set
+				`rows` on the yielded stage once it knows.
+			interactive (bool, optional): Whether the stage waits for the user, which keeps `cProfile` off during it.
+				Defaults to False.
+
+		Yields:
+			Stage: The stage being measured, filled in when the block exits.
+		"""
+		stage = Stage(name, rows, interactive=interactive)
+
+		if not self.enabled:
+			yield stage
+			return
+
+		if self.memory and not tracemalloc.is_tracing():
+			tracemalloc.start()
+			self._tracing = True
+
+		if self.output is not None and self._profile is None:
+			self._profile = cProfile.Profile()
+
+		profile = None if interactive else self._profile
+
+		baseline = 0
+
+		if self.memory:
+			tracemalloc.reset_peak()
+			baseline = tracemalloc.get_traced_memory()[0]
+
+		if profile is not None:
+			profile.enable()
+
+		wall, cpu = time.perf_counter(), time.process_time()
+
+		try:
+			yield stage
+
+		finally:
+			stage.wall_seconds = time.perf_counter() - wall
+			stage.cpu_seconds = time.process_time() - cpu
+
+			if profile is not None:
+				profile.disable()
+
+			if self.memory:
+				stage.peak_memory_bytes = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+
+			self.stages.append(stage)
+
+	def finish(self) -> None:
+		"""
+		Stops tracing memory if this profiler started it, and dumps the `cProfile` statistics to `output`.
+		"""
+		if self._tracing:
+			tracemalloc.stop()
+			self._tracing = False
+
+		if self._profile is not None and self.output is not None:
+			self._profile.dump_stats(self.output)
@@ -0,0 +1,161 @@
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from src.common.enums import CURRENCIES, CURRENCY_CODES, CurrencyEnum
+from src.common.types import AssetRegistry
+
+DEFAULT_REJECTION_CAPACITY = 10_000
+"""Number of rejected transactions kept in detail by a `RejectionLog`."""
+
+
+class Rejection(NamedTuple):
+	"""
+	A withdrawal ignored for insufficient funds.
+
+	Attributes:
+		index (int): The position of the transaction among those processed by the wallet.
+		currency (CurrencyEnum): The currency of the withdrawal.
+		requested (float): The amount the withdrawal asked for.
+		available (float): The balance at the time of the withdrawal.
+	"""
+
+	index: int
+	currency: CurrencyEnum
+	requested: float
+	available: float
+
+
+@dataclass
+class RejectionLog:
+	"""
+	A bounded record of rejected withdrawals, stored as typed arrays rather than one object per rejection.
+
+	The first `capacity` rejections are kept in detail; later ones are only counted, so replaying an adversarial
+	ledger costs a few array appends per rejection and bounded memory.
+
+	Attributes:
+		capacity (int): The maximum number of rejections kept in detail. Defaults to `DEFAULT_REJECTION_CAPACITY`.
+		total (int): The number of rejections recorded, including those beyond the capacity.
+		assets (AssetRegistry | None): The registry currencies are stored with, if any. Defaults to None, for the built-in currencies.
+	"""
+
+	capacity: int = DEFAULT_REJECTION_CAPACITY
+	total: int = 0
+	assets: AssetRegistry | None = None
+	_indices: array = field(default_factory=lambda: array("q"), repr=False)
+	_currencies: array = field(default_factory=lambda: array("H"), repr=False)
+	_requested: array = field(default_factory=lambda: array("d"), repr=False)
+	_available: array = field(default_factory=lambda: array("d"), repr=False)
+
+	def record(self, index: int, currency: CurrencyEnum, requested: float, available: float) -> None:
+		"""
+		Records a rejected withdrawal.
+
+		Args:
+			index (int): The position of the transaction among those processed by the wallet.
+			currency (CurrencyEnum): The currency of the withdrawal.
+			requested (float): The amount the withdrawal asked for.
+			available (float): The balance at the time of the withdrawal.
+		"""
+		self.total += 1
+
+		if len(self._indices) < self.capacity:
+			self._indices.append(index)
+			self._currencies.append(CURRENCY_CODES[currency] if self.assets is None else self.assets.resolve(currency))
+			self._requested.append(requested)
+			self._available.append(available)
+
+	@property
+	def _symbols(self) -> Sequence[str]:
+		"""
+		The currency or asset of each stored code.
+
+		Returns:
+			Sequence[str]: `CURRENCIES`, or the symbols of the registry.
+		"""
+		return CURRENCIES if self.assets is None else self.assets.symbols
+
+	@property
+	def dropped(self) -> int:
+		"""
+		The number of rejections counted but not kept in detail.
+
+		Returns:
+			int: The number of rejections beyond the capacity.
+		"""
+		return self.total - len(self._indices)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of rejections kept in detail.
+
+		Returns:
+			int: The number of stored rejections.
+		"""
+		return len(self._indices)
+
+	def __iter__(self) -> Iterator[Rejection]:
+		"""
+		Iterates over the rejections kept in detail, in the order they happened.
+
+		Yields:
+			Rejection: Each stored rejection.
+		"""
+		currencies = self._symbols
+
+		for index, code, requested, available in zip(self._indices, self._currencies, self._requested, self._available, strict=True):
+			yield Rejection(index, currencies[code], requested, available)
+
+	def __getitem__(self, position: int) -> Rejection:
+		"""
+		Returns one of the rejections kept in detail.
+
+		Args:
+			position (int): The position of the rejection in the log.
+
+		Returns:
+			Rejection: The rejection.
+		"""
+		return Rejection(
+			self._indices[position],
+			self._symbols[self._currencies[position]],
+			self._requested[position],
+			self._available[position],
+		)
+
+	def clear(self) -> None:
+		"""
+		Forgets every recorded rejection.
+		"""
+		self.total = 0
+		del self._indices[:], self._currencies[:], self._requested[:], self._available[:]
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+	"""
+	The outcome of replaying transactions through `Wallet.process_transactions`.
+
+	Attributes:
+		processed (int): The number of transactions processed by the call.
+		accepted (int): The number of transactions applied by the call.
+		balance (dict[CurrencyEnum, float]): The wallet balance after the call.
+		rejections (RejectionLog): The wallet's rejection log.
+	"""
+
+	processed: int
+	accepted: int
+	balance: dict[CurrencyEnum, float]
+	rejections: RejectionLog
+
+	@property
+	def rejected(self) -> int:
+		"""
+		The number of withdrawals ignored by the call.
+
+		Returns:
+			int: The number of rejected transactions.
+		"""
+		return self.processed - self.accepted
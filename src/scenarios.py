@@ -0,0 +1,96 @@
+import os
+from collections.abc import Hashable, Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import NamedTuple, TypeVar
+
+from src.common.enums import CurrencyEnum
+from src.common.types import Transaction
+from src.wallet import Wallet
+
+DEFAULT_SCENARIOS_PER_TASK = 16
+"""Number of scenarios sent to a worker process at a time."""
+
+K = TypeVar("K", bound=Hashable)
+
+
+class ScenarioResult(NamedTuple):
+	"""
+	The outcome of one candidate tail applied on top of a shared history.
+
+	Attributes:
+		balance (dict[CurrencyEnum, float]): The balance after the tail.
+		rejected (tuple[int, ...]): The positions, within the tail, of the withdrawals skipped for insufficient funds.
+		processed (int): The number of tail transactions processed.
+	"""
+
+	balance: dict[CurrencyEnum, float]
+	rejected: tuple[int, ...]
+	processed: int
+
+
+def evaluate_scenario(base: Wallet, tail: Iterable[Transaction]) -> ScenarioResult:
+	"""
+	Applies a tail to a fork of the base wallet, leaving the base untouched.
+
+	Args:
+		base (Wallet): The wallet holding the shared history.
+		tail (Iterable[Transaction]): The transactions of the scenario.
+
+	Returns:
+		ScenarioResult: The balance and rejected positions of the scenario.
+	"""
+	wallet = base.fork()
+	process_transaction = wallet.process_transaction
+	rejected = []
+
+	for position, (wallet_action, currency, amount) in enumerate(tail):
+		if not process_transaction(wallet_action, currency, amount, verbose=False):
+			rejected.append(position)
+
+	return ScenarioResult(wallet.balance, tuple(rejected), wallet.transaction_count - base.transaction_count)
+
+
+def run_scenarios(  # noqa: UP047
+	base: Wallet,
+	scenarios: Mapping[K, Iterable[Transaction]],
+	*,
+	processes: int | None = 1,
+	scenarios_per_task: int = DEFAULT_SCENARIOS_PER_TASK,
+) -> dict[K, ScenarioResult]:
+	"""
+	Evaluates many candidate tails against the same history, each on its own fork of the base wallet.
+
+	The history is never replayed: each scenario costs a fork, which copies a few balances, plus its own tail.
+
+	Args:
+		base (Wallet): The wallet holding the shared history.
+		scenarios (Mapping[K, Iterable[Transaction]]): The tail of each scenario, by scenario name.
+		processes (int | None, optional): The number of worker processes, or None for the CPU count. Defaults to 1,
+			which evaluates the scenarios in-process.
+		scenarios_per_task (int, optional): The number of scenarios sent to a worker at a time. Defaults to `DEFAULT_SCENARIOS_PER_TASK`.
+
+	Returns:
+		dict[K, ScenarioResult]: The result of each scenario, in the order of `scenarios`.
+
+	Raises:
+		ValueError: If the number of processes or scenarios per task is not positive.
+	"""
+	if processes is None:
+		processes = os.cpu_count() or 1
+
+	if processes <= 0 or scenarios_per_task <= 0:
+		raise ValueError(f"Processes and scenarios per task must be positive: {processes}, {scenarios_per_task}")
+
+	# Workers receive a fork, which carries the balances but not the base's metrics, history or rejection log.
+	evaluate = partial(evaluate_scenario, base.fork())
+
+	if processes == 1:
+		results = map(evaluate, scenarios.values())
+		return dict(zip(scenarios, results, strict=True))
+
+	tails = [tail if isinstance(tail, (list, tuple)) else list(tail) for tail in scenarios.values()]
+
+	with ProcessPoolExecutor(max_workers=processes) as pool:
+		results = pool.map(evaluate, tails, chunksize=scenarios_per_task)
+		return dict(zip(scenarios, results, strict=True))
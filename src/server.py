@@ -0,0 +1,464 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import sys
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+
+from src.common.types import Transaction
+from src.streaming import parse_transaction
+from src.wallet import Wallet
+
+DEFAULT_QUEUE_SIZE = 10_000
+"""Number of parsed transactions waiting to be applied before readers stop reading from their sockets."""
+
+DEFAULT_BATCH_SIZE = 512
+"""Maximum number of transactions applied per micro-batch."""
+
+DEFAULT_MAX_DELAY = 0.001
+"""Seconds a micro-batch waits for more transactions once its first one has arrived."""
+
+DEFAULT_MAX_IN_FLIGHT = 1_024
+"""Number of unanswered transactions a single connection may have before its reader pauses."""
+
+ACCEPTED = b"OK\n"
+REJECTED = b"REJECTED\n"
+
+
+def parse_line(line: str) -> Transaction:
+	"""
+	Parses one line of the wire protocol.
+
+	A line is either `ACTION CURRENCY AMOUNT`, separated by spaces or commas, or a JSON object with `action`,
+	`currency` and `amount` keys.
+
+	Args:
+		line (str): The line to parse, without its newline.
+
+	Returns:
+		Transaction: The parsed transaction.
+
+	Raises:
+		ValueError: If the line does not hold exactly one valid transaction.
+	"""
+	line = line.strip()
+
+	if line.startswith("{"):
+		item = json.loads(line)
+		return parse_transaction(item["action"], item["currency"], item["amount"])
+
+	fields = line.replace(",", " ").split()
+
+	if len(fields) != 3:
+		raise ValueError(f"Expected 'ACTION CURRENCY AMOUNT', got {line!r}")
+
+	return parse_transaction(*fields)
+
+
+@dataclass
+class ServerStats:
+	"""
+	Counters maintained by a running `WalletServer`.
+
+	Attributes:
+		accepted (int): The number of transactions applied.
+		rejected (int): The number of withdrawals skipped for insufficient funds.
+		invalid (int): The number of lines that could not be parsed.
+		batches (int): The number of micro-batches applied.
+	"""
+
+	accepted: int = 0
+	rejected: int = 0
+	invalid: int = 0
+	batches: int = 0
+
+
+@dataclass
+class WalletServer:
+	"""
+	A long-running service applying newline-delimited transactions to a wallet.
+
+	Every connection gets one reply line per transaction, in order: `OK`, `REJECTED`, or `ERROR <reason>`. Parsed
+	transactions go through a bounded apply queue drained by a single task in micro-batches, so `Wallet` is only ever
+	touched from one place. When the queue is full, readers stop pulling from their sockets and the kernel buffers
+	push the backpressure down to the clients.
+
+	Attributes:
+		wallet (Wallet): The wallet transactions are applied to. Defaults to an empty wallet.
+		queue_size (int): The capacity of the apply queue. Defaults to `DEFAULT_QUEUE_SIZE`.
+		batch_size (int): The maximum number of transactions per micro-batch. Defaults to `DEFAULT_BATCH_SIZE`.
+		max_delay (float): Seconds a micro-batch waits to fill up. Defaults to `DEFAULT_MAX_DELAY`.
+		max_in_flight (int): Unanswered transactions allowed per connection. Defaults to `DEFAULT_MAX_IN_FLIGHT`.
+		stats (ServerStats): Counters about the transactions seen so far.
+	"""
+
+	wallet: Wallet = field(default_factory=lambda: Wallet(transaction_list=()))
+	queue_size: int = DEFAULT_QUEUE_SIZE
+	batch_size: int = DEFAULT_BATCH_SIZE
+	max_delay: float = DEFAULT_MAX_DELAY
+	max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+	stats: ServerStats = field(default_factory=ServerStats)
+
+	def __post_init__(self) -> None:
+		"""
+		Creates the apply queue.
+		"""
+		self.queue: asyncio.Queue[tuple[Transaction, asyncio.Future[bool]]] = asyncio.Queue(self.queue_size)
+
+	async def serve(self, host: str = "127.0.0.1", port: int = 8765, *, unix_path: str | None = None) -> None:
+		"""
+		Listens on a TCP port, or on a Unix socket, and applies transactions until cancelled.
+
+		Args:
+			host (str, optional): The TCP host to bind. Defaults to "127.0.0.1".
+			port (int, optional): The TCP port to bind. Defaults to 8765.
+			unix_path (str | None, optional): A Unix socket path to listen on instead of TCP. Defaults to None.
+		"""
+		if unix_path is not None:
+			server = await asyncio.start_unix_server(self.handle_connection, path=unix_path)
+
+		else:
+			server = await asyncio.start_server(self.handle_connection, host, port)
+
+		applier = asyncio.create_task(self.apply_forever())
+
+		try:
+			async with server:
+				await server.serve_forever()
+
+		finally:
+			applier.cancel()
+
+			with contextlib.suppress(asyncio.CancelledError):
+				await applier
+
+	async def apply_forever(self) -> None:
+		"""
+		Drains the apply queue in micro-batches until cancelled.
+		"""
+		loop = asyncio.get_running_loop()
+
+		while True:
+			batch = [await self.queue.get()]
+			deadline = loop.time() + self.max_delay
+
+			while len(batch) < self.batch_size:
+				if not self.queue.empty():
+					batch.append(self.queue.get_nowait())
+					continue
+
+				timeout = deadline - loop.time()
+
+				if timeout <= 0:
+					break
+
+				try:
+					batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+
+				except TimeoutError:
+					break
+
+			self.apply_batch(batch)
+
+	def apply_batch(self, batch: Sequence[tuple[Transaction, "asyncio.Future[bool]"]]) -> None:
+		"""
+		Applies a micro-batch to the wallet in arrival order and resolves each transaction's reply.
+
+		Args:
+			batch (Sequence[tuple[Transaction, asyncio.Future[bool]]]): The transactions and their pending replies.
+		"""
+		process_transaction = self.wallet.process_transaction
+
+		for (wallet_action, currency, amount), reply in batch:
+			try:
+				accepted = process_transaction(wallet_action, currency, amount, verbose=False)
+
+			except ValueError as e:
+				reply.set_exception(e)
+				continue
+
+			if accepted:
+				self.stats.accepted += 1
+
+			else:
+				self.stats.rejected += 1
+
+			reply.set_result(accepted)
+
+		self.stats.batches += 1
+
+	async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+		"""
+		Reads transactions from a connection and writes back one reply per line, in order.
+
+		If the client goes away while replies are pending, the responder stops writing and nothing drains the bounded
+		reply queue any more, so reading stops too instead of waiting on it forever.
+
+		Args:
+			reader (asyncio.StreamReader): The connection's input.
+			writer (asyncio.StreamWriter): The connection's output.
+		"""
+		replies: asyncio.Queue[asyncio.Future[bool] | None] = asyncio.Queue(self.max_in_flight)
+		responder = asyncio.create_task(self._respond(replies, writer))
+		receiver = asyncio.create_task(self._receive(reader, replies))
+
+		try:
+			await asyncio.wait((receiver, responder), return_when=asyncio.FIRST_COMPLETED)
+
+			if receiver.done() and not receiver.cancelled() and receiver.exception() is None:
+				await responder
+
+		finally:
+			receiver.cancel()
+			responder.cancel()
+
+			with contextlib.suppress(asyncio.CancelledError):
+				await responder
+
+			with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+				await receiver
+
+	async def _receive(self, reader: asyncio.StreamReader, replies: "asyncio.Queue[asyncio.Future[bool] | None]") -> None:
+		"""
+		Parses the lines of a connection, queueing each transaction for the applier and its reply for the responder.
+
+		A line longer than the reader's limit gets an `ERROR` reply and ends the input: the rest of that line can no
+		longer be told apart from the next request, so the connection is closed once the earlier replies are written.
+
+		Args:
+			reader (asyncio.StreamReader): The connection's input.
+			replies (asyncio.Queue[asyncio.Future[bool] | None]): The pending replies, ended with `None` at end of input.
+		"""
+		loop = asyncio.get_running_loop()
+
+		while True:
+			try:
+				raw = await reader.readline()
+
+			except ValueError as e:
+				self.stats.invalid += 1
+				reply = loop.create_future()
+				reply.set_exception(ValueError(f"Line too long: {e}"))
+				await replies.put(reply)
+				break
+
+			if not raw:
+				break
+
+			if not raw.strip():
+				continue
+
+			reply = loop.create_future()
+
+			try:
+				transaction = parse_line(raw.decode())
+
+			except Exception as e:
+				self.stats.invalid += 1
+				reply.set_exception(ValueError(str(e)))
+				await replies.put(reply)
+				continue
+
+			await replies.put(reply)
+			await self.queue.put((transaction, reply))
+
+		await replies.put(None)
+
+	@staticmethod
+	async def _respond(replies: "asyncio.Queue[asyncio.Future[bool] | None]", writer: asyncio.StreamWriter) -> None:
+		"""
+		Writes replies in request order until the end-of-connection marker.
+
+		Args:
+			replies (asyncio.Queue[asyncio.Future[bool] | None]): The pending replies, then `None`.
+			writer (asyncio.StreamWriter): The connection's output.
+		"""
+		try:
+			while (reply := await replies.get()) is not None:
+				try:
+					writer.write(ACCEPTED if await reply else REJECTED)
+
+				except ValueError as e:
+					writer.write(f"ERROR {e}\n".encode())
+
+				if replies.empty():
+					await writer.drain()
+
+		except ConnectionError:
+			pass
+
+		finally:
+			writer.close()
+
+			with contextlib.suppress(ConnectionError):
+				await writer.wait_closed()
+
+
+@dataclass(frozen=True)
+class LoadReport:
+	"""
+	Latency and throughput measured by `run_load`.
+
+	Attributes:
+		transactions (int): The number of transactions sent.
+		accepted (int): The number of `OK` replies.
+		rejected (int): The number of `REJECTED` replies.
+		errors (int): The number of `ERROR` replies.
+		seconds (float): The wall time of the run.
+		throughput (float): Transactions per second.
+		p50_ms (float): The median round-trip latency, in milliseconds.
+		p99_ms (float): The 99th percentile round-trip latency, in milliseconds.
+	"""
+
+	transactions: int
+	accepted: int
+	rejected: int
+	errors: int
+	seconds: float
+	throughput: float
+	p50_ms: float
+	p99_ms: float
+
+
+async def run_load(  # noqa: PLR0913
+	host: str = "127.0.0.1",
+	port: int = 8765,
+	*,
+	unix_path: str | None = None,
+	connections: int = 8,
+	transactions: int = 100_000,
+	window: int = 256,
+) -> LoadReport:
+	"""
+	Generates load against a `WalletServer` and measures round-trip latency per transaction.
+
+	Each connection pipelines up to `window` unanswered transactions, alternating deposits and withdrawals over every
+	currency so that both replies are exercised.
+
+	Args:
+		host (str, optional): The TCP host to connect to. Defaults to "127.0.0.1".
+		port (int, optional): The TCP port to connect to. Defaults to 8765.
+		unix_path (str | None, optional): A Unix socket path to connect to instead of TCP. Defaults to None.
+		connections (int, optional): The number of concurrent connections. Defaults to 8.
+		transactions (int, optional): The total number of transactions to send. Defaults to 100_000.
+		window (int, optional): The number of unanswered transactions per connection. Defaults to 256.
+
+	Returns:
+		LoadReport: The measured latency and throughput.
+	"""
+	currencies = ("BTC", "ETH", "USD")
+	latencies: list[float] = []
+	replies: dict[bytes, int] = {}
+
+	async def connection(count: int) -> None:
+		if unix_path is not None:
+			reader, writer = await asyncio.open_unix_connection(unix_path)
+
+		else:
+			reader, writer = await asyncio.open_connection(host, port)
+
+		sent: asyncio.Queue[float] = asyncio.Queue(window)
+
+		async def send() -> None:
+			for i in range(count):
+				action = "WITHDRAW" if i % 3 == 2 else "DEPOSIT"
+				await sent.put(time.perf_counter())
+				writer.write(f"{action} {currencies[i % 3]} {1 + i % 5}\n".encode())
+
+				if sent.full():
+					await writer.drain()
+
+			await writer.drain()
+
+		sender = asyncio.create_task(send())
+
+		for _ in range(count):
+			line = await reader.readline()
+			latencies.append(time.perf_counter() - await sent.get())
+			status = line.split(b" ", 1)[0].strip()
+			replies[status] = replies.get(status, 0) + 1
+
+		await sender
+		writer.close()
+		await writer.wait_closed()
+
+	start = time.perf_counter()
+	share, extra = divmod(transactions, connections)
+	await asyncio.gather(*(connection(share + (i < extra)) for i in range(connections)))
+	seconds = time.perf_counter() - start
+
+	latencies.sort()
+
+	return LoadReport(
+		transactions=transactions,
+		accepted=replies.get(b"OK", 0),
+		rejected=replies.get(b"REJECTED", 0),
+		errors=replies.get(b"ERROR", 0),
+		seconds=seconds,
+		throughput=transactions / seconds if seconds else 0.0,
+		p50_ms=_percentile(latencies, 0.50) * 1_000,
+		p99_ms=_percentile(latencies, 0.99) * 1_000,
+	)
+
+
+def _percentile(ordered: Sequence[float], q: float) -> float:
+	"""
+	Returns the nearest-rank percentile of sorted values.
+
+	Args:
+		ordered (Sequence[float]): The values, in ascending order.
+		q (float): The percentile, between 0 and 1.
+
+	Returns:
+		float: The percentile, or 0 when there are no values.
+	"""
+	if not ordered:
+		return 0.0
+
+	return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def main() -> None:
+	"""
+	Runs the server, or the load generator against it, from the command line.
+	"""
+	parser = argparse.ArgumentParser(description="Wallet transaction-ingestion server and load generator.")
+	parser.add_argument("mode", choices=["serve", "load"])
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=8765)
+	parser.add_argument("--unix", dest="unix_path", default=None, help="Unix socket path to use instead of TCP.")
+	parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE)
+	parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+	parser.add_argument("--max-delay", type=float, default=DEFAULT_MAX_DELAY)
+	parser.add_argument("--connections", type=int, default=8)
+	parser.add_argument("--transactions", type=int, default=100_000)
+	parser.add_argument("--window", type=int, default=256)
+	args = parser.parse_args()
+
+	if args.mode == "serve":
+		server = WalletServer(queue_size=args.queue_size, batch_size=args.batch_size, max_delay=args.max_delay)
+
+		with contextlib.suppress(KeyboardInterrupt):
+			asyncio.run(server.serve(args.host, args.port, unix_path=args.unix_path))
+
+		sys.stdout.write(json.dumps({"stats": asdict(server.stats), "balance": server.wallet.balance}) + "\n")
+		return
+
+	report = asyncio.run(
+		run_load(
+			args.host,
+			args.port,
+			unix_path=args.unix_path,
+			connections=args.connections,
+			transactions=args.transactions,
+			window=args.window,
+		),
+	)
+
+	sys.stdout.write(json.dumps(asdict(report)) + "\n")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,229 @@
+import json
+import os
+import pathlib
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+
+from src.asset_wallet import AssetWallet
+from src.binary_ledger import BinaryLedger
+from src.common.enums import CurrencyEnum
+from src.common.types import AssetRegistry, Transaction, TransactionBatch
+from src.fixed_point import FixedPointWallet
+from src.wallet import Wallet
+
+SNAPSHOT_VERSION = 1
+"""Version of the snapshot document written by `WalletSnapshot.save`."""
+
+
+@dataclass(frozen=True)
+class WalletSnapshot:
+	"""
+	The state of a wallet after replaying a prefix of a ledger.
+
+	Attributes:
+		state (dict[CurrencyEnum | str, float | int]): The balance of each currency, in minor units for `minor_units`.
+		offset (int): The number of ledger transactions already applied to `state`.
+		assets (AssetRegistry | None): The registry of the captured `AssetWallet`, or None for a plain `Wallet`.
+			Defaults to None.
+		minor_units (bool): Whether `state` holds the exact integer balances of a `FixedPointWallet`. Defaults to False.
+	"""
+
+	state: dict[CurrencyEnum | str, float | int]
+	offset: int
+	assets: AssetRegistry | None = field(default=None, repr=False, compare=False)
+	minor_units: bool = False
+
+	@classmethod
+	def from_wallet(cls, wallet: Wallet) -> "WalletSnapshot":
+		"""
+		Captures the current state of a wallet.
+
+		Args:
+			wallet (Wallet): The wallet to capture.
+
+		Returns:
+			WalletSnapshot: The snapshot, with the wallet's processed transaction count as offset.
+		"""
+		return cls(
+			state=dict(wallet.state),
+			offset=wallet.transaction_count,
+			assets=getattr(wallet, "assets", None),
+			minor_units=isinstance(wallet, FixedPointWallet),
+		)
+
+	def to_dict(self) -> dict:
+		"""
+		Serializes the snapshot into plain JSON types. Floats are kept exact, since JSON round-trips their repr, and so
+		are minor units, written as JSON integers.
+
+		Returns:
+			dict: The serialized snapshot.
+		"""
+		data = {
+			"version": SNAPSHOT_VERSION,
+			"offset": self.offset,
+			"state": {str(currency): amount for currency, amount in self.state.items()},
+		}
+
+		if self.minor_units:
+			data["minor_units"] = True
+
+		return data
+
+	@classmethod
+	def from_dict(cls, data: dict, assets: AssetRegistry | None = None) -> "WalletSnapshot":
+		"""
+		Deserializes a snapshot produced by `to_dict`.
+
+		Args:
+			data (dict): The serialized snapshot.
+			assets (AssetRegistry | None, optional): The registry to resolve the symbols through, restoring into an
+				`AssetWallet`. Defaults to None, for the built-in currencies and a plain `Wallet`.
+
+		Returns:
+			WalletSnapshot: The snapshot.
+
+		Raises:
+			ValueError: If the document is not a supported snapshot, holds an asset the registry does not know, or holds
+				minor units that are not integers.
+		"""
+		if data.get("version") != SNAPSHOT_VERSION:
+			raise ValueError(f"Unsupported snapshot version: {data.get('version')}")
+
+		offset = int(data["offset"])
+
+		if offset < 0:
+			raise ValueError(f"Snapshot offset must not be negative: {offset}")
+
+		registry = AssetRegistry() if assets is None else assets
+		minor_units = data.get("minor_units", False) is True
+		state = {}
+
+		for currency, amount in data["state"].items():
+			if currency not in registry:
+				raise ValueError(f"Unsupported currency in snapshot: {currency}")
+
+			if minor_units and (not isinstance(amount, int) or isinstance(amount, bool)):
+				raise ValueError(f"Snapshot balance of {currency} must be an integer number of minor units: {amount!r}")
+
+			state[registry.symbols[registry.resolve(currency)]] = amount if minor_units else float(amount)
+
+		return cls(state=state, offset=offset, assets=assets, minor_units=minor_units)
+
+	def save(self, path: str | pathlib.Path) -> None:
+		"""
+		Writes the snapshot to a JSON file atomically, so a crash never leaves a partial snapshot behind.
+
+		The directory is synced after the rename, so the new snapshot is durable once this returns.
+
+		Args:
+			path (str | pathlib.Path): The file to write.
+		"""
+		path = pathlib.Path(path)
+		tmp = path.with_name(f"{path.name}.tmp")
+
+		with tmp.open("w", encoding="utf-8") as f:
+			json.dump(self.to_dict(), f)
+			f.flush()
+			os.fsync(f.fileno())
+
+		tmp.replace(path)
+		_sync_directory(path.parent)
+
+	@classmethod
+	def load(cls, path: str | pathlib.Path, assets: AssetRegistry | None = None) -> "WalletSnapshot":
+		"""
+		Reads a snapshot written by `save`.
+
+		Args:
+			path (str | pathlib.Path): The file to read.
+			assets (AssetRegistry | None, optional): The registry to resolve the symbols through, as in `from_dict`.
+				Defaults to None.
+
+		Returns:
+			WalletSnapshot: The snapshot.
+		"""
+		with pathlib.Path(path).open("r", encoding="utf-8") as f:
+			return cls.from_dict(json.load(f), assets)
+
+	def restore(self) -> Wallet:
+		"""
+		Rebuilds the wallet captured by the snapshot, without replaying anything.
+
+		Returns:
+			Wallet: A wallet with the snapshot's balances and transaction count: a `FixedPointWallet` for minor units, an
+				`AssetWallet` on the snapshot's registry if it has one, and a plain `Wallet` otherwise.
+		"""
+		if self.minor_units:
+			return FixedPointWallet(transaction_list=(), state=defaultdict(int, self.state), transaction_count=self.offset)
+
+		if self.assets is not None:
+			return AssetWallet(transaction_list=(), state=dict(self.state), transaction_count=self.offset, assets=self.assets)
+
+		return Wallet(transaction_list=(), state=defaultdict(float, self.state), transaction_count=self.offset)
+
+
+def _sync_directory(directory: pathlib.Path) -> None:
+	"""
+	Flushes a directory's entries, such as a rename, to disk.
+
+	Args:
+		directory (pathlib.Path): The directory to sync.
+	"""
+	# Windows cannot open a directory, and its file system persists renames without it.
+	if os.name == "nt":
+		return
+
+	fd = os.open(directory, os.O_RDONLY)
+
+	try:
+		os.fsync(fd)
+
+	finally:
+		os.close(fd)
+
+
+def resume(snapshot: WalletSnapshot, ledger: Iterable[Transaction], *, verbose: bool | None = None) -> Wallet:
+	"""
+	Restores a wallet from a snapshot and applies only the part of the ledger after the snapshot's offset.
+
+	The result is identical to a full replay of the ledger, as long as the snapshot was taken from a prefix of it.
+
+	Args:
+		snapshot (WalletSnapshot): The snapshot to start from.
+		ledger (Iterable[Transaction]): The full ledger, including the prefix already applied to the snapshot.
+		verbose (bool | None, optional): Whether to print warnings for skipped withdrawals. Defaults to the wallet's `verbose`.
+
+	Returns:
+		Wallet: The wallet after the whole ledger.
+
+	Raises:
+		ValueError: If the ledger is shorter than the snapshot's offset.
+	"""
+	wallet = snapshot.restore()
+
+	if isinstance(ledger, (Sequence, BinaryLedger, TransactionBatch)):
+		if len(ledger) < snapshot.offset:
+			raise ValueError(f"Ledger has {len(ledger)} transactions, but the snapshot was taken after {snapshot.offset}")
+
+		# Slicing a binary ledger is a zero-copy view and slicing a batch copies only its tail columns, so neither decodes
+		# the prefix; index access keeps other sequences from being copied.
+		if isinstance(ledger, (BinaryLedger, TransactionBatch)):
+			tail = ledger[snapshot.offset :]
+
+		else:
+			tail = map(ledger.__getitem__, range(snapshot.offset, len(ledger)))
+
+	else:
+		iterator = iter(ledger)
+		skipped = sum(1 for _ in islice(iterator, snapshot.offset))
+
+		if skipped < snapshot.offset:
+			raise ValueError(f"Ledger has {skipped} transactions, but the snapshot was taken after {snapshot.offset}")
+
+		tail = iterator
+
+	wallet.process_transactions(tail, verbose=verbose)
+	return wallet
@@ -0,0 +1,449 @@
+import csv
+import json
+import pathlib
+import re
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from typing import Any, TextIO, TypeVar
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry, Transaction, TransactionBatch
+from src.wallet import Wallet
+
+DEFAULT_CHUNK_SIZE = 10_000
+"""Number of transactions parsed and applied per step of a streaming replay."""
+
+DEFAULT_READ_SIZE = 1 << 16
+"""Number of characters read from a JSON file at a time."""
+
+DEFAULT_MAX_ITEM_SIZE = 1 << 20
+"""Largest number of characters a JSON array item may span, which bounds the memory used on malformed input."""
+
+FORMATS = ("csv", "json", "ndjson")
+"""File formats understood by `iter_transactions`."""
+
+_WHITESPACE = re.compile(r"\s*")
+
+_LONGEST_TOKEN = 16
+"""Characters at the end of a buffer where a cut literal, such as `-Infinity`, or escape, such as `\\ud83d`, fails to decode."""
+
+TransactionParser = Callable[[str, str, str | float], Transaction]
+"""Turns the raw action, currency and amount fields of a row into a transaction, like `parse_transaction`."""
+
+T = TypeVar("T")
+
+
+def parse_transaction(action: str, currency: str, amount: str | float) -> Transaction:
+	"""
+	Parses and validates the raw fields of a single transaction.
+
+	Args:
+		action (str): The wallet action name, case-insensitive.
+		currency (str): The currency name, case-insensitive.
+		amount (str | float): The amount, as a number or numeric string.
+
+	Returns:
+		Transaction: The parsed transaction.
+
+	Raises:
+		ValueError: If the amount is not positive.
+	"""
+	wallet_action = WalletActionEnum[str(action).strip().upper()]
+	currency = CurrencyEnum[str(currency).strip().upper()]
+	amount = float(amount)
+
+	if amount <= 0:
+		raise ValueError("Amount must be positive.")
+
+	return Transaction(wallet_action, currency, amount)
+
+
+def iter_csv(path: str | pathlib.Path, *, parse: TransactionParser = parse_transaction) -> Iterator[Transaction]:
+	"""
+	Lazily parses a CSV file with `action,currency,amount` headers.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		parse (TransactionParser, optional): Builds each transaction from its raw fields. Defaults to `parse_transaction`.
+
+	Yields:
+		Transaction: Each transaction, in file order.
+
+	Raises:
+		ValueError: If the headers are missing or a row is invalid. Rows are numbered as file lines.
+	"""
+	with pathlib.Path(path).open("r", newline="", encoding="utf-8") as f:
+		reader = csv.reader(f)
+		header = [h.strip().lower() for h in next(reader, [])]
+
+		try:
+			columns = [header.index(name) for name in ("action", "currency", "amount")]
+
+		except ValueError as e:
+			raise ValueError("CSV must include headers: action,currency,amount") from e
+
+		action_col, currency_col, amount_col = columns
+
+		for i, row in enumerate(reader, start=2):
+			# Blank lines, including a trailing CRLF one, are skipped as `csv.DictReader` does.
+			if not row:
+				continue
+
+			try:
+				yield parse(row[action_col], row[currency_col], row[amount_col])
+
+			except Exception as e:
+				raise ValueError(f"Invalid row {i}: {e}") from e
+
+
+def iter_json(
+	path: str | pathlib.Path,
+	*,
+	parse: TransactionParser = parse_transaction,
+	read_size: int = DEFAULT_READ_SIZE,
+	max_item_size: int = DEFAULT_MAX_ITEM_SIZE,
+) -> Iterator[Transaction]:
+	"""
+	Lazily parses a JSON array of `{"action", "currency", "amount"}` objects without loading the whole document.
+
+	Decimal amounts reach `parse` as their original text, so exact parsers never see a rounded float.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		parse (TransactionParser, optional): Builds each transaction from its raw fields. Defaults to `parse_transaction`.
+		read_size (int, optional): The number of characters read at a time. Defaults to `DEFAULT_READ_SIZE`.
+		max_item_size (int, optional): The largest number of characters an item may span. Defaults to `DEFAULT_MAX_ITEM_SIZE`.
+
+	Yields:
+		Transaction: Each transaction, in file order.
+
+	Raises:
+		ValueError: If an item is invalid. Items are numbered from 1.
+	"""
+	with pathlib.Path(path).open("r", encoding="utf-8") as f:
+		for i, item in enumerate(_iter_json_array(f, read_size, max_item_size), start=1):
+			try:
+				yield parse(item["action"], item["currency"], item["amount"])
+
+			except Exception as e:
+				raise ValueError(f"Invalid item at index {i}: {e}") from e
+
+
+def iter_ndjson(path: str | pathlib.Path, *, parse: TransactionParser = parse_transaction) -> Iterator[Transaction]:
+	"""
+	Lazily parses newline-delimited JSON, one transaction object per line. Blank lines are skipped.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		parse (TransactionParser, optional): Builds each transaction from its raw fields. Defaults to `parse_transaction`.
+
+	Yields:
+		Transaction: Each transaction, in file order.
+
+	Raises:
+		ValueError: If a line is invalid. Lines are numbered from 1.
+	"""
+	with pathlib.Path(path).open("r", encoding="utf-8") as f:
+		for i, line in enumerate(f, start=1):
+			if not line.strip():
+				continue
+
+			try:
+				item = json.loads(line, parse_float=str)
+				yield parse(item["action"], item["currency"], item["amount"])
+
+			except Exception as e:
+				raise ValueError(f"Invalid line {i}: {e}") from e
+
+
+def detect_format(path: str | pathlib.Path) -> str:
+	"""
+	Guesses the format of a transactions file from its extension, or from its first character.
+
+	Args:
+		path (str | pathlib.Path): The file to inspect.
+
+	Returns:
+		str: One of `FORMATS`.
+	"""
+	path = pathlib.Path(path)
+	ext = path.suffix.lower().lstrip(".")
+
+	if ext in FORMATS:
+		return ext
+
+	if ext == "jsonl":
+		return "ndjson"
+
+	with path.open("r", encoding="utf-8") as f:
+		head = f.read(1)
+
+	if head == "[":
+		return "json"
+
+	if head == "{":
+		return "ndjson"
+
+	return "csv"
+
+
+def iter_transactions(
+	path: str | pathlib.Path,
+	fmt: str | None = None,
+	*,
+	parse: TransactionParser = parse_transaction,
+) -> Iterator[Transaction]:
+	"""
+	Lazily parses a transactions file in any supported format.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		fmt (str | None, optional): One of `FORMATS`. Defaults to detecting it with `detect_format`.
+		parse (TransactionParser, optional): Builds each transaction from its raw fields. Defaults to `parse_transaction`.
+
+	Returns:
+		Iterator[Transaction]: The transactions, in file order.
+
+	Raises:
+		ValueError: If the format is not supported.
+	"""
+	fmt = fmt or detect_format(path)
+
+	if fmt == "csv":
+		return iter_csv(path, parse=parse)
+
+	if fmt == "json":
+		return iter_json(path, parse=parse)
+
+	if fmt == "ndjson":
+		return iter_ndjson(path, parse=parse)
+
+	raise ValueError(f"Unsupported format: {fmt}")
+
+
+def load_batch(
+	path: str | pathlib.Path,
+	fmt: str | None = None,
+	*,
+	parse: TransactionParser = parse_transaction,
+	assets: AssetRegistry | None = None,
+) -> TransactionBatch:
+	"""
+	Parses a whole transactions file into a compact `TransactionBatch`, never holding more than one parsed row.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		fmt (str | None, optional): One of `FORMATS`. Defaults to detecting it with `detect_format`.
+		parse (TransactionParser, optional): Builds each transaction from its raw fields. Defaults to `parse_transaction`,
+			or to the registry's `parse_transaction` when `assets` is given.
+		assets (AssetRegistry | None, optional): The registry to resolve and encode assets with. Defaults to the built-in currencies.
+
+	Returns:
+		TransactionBatch: The transactions, in file order.
+	"""
+	if assets is not None and parse is parse_transaction:
+		parse = assets.parse_transaction
+
+	return TransactionBatch.from_transactions(iter_transactions(path, fmt, parse=parse), assets=assets)
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[list[T]]:  # noqa: UP047
+	"""
+	Splits an iterable into lists of at most `size` items without materializing it.
+
+	Args:
+		iterable (Iterable[T]): The items to split.
+		size (int): The maximum number of items per chunk.
+
+	Yields:
+		list[T]: Each chunk, in order.
+
+	Raises:
+		ValueError: If the size is not positive.
+	"""
+	if size <= 0:
+		raise ValueError(f"Chunk size must be positive: {size}")
+
+	iterator = iter(iterable)
+
+	while chunk := list(islice(iterator, size)):
+		yield chunk
+
+
+def stream_into_wallet(  # noqa: PLR0913
+	path: str | pathlib.Path,
+	wallet: Wallet | None = None,
+	*,
+	fmt: str | None = None,
+	chunk_size: int = DEFAULT_CHUNK_SIZE,
+	parse: TransactionParser = parse_transaction,
+	verbose: bool | None = None,
+) -> Wallet:
+	"""
+	Replays a transactions file into a wallet, holding at most one chunk of parsed transactions in memory.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+		wallet (Wallet | None, optional): The wallet to apply the transactions to. Defaults to a new, empty wallet.
+		fmt (str | None, optional): One of `FORMATS`. Defaults to detecting it with `detect_format`.
+		chunk_size (int, optional): The number of transactions parsed and applied per step. Defaults to `DEFAULT_CHUNK_SIZE`.
+		parse (TransactionParser, optional): Builds each transaction from its raw fields. Defaults to `parse_transaction`.
+		verbose (bool | None, optional): Whether to print warnings for skipped withdrawals. Defaults to the wallet's `verbose`.
+
+	Returns:
+		Wallet: The wallet, with every transaction in the file applied.
+	"""
+	if wallet is None:
+		wallet = Wallet(transaction_list=())
+
+	for chunk in chunked(iter_transactions(path, fmt, parse=parse), chunk_size):
+		wallet.process_transactions(chunk, verbose=verbose)
+
+	return wallet
+
+
+class _JsonArrayReader:
+	"""
+	Incrementally decodes the items of a top-level JSON array from a text file.
+
+	Attributes:
+		file (TextIO): The file to read from.
+		read_size (int): The number of characters read at a time.
+		max_item_size (int): The largest number of characters a value may span.
+	"""
+
+	def __init__(self, file: TextIO, read_size: int, max_item_size: int = DEFAULT_MAX_ITEM_SIZE) -> None:
+		self.file = file
+		self.read_size = read_size
+		self.max_item_size = max_item_size
+		self.decoder = json.JSONDecoder(parse_float=str)
+		self.buffer = ""
+		self.pos = 0
+
+	def _fill(self) -> bool:
+		"""
+		Reads the next block of the file, dropping the part of the buffer that was already consumed.
+
+		Returns:
+			bool: Whether anything was read.
+		"""
+		block = self.file.read(self.read_size)
+
+		if not block:
+			return False
+
+		self.buffer = self.buffer[self.pos :] + block
+		self.pos = 0
+		return True
+
+	def peek(self) -> str:
+		"""
+		Skips whitespace and returns the next character without consuming it.
+
+		Returns:
+			str: The next character, or an empty string at the end of the file.
+		"""
+		while True:
+			self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+
+			if self.pos < len(self.buffer):
+				return self.buffer[self.pos]
+
+			if not self._fill():
+				return ""
+
+	def advance(self) -> None:
+		"""
+		Consumes the character returned by `peek`.
+		"""
+		self.pos += 1
+
+	def decode(self) -> Any:  # noqa: ANN401
+		"""
+		Decodes the next JSON value, reading more of the file while the value is incomplete.
+
+		Returns:
+			Any: The decoded value.
+
+		Raises:
+			json.JSONDecodeError: If the value is malformed.
+			ValueError: If the value is still incomplete after `max_item_size` characters.
+		"""
+		while True:
+			self.peek()
+
+			try:
+				value, end = self.decoder.raw_decode(self.buffer, self.pos)
+
+			except json.JSONDecodeError as e:
+				# Only a value cut by the end of the buffer fails there, or in a string left open; any other error is final.
+				if not _truncated(e):
+					raise
+
+				if len(self.buffer) - self.pos > self.max_item_size:
+					raise ValueError(f"JSON value at character {e.pos} spans more than {self.max_item_size} characters") from e
+
+				if self._fill():
+					continue
+
+				raise
+
+			# A value ending exactly at the buffer boundary may be a truncated number, so decode it again with more input.
+			if end == len(self.buffer) and self._fill():
+				continue
+
+			self.pos = end
+			return value
+
+
+def _truncated(error: json.JSONDecodeError) -> bool:
+	"""
+	Tells whether a decoding error may come from a value cut short, rather than from malformed input.
+
+	Args:
+		error (json.JSONDecodeError): The error raised while decoding a buffer.
+
+	Returns:
+		bool: Whether the error is within the last characters of the buffer, where a literal, number or escape may have
+			been cut, or is an unterminated string.
+	"""
+	return error.pos >= len(error.doc) - _LONGEST_TOKEN or error.msg.startswith("Unterminated string")
+
+
+def _iter_json_array(file: TextIO, read_size: int, max_item_size: int = DEFAULT_MAX_ITEM_SIZE) -> Iterator[Any]:
+	"""
+	Lazily yields the items of a top-level JSON array.
+
+	Args:
+		file (TextIO): The file to read from.
+		read_size (int): The number of characters read at a time.
+		max_item_size (int, optional): The largest number of characters an item may span. Defaults to `DEFAULT_MAX_ITEM_SIZE`.
+
+	Yields:
+		Any: Each decoded item, in order.
+
+	Raises:
+		TypeError: If the document is not an array.
+		ValueError: If the array is malformed.
+	"""
+	reader = _JsonArrayReader(file, read_size, max_item_size)
+
+	if reader.peek() != "[":
+		raise TypeError("JSON must be a list of transactions.")
+
+	reader.advance()
+
+	if reader.peek() == "]":
+		return
+
+	while True:
+		yield reader.decode()
+
+		separator = reader.peek()
+		reader.advance()
+
+		if separator == "]":
+			return
+
+		if separator != ",":
+			raise ValueError(f"Malformed JSON array: expected ',' or ']' but found {separator or 'end of file'!r}")
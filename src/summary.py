@@ -0,0 +1,147 @@
+import heapq
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.wallet import Wallet
+
+DEFAULT_TOP_N = 10
+"""Number of largest transactions kept per currency by a `LedgerSummary`."""
+
+
+class LargeTransaction(NamedTuple):
+	"""
+	One of the largest transactions of a currency.
+
+	Attributes:
+		amount (float): The amount transacted.
+		index (int): The position of the transaction among those processed by the wallet.
+		wallet_action (WalletActionEnum): The action performed.
+		accepted (bool): Whether the transaction was applied.
+	"""
+
+	amount: float
+	index: int
+	wallet_action: WalletActionEnum
+	accepted: bool
+
+
+@dataclass
+class LedgerSummary:
+	"""
+	Aggregated statistics of a ledger, updated one transaction at a time in constant memory.
+
+	Attributes:
+		top_n (int): The number of largest transactions kept per currency. Defaults to `DEFAULT_TOP_N`.
+		count (int): The number of transactions seen.
+		counts (dict[tuple[WalletActionEnum, CurrencyEnum], int]): The number of transactions per action and currency.
+		totals (dict[tuple[WalletActionEnum, CurrencyEnum], float]): The amount requested per action and currency.
+		rejected (dict[CurrencyEnum, int]): The number of withdrawals skipped for insufficient funds per currency.
+		rejected_totals (dict[CurrencyEnum, float]): The amount of the skipped withdrawals per currency.
+	"""
+
+	top_n: int = DEFAULT_TOP_N
+	count: int = 0
+	counts: dict[tuple[WalletActionEnum, CurrencyEnum], int] = field(default_factory=dict)
+	totals: dict[tuple[WalletActionEnum, CurrencyEnum], float] = field(default_factory=dict)
+	rejected: dict[CurrencyEnum, int] = field(default_factory=dict)
+	rejected_totals: dict[CurrencyEnum, float] = field(default_factory=dict)
+	_largest: dict[CurrencyEnum, list[LargeTransaction]] = field(default_factory=dict, repr=False)
+
+	def add(self, index: int, wallet_action: WalletActionEnum, currency: CurrencyEnum, amount: float, *, accepted: bool) -> None:
+		"""
+		Accounts for one processed transaction.
+
+		Args:
+			index (int): The position of the transaction among those processed by the wallet.
+			wallet_action (WalletActionEnum): The action performed.
+			currency (CurrencyEnum): The currency transacted.
+			amount (float): The amount transacted.
+			accepted (bool): Whether the transaction was applied.
+		"""
+		key = (wallet_action, currency)
+		self.count += 1
+		self.counts[key] = self.counts.get(key, 0) + 1
+		self.totals[key] = self.totals.get(key, 0.0) + amount
+
+		if not accepted:
+			self.rejected[currency] = self.rejected.get(currency, 0) + 1
+			self.rejected_totals[currency] = self.rejected_totals.get(currency, 0.0) + amount
+
+		if self.top_n <= 0:
+			return
+
+		heap = self._largest.setdefault(currency, [])
+
+		# The heap root is the smallest of the current top N, so most transactions cost a single comparison.
+		if len(heap) < self.top_n:
+			heapq.heappush(heap, LargeTransaction(amount, index, wallet_action, accepted))
+
+		elif amount > heap[0].amount:
+			heapq.heapreplace(heap, LargeTransaction(amount, index, wallet_action, accepted))
+
+	def largest(self, currency: CurrencyEnum) -> list[LargeTransaction]:
+		"""
+		Returns the largest transactions of a currency.
+
+		Args:
+			currency (CurrencyEnum): The currency.
+
+		Returns:
+			list[LargeTransaction]: Up to `top_n` transactions, largest first.
+		"""
+		return sorted(self._largest.get(currency, ()), key=lambda tx: (-tx.amount, tx.index))
+
+	def to_dict(self) -> dict:
+		"""
+		Exports the summary as plain JSON types.
+
+		Returns:
+			dict: The exported summary.
+		"""
+		return {
+			"count": self.count,
+			"transactions": {
+				f"{action.value}:{currency}": {"count": count, "total": self.totals[action, currency]}
+				for (action, currency), count in self.counts.items()
+			},
+			"rejected_withdrawals": {
+				str(currency): {"count": count, "total": self.rejected_totals[currency]} for currency, count in self.rejected.items()
+			},
+			"largest": {
+				str(currency): [tx._asdict() | {"wallet_action": tx.wallet_action.value} for tx in self.largest(currency)]
+				for currency in self._largest
+			},
+		}
+
+
+def summarize(
+	transactions: Iterable[Transaction],
+	wallet: Wallet,
+	*,
+	top_n: int = DEFAULT_TOP_N,
+	validated: bool = False,
+) -> LedgerSummary:
+	"""
+	Replays transactions into a wallet and summarizes them in the same pass.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions to replay.
+		wallet (Wallet): The wallet to apply them to.
+		top_n (int, optional): The number of largest transactions kept per currency. Defaults to `DEFAULT_TOP_N`.
+		validated (bool, optional): Whether the transactions were already validated, for instance by the parser, so
+			they take the same fast path as `Wallet.process_transactions(..., validated=True)`. Defaults to False.
+
+	Returns:
+		LedgerSummary: The summary of the replayed transactions.
+	"""
+	summary = LedgerSummary(top_n=top_n)
+	process_transaction, add = wallet.processor(validated=validated), summary.add
+
+	for wallet_action, currency, amount in transactions:
+		index = wallet.transaction_count
+		add(index, wallet_action, currency, amount, accepted=process_transaction(wallet_action, currency, amount))
+
+	return summary
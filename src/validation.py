@@ -0,0 +1,160 @@
+from collections.abc import Iterable
+from typing import NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from src.common.enums import CURRENCIES, CURRENCY_CODES, WALLET_ACTION_CODES, WALLET_ACTIONS
+from src.common.types import Transaction
+
+MAX_REPORTED_ROWS = 10
+"""Number of invalid rows spelled out in a `BatchValidationError` message; every row stays available in `errors`."""
+
+
+class InvalidRow(NamedTuple):
+	"""
+	A transaction rejected by bulk validation.
+
+	Attributes:
+		index (int): The position of the transaction in the batch.
+		reason (str): Why the transaction is invalid.
+	"""
+
+	index: int
+	reason: str
+
+
+class BatchValidationError(ValueError):
+	"""
+	Raised when a batch contains invalid transactions, listing every one of them.
+
+	Attributes:
+		errors (list[InvalidRow]): The invalid transactions, in batch order.
+	"""
+
+	def __init__(self, errors: list[InvalidRow]) -> None:
+		"""
+		Builds the message from the first `MAX_REPORTED_ROWS` invalid transactions.
+
+		Args:
+			errors (list[InvalidRow]): The invalid transactions, in batch order.
+		"""
+		self.errors = errors
+		details = "; ".join(f"row {index}: {reason}" for index, reason in errors[:MAX_REPORTED_ROWS])
+		more = f"; and {len(errors) - MAX_REPORTED_ROWS} more" if len(errors) > MAX_REPORTED_ROWS else ""
+		super().__init__(f"{len(errors)} invalid transactions: {details}{more}")
+
+
+def find_invalid_rows(transactions: Iterable[Transaction]) -> list[InvalidRow]:
+	"""
+	Checks every transaction of a batch against the supported actions, currencies and amounts.
+
+	Membership is tested with the precomputed code tables, so each row costs two dictionary lookups and one comparison.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions to check.
+
+	Returns:
+		list[InvalidRow]: The invalid transactions, in batch order. Empty when the whole batch is valid.
+	"""
+	errors = []
+
+	for index, transaction in enumerate(transactions):
+		try:
+			wallet_action, currency, amount = transaction
+
+		except (TypeError, ValueError):
+			errors.append(InvalidRow(index, f"Malformed transaction: {transaction!r}"))
+			continue
+
+		if wallet_action not in WALLET_ACTION_CODES:
+			errors.append(InvalidRow(index, f"Unsupported wallet action: {wallet_action}"))
+
+		elif currency not in CURRENCY_CODES:
+			errors.append(InvalidRow(index, f"Unsupported currency: {currency}"))
+
+		else:
+			try:
+				positive = amount > 0
+
+			except TypeError:
+				positive = False
+
+			if not positive:
+				errors.append(InvalidRow(index, f"Amount must be positive: {amount}"))
+
+	return errors
+
+
+def validate_transactions(transactions: Iterable[Transaction]) -> list[Transaction]:
+	"""
+	Validates a whole batch at once, so it can be replayed with `Wallet.process_transactions(..., validated=True)`.
+
+	Args:
+		transactions (Iterable[Transaction]): The transactions to validate.
+
+	Returns:
+		list[Transaction]: The transactions, materialized.
+
+	Raises:
+		BatchValidationError: If any transaction is invalid, listing all of them.
+	"""
+	batch = list(transactions)
+	errors = find_invalid_rows(batch)
+
+	if errors:
+		raise BatchValidationError(errors)
+
+	return batch
+
+
+def find_invalid_columns(actions: ArrayLike, currencies: ArrayLike, amounts: ArrayLike) -> list[InvalidRow]:
+	"""
+	Checks the columns produced by `batch.encode_transactions` with vectorized range and sign tests.
+
+	Args:
+		actions (ArrayLike): Wallet action codes, indexing `WALLET_ACTIONS`.
+		currencies (ArrayLike): Currency codes, indexing `CURRENCIES`.
+		amounts (ArrayLike): Transaction amounts.
+
+	Returns:
+		list[InvalidRow]: The invalid transactions, in batch order, with the first problem of each.
+
+	Raises:
+		ValueError: If the columns have different lengths.
+	"""
+	actions, currencies, amounts = np.asarray(actions), np.asarray(currencies), np.asarray(amounts, dtype=np.float64)
+
+	if not len(actions) == len(currencies) == len(amounts):
+		raise ValueError(f"Column lengths differ: {len(actions)}, {len(currencies)}, {len(amounts)}")
+
+	errors: dict[int, str] = {}
+	checks = (
+		((actions < 0) | (actions >= len(WALLET_ACTIONS)), "Unsupported wallet action code", actions),
+		((currencies < 0) | (currencies >= len(CURRENCIES)), "Unsupported currency code", currencies),
+		(~(amounts > 0), "Amount must be positive", amounts),
+	)
+
+	for mask, reason, column in checks:
+		for index in np.flatnonzero(mask).tolist():
+			errors.setdefault(index, f"{reason}: {column[index]}")
+
+	return [InvalidRow(index, errors[index]) for index in sorted(errors)]
+
+
+def validate_columns(actions: ArrayLike, currencies: ArrayLike, amounts: ArrayLike) -> None:
+	"""
+	Validates encoded columns as a whole.
+
+	Args:
+		actions (ArrayLike): Wallet action codes, indexing `WALLET_ACTIONS`.
+		currencies (ArrayLike): Currency codes, indexing `CURRENCIES`.
+		amounts (ArrayLike): Transaction amounts.
+
+	Raises:
+		BatchValidationError: If any transaction is invalid, listing all of them.
+	"""
+	errors = find_invalid_columns(actions, currencies, amounts)
+
+	if errors:
+		raise BatchValidationError(errors)
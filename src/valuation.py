@@ -0,0 +1,352 @@
+import csv
+import os
+import pathlib
+import struct
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from src.common.enums import CurrencyEnum
+from src.wallet import Wallet
+
+DEFAULT_CACHE_CAPACITY = 64
+"""Number of price series kept in memory by a `PriceCache`."""
+
+PRICE_MAGIC = b"HDXPRICE"
+"""Leading bytes of every binary price file."""
+
+PRICE_VERSION = 1
+"""Version of the binary price layout written by this module."""
+
+_HEADER = struct.Struct("<8sIIQ")
+"""Magic, version, reserved, number of prices; followed by the timestamps then the prices, as little-endian columns."""
+
+_TIMESTAMP_DTYPE = np.dtype("<i8")
+_PRICE_DTYPE = np.dtype("<f8")
+
+
+@dataclass
+class PriceSeries:
+	"""
+	The USD price of one asset over time, sorted by timestamp for as-of lookups.
+
+	Attributes:
+		timestamps (NDArray[np.int64]): When each price was observed, in seconds since the epoch, ascending.
+		prices (NDArray[np.float64]): The USD price of one unit at each timestamp.
+	"""
+
+	timestamps: NDArray[np.int64]
+	prices: NDArray[np.float64]
+
+	def __post_init__(self) -> None:
+		"""
+		Converts the columns and sorts them by timestamp, keeping the order of equal timestamps.
+
+		Raises:
+			ValueError: If the columns have different lengths.
+		"""
+		self.timestamps = np.asarray(self.timestamps, dtype=np.int64)
+		self.prices = np.asarray(self.prices, dtype=np.float64)
+
+		if self.timestamps.shape != self.prices.shape or self.timestamps.ndim != 1:
+			raise ValueError(f"Timestamps and prices must be matching columns: {self.timestamps.shape}, {self.prices.shape}")
+
+		if np.any(self.timestamps[1:] < self.timestamps[:-1]):
+			order = np.argsort(self.timestamps, kind="stable")
+			self.timestamps, self.prices = self.timestamps[order], self.prices[order]
+
+	def as_of(self, timestamps: ArrayLike) -> NDArray[np.float64]:
+		"""
+		Looks up the latest price observed at or before each timestamp, with a binary search in the sorted index.
+
+		Args:
+			timestamps (ArrayLike): The timestamps to price, in seconds since the epoch, in any order.
+
+		Returns:
+			NDArray[np.float64]: The price at each timestamp, NaN before the first observation.
+		"""
+		timestamps = np.asarray(timestamps, dtype=np.int64)
+
+		if not len(self):
+			return np.full(timestamps.shape, np.nan)
+
+		positions = np.searchsorted(self.timestamps, timestamps, side="right") - 1
+		return np.where(positions >= 0, self.prices[np.maximum(positions, 0)], np.nan)
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of observed prices.
+
+		Returns:
+			int: The number of prices.
+		"""
+		return len(self.timestamps)
+
+
+def _parse_timestamp(value: str) -> int:
+	"""
+	Parses a timestamp written as seconds since the epoch or as an ISO 8601 date or datetime, UTC unless stated.
+
+	Args:
+		value (str): The timestamp field.
+
+	Returns:
+		int: The timestamp, in seconds since the epoch.
+	"""
+	try:
+		return int(float(value))
+
+	except ValueError:
+		moment = datetime.fromisoformat(value.strip())
+		return int((moment if moment.tzinfo else moment.replace(tzinfo=UTC)).timestamp())
+
+
+def read_price_csv(path: str | pathlib.Path) -> PriceSeries:
+	"""
+	Reads a price series from a CSV file with `timestamp` and `price` columns.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+
+	Returns:
+		PriceSeries: The prices, sorted by timestamp.
+
+	Raises:
+		ValueError: If the columns are missing or a row cannot be parsed.
+	"""
+	timestamps, prices = [], []
+
+	with pathlib.Path(path).open(newline="", encoding="utf-8") as file:
+		reader = csv.DictReader(file)
+		fields = {name.strip().lower(): name for name in reader.fieldnames or ()}
+
+		if not {"timestamp", "price"} <= fields.keys():
+			raise ValueError(f"Price file {path} needs 'timestamp' and 'price' columns, got {reader.fieldnames}")
+
+		for line, row in enumerate(reader, start=2):
+			try:
+				timestamps.append(_parse_timestamp(row[fields["timestamp"]]))
+				prices.append(float(row[fields["price"]]))
+
+			except (TypeError, ValueError) as e:
+				raise ValueError(f"Invalid price at {path}:{line}: {e}") from e
+
+	return PriceSeries(np.array(timestamps, dtype=np.int64), np.array(prices, dtype=np.float64))
+
+
+def write_price_series(path: str | pathlib.Path, series: PriceSeries) -> None:
+	"""
+	Writes a price series in the binary layout, which loads without parsing.
+
+	Args:
+		path (str | pathlib.Path): The file to write.
+		series (PriceSeries): The prices to write.
+	"""
+	with pathlib.Path(path).open("wb") as file:
+		file.write(_HEADER.pack(PRICE_MAGIC, PRICE_VERSION, 0, len(series)))
+		file.write(series.timestamps.astype(_TIMESTAMP_DTYPE, copy=False).tobytes())
+		file.write(series.prices.astype(_PRICE_DTYPE, copy=False).tobytes())
+
+
+def read_price_series(path: str | pathlib.Path) -> PriceSeries:
+	"""
+	Reads a price series from a binary price file, or from a CSV file when it does not start with `PRICE_MAGIC`.
+
+	Args:
+		path (str | pathlib.Path): The file to read.
+
+	Returns:
+		PriceSeries: The prices, sorted by timestamp.
+
+	Raises:
+		ValueError: If a binary file has an unsupported version or is truncated.
+	"""
+	path = pathlib.Path(path)
+
+	with path.open("rb") as file:
+		if file.read(len(PRICE_MAGIC)) != PRICE_MAGIC:
+			return read_price_csv(path)
+
+	data = path.read_bytes()
+
+	_, version, _, count = _HEADER.unpack_from(data)
+
+	if version != PRICE_VERSION:
+		raise ValueError(f"Unsupported price file version {version} in {path}")
+
+	if len(data) != _HEADER.size + count * (_TIMESTAMP_DTYPE.itemsize + _PRICE_DTYPE.itemsize):
+		raise ValueError(f"Price file {path} is truncated")
+
+	timestamps = np.frombuffer(data, dtype=_TIMESTAMP_DTYPE, count=count, offset=_HEADER.size)
+	prices = np.frombuffer(data, dtype=_PRICE_DTYPE, count=count, offset=_HEADER.size + count * _TIMESTAMP_DTYPE.itemsize)
+	return PriceSeries(timestamps, prices)
+
+
+@dataclass
+class PriceCache:
+	"""
+	A bounded, least recently used cache of price series loaded from files.
+
+	An entry is reused while its file keeps the same size and modification time, and reloaded otherwise. Once
+	`capacity` files are cached, loading another one evicts the least recently used.
+
+	Attributes:
+		capacity (int): The maximum number of cached series. Defaults to `DEFAULT_CACHE_CAPACITY`.
+		hits (int): The number of lookups served from memory.
+		misses (int): The number of lookups that read a file.
+	"""
+
+	capacity: int = DEFAULT_CACHE_CAPACITY
+	hits: int = 0
+	misses: int = 0
+	_entries: OrderedDict[str, tuple[tuple[int, int], PriceSeries]] = field(default_factory=OrderedDict, repr=False)
+
+	def __post_init__(self) -> None:
+		"""
+		Validates the capacity.
+
+		Raises:
+			ValueError: If the capacity is not positive.
+		"""
+		if self.capacity <= 0:
+			raise ValueError(f"Cache capacity must be positive: {self.capacity}")
+
+	def get(self, path: str | pathlib.Path) -> PriceSeries:
+		"""
+		Returns the price series of a file, reading it only if it is not cached or has changed.
+
+		Args:
+			path (str | pathlib.Path): A binary or CSV price file.
+
+		Returns:
+			PriceSeries: The prices, sorted by timestamp.
+		"""
+		path = pathlib.Path(path).resolve()
+		key, stat = os.fspath(path), path.stat()
+		version = (stat.st_mtime_ns, stat.st_size)
+		entry = self._entries.get(key)
+
+		if entry is not None and entry[0] == version:
+			self.hits += 1
+			self._entries.move_to_end(key)
+			return entry[1]
+
+		self.misses += 1
+		series = read_price_series(path)
+		self._entries[key] = (version, series)
+		self._entries.move_to_end(key)
+
+		while len(self._entries) > self.capacity:
+			self._entries.popitem(last=False)
+
+		return series
+
+	def load(self, paths: Mapping[str, str | pathlib.Path]) -> dict[str, PriceSeries]:
+		"""
+		Returns the price series of several assets through the cache.
+
+		Args:
+			paths (Mapping[str, str | pathlib.Path]): The price file of each asset.
+
+		Returns:
+			dict[str, PriceSeries]: The prices of each asset.
+		"""
+		return {asset: self.get(path) for asset, path in paths.items()}
+
+	def clear(self) -> None:
+		"""
+		Forgets every cached series.
+		"""
+		self._entries.clear()
+
+	def __len__(self) -> int:
+		"""
+		Returns the number of cached series.
+
+		Returns:
+			int: The number of cached series.
+		"""
+		return len(self._entries)
+
+
+def balance_matrix(wallets: Iterable[Wallet]) -> tuple[list[str], NDArray[np.float64]]:
+	"""
+	Collects the balances of many wallets into one matrix, reading each wallet once.
+
+	Args:
+		wallets (Iterable[Wallet]): The wallets.
+
+	Returns:
+		tuple[list[str], NDArray[np.float64]]: The currencies held by any wallet, and the balance of each wallet (rows)
+			in each of them (columns).
+	"""
+	balances = [wallet.balance for wallet in wallets]
+	currencies = list(dict.fromkeys(currency for balance in balances for currency in balance))
+	matrix = np.zeros((len(balances), len(currencies)), dtype=np.float64)
+	columns = {currency: column for column, currency in enumerate(currencies)}
+
+	for row, balance in enumerate(balances):
+		for currency, amount in balance.items():
+			matrix[row, columns[currency]] = amount
+
+	return currencies, matrix
+
+
+def price_matrix(prices: Mapping[str, PriceSeries], currencies: Sequence[str], timestamps: ArrayLike) -> NDArray[np.float64]:
+	"""
+	Looks up the as-of price of several currencies at many timestamps. USD is worth 1.0 unless it has its own series.
+
+	Args:
+		prices (Mapping[str, PriceSeries]): The price series of each currency.
+		currencies (Sequence[str]): The currencies to price.
+		timestamps (ArrayLike): The timestamps, in seconds since the epoch.
+
+	Returns:
+		NDArray[np.float64]: The price of each currency (rows) at each timestamp (columns), NaN before its first price.
+
+	Raises:
+		ValueError: If a currency has no price series.
+	"""
+	timestamps = np.asarray(timestamps, dtype=np.int64)
+	matrix = np.empty((len(currencies), len(timestamps)), dtype=np.float64)
+
+	for row, currency in enumerate(currencies):
+		if currency in prices:
+			matrix[row] = prices[currency].as_of(timestamps)
+
+		elif currency == CurrencyEnum.USD:
+			matrix[row] = 1.0
+
+		else:
+			raise ValueError(f"No price series for {currency}")
+
+	return matrix
+
+
+def value_wallets(wallets: Iterable[Wallet], prices: Mapping[str, PriceSeries], timestamps: ArrayLike) -> NDArray[np.float64]:
+	"""
+	Values many wallets at many timestamps with a single matrix product of their balances and the as-of prices.
+
+	Args:
+		wallets (Iterable[Wallet]): The wallets, each read once.
+		prices (Mapping[str, PriceSeries]): The price series of every currency held, USD excepted.
+		timestamps (ArrayLike): The timestamps, in seconds since the epoch.
+
+	Returns:
+		NDArray[np.float64]: The USD value of each wallet (rows) at each timestamp (columns), NaN where the wallet holds
+			a currency that had no price yet.
+	"""
+	currencies, balances = balance_matrix(wallets)
+	price = price_matrix(prices, currencies, timestamps)
+	unknown = np.isnan(price)
+	values = balances @ np.where(unknown, 0.0, price)
+
+	# Only wallets actually holding a currency are affected by its missing price.
+	if unknown.any():
+		values[(balances != 0) @ unknown] = np.nan
+
+	return values
@@ -0,0 +1,419 @@
+import os
+import pathlib
+import struct
+import threading
+import time
+import zlib
+from dataclasses import dataclass, field
+from typing import NamedTuple, Self
+
+from src.common.enums import CURRENCIES, CURRENCY_CODES, WALLET_ACTION_CODES, WALLET_ACTIONS, CurrencyEnum, WalletActionEnum
+from src.snapshot import WalletSnapshot
+from src.wallet import Wallet
+
+DEFAULT_MAX_DELAY = 0.0005
+"""Longest time, in seconds, the first record of a group waits for others before the group is synced."""
+
+DEFAULT_MAX_BATCH = 4096
+"""Largest number of records written and synced together."""
+
+LOG_FILE = "wallet.wal"
+"""Name of the write-ahead log inside a `DurableWallet` directory."""
+
+SNAPSHOT_FILE = "snapshot.json"
+"""Name of the snapshot inside a `DurableWallet` directory."""
+
+_BODY = struct.Struct("<qBBd")
+"""Transaction index, wallet action code, currency code and amount of a record, followed on disk by their CRC32."""
+
+RECORD_SIZE = _BODY.size + 4
+"""Size in bytes of one log record."""
+
+_sync = getattr(os, "fdatasync", os.fsync)
+
+
+class LogRecord(NamedTuple):
+	"""
+	A transaction persisted in the write-ahead log.
+
+	Attributes:
+		index (int): The wallet's transaction count before the transaction, as used by snapshot offsets.
+		wallet_action (WalletActionEnum): The action performed.
+		currency (CurrencyEnum): The currency transacted.
+		amount (float): The amount transacted.
+	"""
+
+	index: int
+	wallet_action: WalletActionEnum
+	currency: CurrencyEnum
+	amount: float
+
+
+def encode_record(record: LogRecord) -> bytes:
+	"""
+	Packs a record into its fixed-size, checksummed binary form.
+
+	Args:
+		record (LogRecord): The record to pack.
+
+	Returns:
+		bytes: The packed record.
+	"""
+	body = _BODY.pack(record.index, WALLET_ACTION_CODES[record.wallet_action], CURRENCY_CODES[record.currency], record.amount)
+	return body + zlib.crc32(body).to_bytes(4, "little")
+
+
+def read_log(path: str | pathlib.Path) -> tuple[list[LogRecord], int]:
+	"""
+	Reads the intact records of a write-ahead log.
+
+	Reading stops at the first truncated or corrupted record, which is what a crash in the middle of a write leaves.
+
+	Args:
+		path (str | pathlib.Path): The log file.
+
+	Returns:
+		tuple[list[LogRecord], int]: The records, and the length in bytes of the intact prefix of the file.
+	"""
+	path = pathlib.Path(path)
+
+	if not path.exists():
+		return [], 0
+
+	data = path.read_bytes()
+	records = []
+
+	for offset in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+		body = data[offset : offset + _BODY.size]
+		index, action, currency, amount = _BODY.unpack(body)
+		checksum = int.from_bytes(data[offset + _BODY.size : offset + RECORD_SIZE], "little")
+
+		if zlib.crc32(body) != checksum or action >= len(WALLET_ACTIONS) or currency >= len(CURRENCIES):
+			return records, offset
+
+		records.append(LogRecord(index, WALLET_ACTIONS[action], CURRENCIES[currency], amount))
+
+	return records, len(records) * RECORD_SIZE
+
+
+class WriteAheadLog:
+	"""
+	An append-only log of fixed-size records, synced to disk in groups.
+
+	Callers `append` records and then `wait` until they are durable. A background thread writes all pending records
+	with a single write and a single sync, after letting the first of them wait at most `max_delay` for company, so
+	concurrent callers share the cost of each sync. `max_batch=1` syncs every record on its own.
+
+	Attributes:
+		path (pathlib.Path): The log file.
+		max_delay (float): The latency budget, in seconds, for gathering a group.
+		max_batch (int): The largest number of records synced together.
+		syncs (int): The number of syncs performed so far.
+	"""
+
+	def __init__(self, path: str | pathlib.Path, *, max_delay: float = DEFAULT_MAX_DELAY, max_batch: int = DEFAULT_MAX_BATCH) -> None:
+		"""
+		Opens the log for appending and starts the writer thread.
+
+		Args:
+			path (str | pathlib.Path): The log file, created if missing.
+			max_delay (float, optional): The latency budget, in seconds, for gathering a group. Defaults to `DEFAULT_MAX_DELAY`.
+			max_batch (int, optional): The largest number of records synced together. Defaults to `DEFAULT_MAX_BATCH`.
+
+		Raises:
+			ValueError: If the delay is negative or the batch size is not positive.
+		"""
+		if max_delay < 0 or max_batch <= 0:
+			raise ValueError(f"Delay must not be negative and batch size must be positive: {max_delay}, {max_batch}")
+
+		self.path = pathlib.Path(path)
+		self.max_delay = max_delay
+		self.max_batch = max_batch
+		self.syncs = 0
+		self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+		self._lock = threading.Lock()
+		self._pending_work = threading.Condition(self._lock)
+		self._durable_work = threading.Condition(self._lock)
+		self._pending: list[bytes] = []
+		self._appended = 0
+		self._durable = 0
+		self._closed = False
+		self._error: BaseException | None = None
+		self._writer = threading.Thread(target=self._run, name="wal-writer", daemon=True)
+		self._writer.start()
+
+	def append(self, record: LogRecord) -> int:
+		"""
+		Queues a record for the next group.
+
+		Args:
+			record (LogRecord): The record to persist.
+
+		Returns:
+			int: The record's sequence number, to pass to `wait`.
+
+		Raises:
+			ValueError: If the log is closed.
+			OSError: If the writer thread failed, since the record would never reach the disk.
+		"""
+		data = encode_record(record)
+
+		with self._lock:
+			if self._closed:
+				raise ValueError("Write-ahead log is closed")
+
+			if self._error is not None:
+				raise OSError(f"Write-ahead log {self.path} failed") from self._error
+
+			self._pending.append(data)
+			self._appended += 1
+			self._pending_work.notify()
+			return self._appended
+
+	def wait(self, sequence: int) -> None:
+		"""
+		Blocks until the record with the given sequence number, and every one before it, is on disk.
+
+		Args:
+			sequence (int): A sequence number returned by `append`.
+
+		Raises:
+			OSError: If writing or syncing the log failed.
+		"""
+		with self._lock:
+			while self._durable < sequence and self._error is None:
+				self._durable_work.wait()
+
+			if self._error is not None:
+				raise OSError(f"Write-ahead log {self.path} failed") from self._error
+
+	def sync(self) -> None:
+		"""
+		Blocks until every record appended so far is on disk.
+		"""
+		with self._lock:
+			sequence = self._appended
+
+		self.wait(sequence)
+
+	def truncate(self) -> None:
+		"""
+		Empties the log once its records are covered by a snapshot. Callers must not append concurrently.
+		"""
+		self.sync()
+		os.ftruncate(self._fd, 0)
+		_sync(self._fd)
+
+	def close(self) -> None:
+		"""
+		Syncs the pending records, stops the writer thread and closes the file.
+		"""
+		with self._lock:
+			if self._closed:
+				return
+
+			self._closed = True
+			self._pending_work.notify()
+
+		self._writer.join()
+		os.close(self._fd)
+
+	def _run(self) -> None:
+		"""
+		Writes and syncs the pending records in groups until the log is closed.
+		"""
+		while True:
+			with self._lock:
+				while not self._pending and not self._closed:
+					self._pending_work.wait()
+
+				if not self._pending:
+					return
+
+				deadline = time.monotonic() + self.max_delay
+
+				while len(self._pending) < self.max_batch and not self._closed:
+					remaining = deadline - time.monotonic()
+
+					if remaining <= 0:
+						break
+
+					self._pending_work.wait(remaining)
+
+				group = self._pending[: self.max_batch]
+				del self._pending[: self.max_batch]
+
+			try:
+				data = memoryview(b"".join(group))
+
+				# A write may be short, so the group is only synced and acknowledged once all of it is written.
+				while data:
+					data = data[os.write(self._fd, data) :]
+
+				_sync(self._fd)
+
+			except OSError as e:
+				with self._lock:
+					self._error = e
+					self._durable_work.notify_all()
+
+				return
+
+			with self._lock:
+				self.syncs += 1
+				self._durable += len(group)
+				self._durable_work.notify_all()
+
+	def __enter__(self) -> Self:
+		"""
+		Returns the log itself.
+
+		Returns:
+			Self: The log.
+		"""
+		return self
+
+	def __exit__(self, *_: object) -> None:
+		"""
+		Closes the log.
+		"""
+		self.close()
+
+
+@dataclass
+class DurableWallet:
+	"""
+	A thread-safe wallet whose transactions survive crashes.
+
+	Each transaction is validated, appended to a write-ahead log and only then applied in memory, all under one lock,
+	so the log order is the replay order and a log that refuses the record leaves the balances untouched.
+	`process_transaction` returns only once the record is synced, and a crash loses nothing that was acknowledged.
+	Once the log's writer fails, the wallet refuses every later transaction and checkpoint, so only the transactions
+	whose sync raised are in memory without being on disk. `open` recovers the wallet from the last snapshot plus the
+	log, and `checkpoint` writes a new snapshot and empties the log.
+
+	Attributes:
+		directory (pathlib.Path): The directory holding the snapshot and the log.
+		wallet (Wallet): The in-memory wallet.
+		log (WriteAheadLog): The write-ahead log.
+	"""
+
+	directory: pathlib.Path
+	wallet: Wallet
+	log: WriteAheadLog
+	_lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+	@classmethod
+	def open(
+		cls,
+		directory: str | pathlib.Path,
+		*,
+		max_delay: float = DEFAULT_MAX_DELAY,
+		max_batch: int = DEFAULT_MAX_BATCH,
+	) -> "DurableWallet":
+		"""
+		Recovers a wallet by replaying the log on top of the last snapshot, and reopens the log for appending.
+
+		A torn record left by a crash is cut off the log. Records already covered by the snapshot are skipped, which
+		makes a crash between writing a snapshot and emptying the log harmless.
+
+		Args:
+			directory (str | pathlib.Path): The directory holding the snapshot and the log, created if missing.
+			max_delay (float, optional): The latency budget, in seconds, for gathering a group. Defaults to `DEFAULT_MAX_DELAY`.
+			max_batch (int, optional): The largest number of records synced together. Defaults to `DEFAULT_MAX_BATCH`.
+
+		Returns:
+			DurableWallet: The recovered wallet.
+
+		Raises:
+			ValueError: If the log skips transactions that the snapshot does not cover.
+		"""
+		directory = pathlib.Path(directory)
+		directory.mkdir(parents=True, exist_ok=True)
+		snapshot_path, log_path = directory / SNAPSHOT_FILE, directory / LOG_FILE
+
+		snapshot = WalletSnapshot.load(snapshot_path) if snapshot_path.exists() else WalletSnapshot(state={}, offset=0)
+		wallet = snapshot.restore()
+		records, length = read_log(log_path)
+
+		for index, wallet_action, currency, amount in records:
+			if index < wallet.transaction_count:
+				continue
+
+			if index > wallet.transaction_count:
+				raise ValueError(f"Write-ahead log jumps from transaction {wallet.transaction_count} to {index}")
+
+			wallet.process_transaction(wallet_action, currency, amount, verbose=False)
+
+		if log_path.exists() and log_path.stat().st_size != length:
+			os.truncate(log_path, length)
+
+		return cls(directory, wallet, WriteAheadLog(log_path, max_delay=max_delay, max_batch=max_batch))
+
+	def process_transaction(self, wallet_action: WalletActionEnum, currency: CurrencyEnum, amount: float) -> bool:
+		"""
+		Processes a transaction and returns once it is durable.
+
+		Args:
+			wallet_action (WalletActionEnum): The action to perform.
+			currency (CurrencyEnum): The currency to transact.
+			amount (float): The amount to transact.
+
+		Returns:
+			bool: Whether the transaction was successful.
+		"""
+		with self._lock:
+			index = self.wallet.transaction_count
+			self.wallet._validate_transaction(wallet_action, currency, amount)  # noqa: SLF001
+			sequence = self.log.append(LogRecord(index, wallet_action, currency, amount))
+			accepted = self.wallet.processor(validated=True)(wallet_action, currency, amount)
+
+		self.log.wait(sequence)
+		return accepted
+
+	def checkpoint(self) -> WalletSnapshot:
+		"""
+		Saves a snapshot of the wallet and empties the log it covers, only once the snapshot is durable.
+
+		Returns:
+			WalletSnapshot: The saved snapshot.
+		"""
+		with self._lock:
+			self.log.sync()
+			snapshot = WalletSnapshot.from_wallet(self.wallet)
+			snapshot.save(self.directory / SNAPSHOT_FILE)
+			self.log.truncate()
+
+		return snapshot
+
+	@property
+	def balance(self) -> dict[CurrencyEnum, float]:
+		"""
+		The current balance of the wallet, including transactions still waiting for their sync.
+
+		Returns:
+			dict[CurrencyEnum, float]: A dictionary with the balance of each currency.
+		"""
+		return self.wallet.balance
+
+	def close(self) -> None:
+		"""
+		Syncs and closes the log.
+		"""
+		with self._lock:
+			self.log.close()
+
+	def __enter__(self) -> Self:
+		"""
+		Returns the wallet itself.
+
+		Returns:
+			Self: The durable wallet.
+		"""
+		return self
+
+	def __exit__(self, *_: object) -> None:
+		"""
+		Closes the log.
+		"""
+		self.close()
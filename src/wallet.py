@@ -1,11 +1,15 @@
 from collections import defaultdict
-from collections.abc import Sequence
-from dataclasses import dataclass, field
-from queue import SimpleQueue
+from collections.abc import Iterable
+from copy import copy
+from dataclasses import dataclass, field, replace
+from typing import Self
 from warnings import warn
 
 from src.common.enums import CurrencyEnum, WalletActionEnum
 from src.common.types import Transaction
+from src.history import BalanceHistory
+from src.metrics import ProcessTransaction, WalletMetrics
+from src.rejections import RejectionLog, ReplayResult
 
 
 @dataclass
@@ -14,27 +18,79 @@ class Wallet:
 	A cryptocurrency wallet.
 
 	Attributes:
-		transaction_list (Sequence[tuple[WalletActionEnum, CurrencyEnum, float]]): A list of transactions performed on the wallet.
+		transaction_list (Iterable[tuple[WalletActionEnum, CurrencyEnum, float]]): Transactions performed on the wallet, consumed once.
+		state (dict[CurrencyEnum, float]): The balance of each currency. Defaults to an empty wallet.
+		transaction_count (int): The number of transactions processed so far, including skipped withdrawals. Defaults to 0.
+		metrics (WalletMetrics | None): Optional counters and latency histogram for `process_transaction`. Defaults to None.
+		rejections (RejectionLog): A bounded record of the withdrawals skipped for insufficient funds.
+		verbose (bool): Whether skipped withdrawals also emit a warning. Defaults to False.
+		history (BalanceHistory | None): Optional index of past balances, recorded from construction on. Defaults to None.
 
 	Raises:
 		ValueError: If any transaction is not supported.
 	"""
 
-	transaction_list: Sequence[Transaction]
+	transaction_list: Iterable[Transaction]
 	state: dict[CurrencyEnum, float] = field(default_factory=lambda: defaultdict(float))
+	transaction_count: int = 0
+	metrics: WalletMetrics | None = None
+	rejections: RejectionLog = field(default_factory=RejectionLog)
+	verbose: bool = False
+	history: BalanceHistory | None = None
 
 	def __post_init__(self) -> None:
 		"""
 		Initializes the wallet by processing the transaction list.
 		"""
-		self.transaction_queue: SimpleQueue[Transaction] = SimpleQueue()
+		if self.history is not None:
+			self._apply = self.history.track(self)
 
-		for transaction in self.transaction_list:
-			self.transaction_queue.put(transaction)
+		if self.metrics is not None:
+			self.process_transaction = self.metrics.instrument(self.process_transaction)
 
-		while not self.transaction_queue.empty():
-			wallet_action, currency, amount = self.transaction_queue.get()
-			self.process_transaction(wallet_action, currency, amount)
+		self.process_transactions(self.transaction_list)
+
+	def process_transactions(
+		self,
+		transactions: Iterable[Transaction],
+		*,
+		verbose: bool | None = None,
+		validated: bool = False,
+	) -> ReplayResult:
+		"""
+		Processes transactions on the wallet in order, pulling them one at a time from the iterable.
+
+		Args:
+			transactions (Iterable[Transaction]): The transactions to process.
+			verbose (bool | None, optional): Whether to print warnings. Defaults to the wallet's `verbose`.
+			validated (bool, optional): Whether the transactions already passed `validation.validate_transactions` or an
+				equivalent parser, so the per-call checks can be skipped. Instrumented wallets still go through
+				`process_transaction`. Defaults to False.
+
+		Returns:
+			ReplayResult: The number of processed and successful transactions, the balance and the rejection log.
+		"""
+		process_transaction = self.processor(validated=validated)
+		start = self.transaction_count
+		accepted = 0
+
+		for wallet_action, currency, amount in transactions:
+			accepted += process_transaction(wallet_action, currency, amount, verbose=verbose)
+
+		return ReplayResult(self.transaction_count - start, accepted, self.balance, self.rejections)
+
+	def processor(self, *, validated: bool = False) -> ProcessTransaction:
+		"""
+		Returns the per-transaction step used by `process_transactions`, for callers that need each outcome.
+
+		Args:
+			validated (bool, optional): Whether the transactions are already validated, as in `process_transactions`.
+				Defaults to False.
+
+		Returns:
+			ProcessTransaction: `_apply` for validated transactions on a wallet without metrics, `process_transaction` otherwise.
+		"""
+		return self._apply if validated and self.metrics is None else self.process_transaction
 
 	def process_transaction(
 		self,
@@ -42,21 +98,44 @@ class Wallet:
 		currency: CurrencyEnum,
 		amount: float,
 		*,
-		verbose: bool = True,
+		verbose: bool | None = None,
 	) -> bool:
 		"""
-		Processes a transaction on the wallet.
+		Processes a transaction on the wallet. Skipped withdrawals are recorded in `rejections`.
 
 		Args:
 			wallet_action (WalletActionEnum): The action to perform.
 			currency (CurrencyEnum): The currency to transact.
 			amount (float): The amount to transact.
-			verbose (bool, optional): Whether to print warnings. Defaults to True.
+			verbose (bool | None, optional): Whether to print warnings. Defaults to the wallet's `verbose`.
 
 		Returns:
 			bool: Whether the transaction was successful.
 		"""
 		self._validate_transaction(wallet_action, currency, amount)
+		return self._apply(wallet_action, currency, amount, verbose=verbose)
+
+	def _apply(
+		self,
+		wallet_action: WalletActionEnum,
+		currency: CurrencyEnum,
+		amount: float,
+		*,
+		verbose: bool | None = None,
+	) -> bool:
+		"""
+		Applies a transaction that is already known to be valid.
+
+		Args:
+			wallet_action (WalletActionEnum): The action to perform.
+			currency (CurrencyEnum): The currency to transact.
+			amount (float): The amount to transact.
+			verbose (bool | None, optional): Whether to print warnings. Defaults to the wallet's `verbose`.
+
+		Returns:
+			bool: Whether the transaction was successful.
+		"""
+		self.transaction_count += 1
 
 		if wallet_action == WalletActionEnum.DEPOSIT:
 			self.state[currency] += amount
@@ -64,7 +143,9 @@ class Wallet:
 
 		if wallet_action == WalletActionEnum.WITHDRAW:
 			if self.state[currency] < amount:
-				if verbose:
+				self.rejections.record(self.transaction_count - 1, currency, amount, self.state[currency])
+
+				if verbose or (verbose is None and self.verbose):
 					warn(
 						f"Insufficient funds for withdrawal: {amount} {currency}, transaction skipped.",
 						stacklevel=1,
@@ -77,6 +158,26 @@ class Wallet:
 
 		return False
 
+	def fork(self) -> Self:
+		"""
+		Creates an independent wallet that continues from this one's current state, without replaying anything.
+
+		The fork copies only the per-currency balances, so its cost does not depend on how many transactions led to
+		them, and the two wallets never see each other's later transactions. The fork starts with an empty rejection
+		log and without metrics or history, so it only reports on what it processes itself.
+
+		Returns:
+			Self: A wallet of the same type, with the same balances and transaction count.
+		"""
+		return replace(
+			self,
+			transaction_list=(),
+			state=copy(self.state),
+			metrics=None,
+			rejections=type(self.rejections)(capacity=self.rejections.capacity, assets=self.rejections.assets),
+			history=None,
+		)
+
 	@staticmethod
 	def _validate_currency(currency: CurrencyEnum) -> None:
 		"""
@@ -0,0 +1,56 @@
+import contextlib
+import io
+import random
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.headless import main
+from src.wallet import Wallet
+
+CSV = "action,currency,amount\nDEPOSIT,BTC,1.5\nDEPOSIT,USD,1000\nWITHDRAW,USD,300\nWITHDRAW,BTC,2.0\nDEPOSIT,ETH,5.0\nWITHDRAW,BTC,0.5\n"
+
+
+def run_main(*argv: str) -> tuple[int, str, str]:
+	"""
+	Runs the headless entry point, capturing its output.
+
+	Returns:
+		tuple[int, str, str]: The exit status, stdout and stderr.
+	"""
+	stdout, stderr = io.StringIO(), io.StringIO()
+
+	with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+		status = main(argv)
+
+	return status, stdout.getvalue(), stderr.getvalue()
+
+
+def random_transactions(count: int, seed: int, withdraw_ratio: float = 0.5) -> list[Transaction]:
+	"""
+	Builds a reproducible mix of deposits and withdrawals across all currencies.
+
+	Returns:
+		list[Transaction]: The generated transactions.
+	"""
+	rng = random.Random(seed)  # noqa: S311
+
+	return [
+		Transaction(
+			WalletActionEnum.WITHDRAW if rng.random() < withdraw_ratio else WalletActionEnum.DEPOSIT,
+			rng.choice(list(CurrencyEnum)),
+			round(rng.uniform(0.01, 100), rng.choice([0, 2, 8])) or 0.01,
+		)
+		for _ in range(count)
+	]
+
+
+def replay_wallet(transactions: list[Transaction]) -> tuple[dict, list[bool]]:
+	"""
+	Replays transactions one call at a time.
+
+	Returns:
+		tuple[dict, list[bool]]: The final balance and whether each transaction was applied.
+	"""
+	wallet = Wallet(transaction_list=[])
+	accepted = [wallet.process_transaction(*tx, verbose=False) for tx in transactions]
+	return wallet.balance, accepted
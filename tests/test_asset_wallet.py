@@ -0,0 +1,116 @@
+import pathlib
+import tempfile
+from unittest import TestCase
+
+from src.asset_wallet import AssetWallet
+from src.common.enums import CURRENCY_CODES, CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry, Transaction, TransactionBatch
+from src.streaming import load_batch
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestAssetRegistry(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.directory = pathlib.Path(self.tmp.name)
+
+	def test_builtin_currencies(self):
+		"""Test that the built-in currencies keep their codes and resolve to enum members."""
+		assets = AssetRegistry()
+
+		for currency, code in CURRENCY_CODES.items():
+			self.assertEqual(assets.resolve(currency), code)
+			self.assertIs(assets.symbols[assets.resolve(f" {currency.lower()} ")], currency)
+
+	def test_load(self):
+		"""Test loading symbols from a file, skipping comments, blanks and duplicates."""
+		path = self.directory / "assets.txt"
+		path.write_text("# listed assets\nsol\n\nBTC\nDOGE\n", encoding="utf-8")
+		assets = AssetRegistry.load(path)
+
+		self.assertEqual(assets.symbols, [*CurrencyEnum, "SOL", "DOGE"])
+		self.assertEqual(assets.resolve("doge"), 4)
+		self.assertIn("Sol", assets)
+		self.assertNotIn("ADA", assets)
+
+		with self.assertRaises(KeyError):
+			assets.resolve("ADA")
+
+	def test_intern(self):
+		"""Test that interning is idempotent and refuses malformed symbols."""
+		assets = AssetRegistry()
+
+		self.assertEqual(assets.intern("sol"), 3)
+		self.assertEqual(assets.intern("SOL "), 3)
+		self.assertEqual(len(assets), 4)
+
+		with self.assertRaises(ValueError):
+			assets.intern("NOT A SYMBOL")
+
+	def test_registry_batches(self):
+		"""Test that batches bound to a registry encode and decode registered assets."""
+		assets = AssetRegistry(["USD", "BTC", "ETH", "SOL"])
+		path = self.directory / "ledger.csv"
+		path.write_text("action,currency,amount\ndeposit,sol,2\nwithdraw,BTC,1\n", encoding="utf-8")
+		batch = load_batch(path, "csv", assets=assets)
+
+		self.assertEqual(batch.currencies.tolist(), [3, 1])
+		self.assertEqual(list(batch), [Transaction(WalletActionEnum.DEPOSIT, "SOL", 2.0), Transaction(WalletActionEnum.WITHDRAW, "BTC", 1.0)])
+		self.assertIs(batch[1:].assets, assets)
+
+		with self.assertRaises(ValueError):
+			TransactionBatch().append(Transaction(WalletActionEnum.DEPOSIT, "SOL", 1.0))
+
+
+class TestAssetWallet(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(2_000, seed=12)
+
+	def test_matches_wallet(self):
+		"""Test that the built-in currencies behave exactly as in a plain wallet, on both replay paths."""
+		wallet = Wallet(transaction_list=self.transactions)
+		by_transaction = AssetWallet(transaction_list=self.transactions)
+		by_batch = AssetWallet(transaction_list=())
+		result = by_batch.process_batch(TransactionBatch.from_transactions(self.transactions))
+
+		for other in (by_transaction, by_batch):
+			self.assertEqual(other.balance, wallet.balance)
+			self.assertEqual(other.transaction_count, wallet.transaction_count)
+			self.assertEqual(list(other.rejections), list(wallet.rejections))
+
+		self.assertEqual(result.rejected, wallet.rejections.total)
+
+	def test_dynamic_assets(self):
+		"""Test assets registered after the wallet was created."""
+		assets = AssetRegistry()
+		wallet = AssetWallet(transaction_list=[], assets=assets)
+		assets.intern("SOL")
+
+		self.assertTrue(wallet.process_transaction(WalletActionEnum.DEPOSIT, "sol", 3.0))
+		self.assertFalse(wallet.process_transaction(WalletActionEnum.WITHDRAW, "SOL", 5.0))
+		self.assertEqual(wallet.balance, {"SOL": 3.0})
+		self.assertEqual(wallet.rejections[0].currency, "SOL")
+
+		with self.assertRaises(ValueError):
+			wallet.process_transaction(WalletActionEnum.DEPOSIT, "ADA", 1.0)
+
+	def test_initial_state_and_fork(self):
+		"""Test that a plain initial state is moved into arrays and that forks copy them."""
+		wallet = AssetWallet(transaction_list=[], state={CurrencyEnum.BTC: 2.0})
+		fork = wallet.fork()
+		fork.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2.0)
+
+		self.assertEqual(wallet.balance, {CurrencyEnum.BTC: 2.0})
+		self.assertEqual(fork.balance, {CurrencyEnum.BTC: 0.0})
+
+	def test_batch_errors(self):
+		"""Test that batches from another registry or with invalid amounts are refused."""
+		wallet = AssetWallet(transaction_list=[])
+
+		with self.assertRaises(ValueError):
+			wallet.process_batch(TransactionBatch(assets=AssetRegistry()))
+
+		with self.assertRaises(ValueError):
+			wallet.process_batch(TransactionBatch.from_transactions([Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, -1.0)]))
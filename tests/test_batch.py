@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.batch import encode_transactions, replay_batch
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from tests.helpers import random_transactions, replay_wallet
+
+
+class TestReplayBatch(TestCase):
+	def test_readme_example(self):
+		"""Test the batch engine against the README example run."""
+		transactions = [
+			Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5),
+			Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 1000),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 300),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2),
+			Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 5),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 0.5),
+		]
+
+		result = replay_batch(*encode_transactions(transactions))
+
+		self.assertEqual(result.balance, {CurrencyEnum.BTC: 1.0, CurrencyEnum.USD: 700.0, CurrencyEnum.ETH: 5.0})
+		self.assertEqual(result.accepted.tolist(), [True, True, True, False, True, True])
+		self.assertEqual(result.rejected.tolist(), [3])
+
+	def test_matches_wallet_replay(self):
+		"""Test that balances and the accepted mask match a sequential Wallet exactly."""
+		for seed, ratio in [(1, 0.2), (2, 0.5), (3, 0.7)]:
+			transactions = random_transactions(5_000, seed, ratio)
+			balance, accepted = replay_wallet(transactions)
+
+			for block_size in (1, 7, 4096):
+				result = replay_batch(*encode_transactions(transactions), block_size=block_size)
+
+				self.assertEqual(result.balance, balance)
+				self.assertEqual(list(result.balance), list(balance))
+				self.assertEqual(result.accepted.tolist(), accepted)
+
+	def test_empty_batch(self):
+		"""Test that an empty batch yields an empty balance."""
+		result = replay_batch([], [], [])
+
+		self.assertEqual(result.balance, {})
+		self.assertEqual(len(result.accepted), 0)
+
+	def test_initial_state(self):
+		"""Test replaying on top of existing balances."""
+		transactions = [Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 1.0)]
+
+		result = replay_batch(*encode_transactions(transactions), initial_state={CurrencyEnum.BTC: 2.0, CurrencyEnum.USD: 5.0})
+
+		self.assertEqual(result.balance, {CurrencyEnum.BTC: 1.0, CurrencyEnum.USD: 5.0})
+
+	def test_invalid_amount_raises_error(self):
+		"""Test that non-positive amounts are rejected with their index."""
+		with self.assertRaises(ValueError) as context:
+			replay_batch([0, 0], [0, 0], [1.0, 0.0])
+
+		self.assertIn("Amount must be positive", str(context.exception))
+		self.assertIn("transaction 1", str(context.exception))
+
+	def test_invalid_codes_raise_error(self):
+		"""Test that out-of-range action and currency codes are rejected."""
+		with self.assertRaises(ValueError) as context:
+			replay_batch(np.array([0, 5]), [0, 0], [1.0, 1.0])
+
+		self.assertIn("Unsupported wallet action code", str(context.exception))
+
+		with self.assertRaises(ValueError) as context:
+			replay_batch([0], [9], [1.0])
+
+		self.assertIn("Unsupported currency code", str(context.exception))
+
+	def test_column_length_mismatch_raises_error(self):
+		"""Test that columns of different lengths are rejected."""
+		with self.assertRaises(ValueError):
+			replay_batch([0], [0, 1], [1.0])
@@ -0,0 +1,76 @@
+import pathlib
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from src.binary_ledger import BinaryLedger, convert_to_binary_ledger, write_binary_ledger
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+SAMPLE_DATA = pathlib.Path(__file__).parent.parent / "sample_data"
+
+
+class TestBinaryLedger(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.path = pathlib.Path(self.tmp.name) / "ledger.bin"
+
+	def test_round_trip(self):
+		"""Test that written transactions are read back unchanged, across chunk boundaries."""
+		transactions = random_transactions(1_000, seed=7)
+
+		self.assertEqual(write_binary_ledger(self.path, transactions, chunk_size=64), 1_000)
+
+		ledger = BinaryLedger.open(self.path)
+
+		self.assertEqual(len(ledger), 1_000)
+		self.assertEqual(list(ledger), transactions)
+		self.assertIsInstance(ledger.amounts, np.memmap)
+
+	def test_replay_matches_wallet(self):
+		"""Test that replaying the mapped columns matches a Wallet fed from the same ledger."""
+		transactions = random_transactions(2_000, seed=11, withdraw_ratio=0.6)
+		write_binary_ledger(self.path, transactions)
+		ledger = BinaryLedger.open(self.path)
+
+		wallet = Wallet(transaction_list=[])
+		wallet.process_transactions(ledger, verbose=False)
+
+		self.assertEqual(ledger.replay().balance, wallet.balance)
+
+	def test_convert_sample_files(self):
+		"""Test converting the CSV and JSON samples."""
+		expected = [
+			Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 0.25),
+			Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 1.0),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 100.0),
+		]
+
+		for sample in ("example.csv", "example.json"):
+			self.assertEqual(convert_to_binary_ledger(SAMPLE_DATA / sample, self.path), 3)
+			self.assertEqual(list(BinaryLedger.open(self.path)), expected)
+
+	def test_empty_ledger(self):
+		"""Test writing and opening a ledger with no transactions."""
+		write_binary_ledger(self.path, [])
+		ledger = BinaryLedger.open(self.path)
+
+		self.assertEqual(len(ledger), 0)
+		self.assertEqual(ledger.replay().balance, {})
+
+	def test_rejects_foreign_and_truncated_files(self):
+		"""Test that files without the header or with missing rows are rejected."""
+		self.path.write_bytes(b"action,currency,amount\n" * 4)
+
+		with self.assertRaises(ValueError):
+			BinaryLedger.open(self.path)
+
+		write_binary_ledger(self.path, random_transactions(10, seed=1))
+		self.path.write_bytes(self.path.read_bytes()[:-1])
+
+		with self.assertRaises(ValueError):
+			BinaryLedger.open(self.path)
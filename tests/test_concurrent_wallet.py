@@ -0,0 +1,114 @@
+import sys
+import threading
+from collections.abc import Callable
+from unittest import TestCase
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.concurrent_wallet import ConcurrentWallet
+from src.history import BalanceHistory
+from src.metrics import WalletMetrics
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+def run_threads(target: Callable[[int], None], count: int) -> None:
+	"""
+	Runs a function in several threads at once, with frequent thread switches to provoke races.
+	"""
+	interval = sys.getswitchinterval()
+	sys.setswitchinterval(1e-6)
+
+	try:
+		threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+
+		for thread in threads:
+			thread.start()
+
+		for thread in threads:
+			thread.join()
+
+	finally:
+		sys.setswitchinterval(interval)
+
+
+class TestConcurrentWallet(TestCase):
+	def test_matches_wallet(self):
+		"""Test that a single thread gets the same results as a plain wallet."""
+		transactions = random_transactions(1_000, seed=9)
+		wallet, concurrent = Wallet(transaction_list=transactions), ConcurrentWallet(transaction_list=transactions)
+
+		self.assertEqual(concurrent.balance, wallet.balance)
+		self.assertEqual(concurrent.transaction_count, wallet.transaction_count)
+		self.assertEqual(
+			list(concurrent.rejections),
+			[
+				rejection._replace(index=[tx.currency for tx in transactions[: rejection.index]].count(rejection.currency))
+				for rejection in wallet.rejections
+			],
+		)
+
+	def test_withdrawals_never_overdraw(self):
+		"""Test that concurrent withdrawals check and subtract the balance atomically."""
+		wallet = ConcurrentWallet(transaction_list=[Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 100)])
+
+		def withdraw(_: int) -> None:
+			for _ in range(50):
+				wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 1)
+
+		run_threads(withdraw, 8)
+
+		self.assertEqual(wallet.balance, {CurrencyEnum.USD: 0})
+		self.assertEqual(wallet.transaction_count, 401)
+		self.assertEqual(wallet.rejections.total, 300)
+
+	def test_concurrent_currencies(self):
+		"""Test that mixed currencies from many threads keep every balance, count and rejection index consistent."""
+		per_thread = [random_transactions(500, seed=seed) for seed in range(8)]
+		per_thread = [[tx._replace(amount=float(round(tx.amount) or 1)) for tx in txs] for txs in per_thread]
+		accepted: list[list[Transaction]] = [[] for _ in per_thread]
+		wallet = ConcurrentWallet(transaction_list=[])
+
+		def submit(thread: int) -> None:
+			for transaction in per_thread[thread]:
+				if wallet.process_transaction(*transaction):
+					accepted[thread].append(transaction)
+
+		run_threads(submit, len(per_thread))
+
+		for currency in CurrencyEnum:
+			expected = sum(
+				tx.amount if tx.wallet_action == WalletActionEnum.DEPOSIT else -tx.amount for txs in accepted for tx in txs if tx.currency == currency
+			)
+			self.assertEqual(wallet.state[currency], expected)
+
+		counts = {currency: sum(tx.currency == currency for txs in per_thread for tx in txs) for currency in CurrencyEnum}
+		indices = {(rejection.currency, rejection.index) for rejection in wallet.rejections}
+		self.assertEqual(len(indices), wallet.rejections.total)
+		self.assertEqual(wallet.transaction_count, sum(map(len, accepted)) + wallet.rejections.total)
+		self.assertTrue(all(index < counts[currency] for currency, index in indices))
+
+	def test_counts_continue_from_initial_count(self):
+		"""Test that the per-currency counts add up on top of a resumed count, and restart in a fork."""
+		wallet = ConcurrentWallet(transaction_list=random_transactions(40, seed=4), transaction_count=100)
+		fork = wallet.fork()
+		fork.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 1.0)
+
+		self.assertEqual((wallet.transaction_count, fork.transaction_count), (140, 141))
+
+	def test_fork_has_its_own_locks(self):
+		"""Test that a fork does not share locks with its base."""
+		wallet = ConcurrentWallet(transaction_list=random_transactions(100, seed=2))
+		fork = wallet.fork()
+
+		self.assertIsInstance(fork, ConcurrentWallet)
+		self.assertIsNot(fork._locks[CurrencyEnum.BTC], wallet._locks[CurrencyEnum.BTC])  # noqa: SLF001
+		self.assertEqual(fork.balance, wallet.balance)
+
+	def test_unsupported_options(self):
+		"""Test that metrics and balance history are refused."""
+		with self.assertRaises(ValueError):
+			ConcurrentWallet(transaction_list=[], metrics=WalletMetrics())
+
+		with self.assertRaises(ValueError):
+			ConcurrentWallet(transaction_list=[], history=BalanceHistory())
@@ -0,0 +1,112 @@
+import random
+from unittest import TestCase
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.editable_ledger import EditableLedger
+from tests.helpers import random_transactions, replay_wallet
+
+
+class TestEditableLedger(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(1_000, seed=6)
+		self.ledger = EditableLedger.from_transactions(self.transactions)
+
+	def assert_matches_replay(self):
+		"""Checks the ledger against a full replay of its current transactions."""
+		balance, accepted = replay_wallet(list(self.ledger))
+		self.assertEqual(self.ledger.balance, balance)
+		self.assertEqual([self.ledger.accepted(i) for i in range(len(self.ledger))], accepted)
+		self.assertEqual(self.ledger.rejected(), [i for i, ok in enumerate(accepted) if not ok])
+
+	def test_build(self):
+		"""Test that building the ledger replays it like a wallet."""
+		self.assertEqual(list(self.ledger), self.transactions)
+		self.assert_matches_replay()
+
+	def test_random_edits(self):
+		"""Test that every kind of edit keeps the ledger equal to a full replay."""
+		rng = random.Random(7)  # noqa: S311
+		extra = random_transactions(300, seed=8)
+
+		for transaction in extra:
+			edit = rng.choice(("insert", "update", "delete"))
+			index = rng.randrange(len(self.ledger))
+
+			if edit == "insert":
+				self.ledger.insert(index, transaction)
+
+			elif edit == "update":
+				self.ledger.update(index, transaction)
+
+			else:
+				self.ledger.delete(index)
+
+		self.assert_matches_replay()
+
+	def test_reconverges_early(self):
+		"""Test that an edit stops at the first transaction whose outcome did not change."""
+		ledger = EditableLedger.from_transactions(
+			[
+				Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 100),
+				Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 150),
+				Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1),
+				*[Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 1)] * 100,
+				Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 100),
+				*[Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 1)] * 100,
+			],
+		)
+		self.assertEqual(ledger.rejected(), [1])
+
+		# The larger deposit lets the first withdrawal through and rejects the second, which leaves USD at zero as before.
+		self.assertEqual(ledger.update(0, Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 150)), 3)
+		self.assertEqual(ledger.rejected(), [103])
+		self.assertEqual(ledger.balance[CurrencyEnum.USD], 100.0)
+
+		# A missed deposit shifts every later USD balance.
+		self.assertEqual(ledger.insert(1, Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 400)), 103)
+		self.assertEqual(ledger.rejected(), [])
+		self.assertEqual(ledger.balance[CurrencyEnum.USD], 400.0)
+
+		# Deleting the only BTC transaction does not touch the other currencies.
+		self.assertEqual(ledger.delete(3), 0)
+		self.assertNotIn(CurrencyEnum.BTC, ledger.balance)
+
+	def test_currency_change_and_removal(self):
+		"""Test edits that move a transaction to another currency or remove a currency entirely."""
+		ledger = EditableLedger.from_transactions(
+			[
+				Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 2),
+				Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 1),
+			],
+		)
+
+		ledger.update(0, Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 2))
+		self.assertEqual(ledger.balance, {CurrencyEnum.BTC: 0.0, CurrencyEnum.ETH: 2.0})
+		self.assertEqual(ledger.rejected(), [1])
+
+		ledger.delete(1)
+		self.assertEqual(ledger.balance, {CurrencyEnum.ETH: 2.0})
+
+	def test_to_wallet(self):
+		"""Test that the exported wallet matches a replayed one, rejections included."""
+		self.ledger.delete(0)
+		wallet = self.ledger.to_wallet()
+		balance, accepted = replay_wallet(list(self.ledger))
+
+		self.assertEqual(wallet.balance, balance)
+		self.assertEqual(wallet.transaction_count, len(self.ledger))
+		self.assertEqual([r.index for r in wallet.rejections], [i for i, ok in enumerate(accepted) if not ok])
+
+	def test_invalid_edits(self):
+		"""Test that invalid transactions and out of range indices are rejected without changing the ledger."""
+		with self.assertRaises(ValueError):
+			self.ledger.insert(0, Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, -1))
+
+		with self.assertRaises(IndexError):
+			self.ledger.update(len(self.ledger), self.transactions[0])
+
+		with self.assertRaises(IndexError):
+			self.ledger.delete(-1)
+
+		self.assertEqual(list(self.ledger), self.transactions)
@@ -0,0 +1,146 @@
+import csv
+import importlib.util
+import json
+import pathlib
+import tempfile
+import tracemalloc
+from unittest import TestCase, skipIf, skipUnless
+
+from benchmarks.synthetic import generate_transactions
+from src.asset_wallet import AssetWallet
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry, Transaction
+from src.export import OUTCOME_COLUMNS, detect_export_format, export_replay
+from src.wallet import Wallet
+from tests.helpers import CSV, random_transactions, run_main
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+def expected_outcomes(transactions: list[Transaction]) -> list[tuple[bool, float]]:
+	"""
+	Replays transactions one by one, reading each outcome and the balance of its currency right after.
+
+	Returns:
+		list[tuple[bool, float]]: The outcome and balance of each transaction.
+	"""
+	wallet = Wallet(transaction_list=())
+	return [(wallet.process_transaction(*transaction), wallet.state[transaction.currency]) for transaction in transactions]
+
+
+def export_peak(count: int, path: pathlib.Path) -> int:
+	"""
+	Exports a generated ledger under `tracemalloc`.
+
+	Returns:
+		int: The peak memory allocated during the export, in bytes.
+	"""
+	transactions = generate_transactions(count, seed=1)
+	tracemalloc.start()
+
+	try:
+		export_replay(transactions, path, chunk_size=500)
+		return tracemalloc.get_traced_memory()[1]
+
+	finally:
+		tracemalloc.stop()
+
+
+class TestExport(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.directory = pathlib.Path(self.tmp.name)
+		self.transactions = random_transactions(2_500, seed=25)
+
+	def test_csv(self):
+		"""Test that the CSV export lists every outcome and post-transaction balance, across chunks."""
+		path = self.directory / "outcomes.csv"
+		result = export_replay(self.transactions, path, chunk_size=1_000)
+
+		with path.open(newline="", encoding="utf-8") as file:
+			rows = list(csv.DictReader(file))
+
+		self.assertEqual(tuple(rows[0]), OUTCOME_COLUMNS)
+		self.assertEqual([row["index"] for row in rows], [str(index) for index in range(2_500)])
+		self.assertEqual([(row["accepted"] == "True", float(row["balance"])) for row in rows], expected_outcomes(self.transactions))
+		self.assertEqual((result.processed, result.accepted), (2_500, sum(row["accepted"] == "True" for row in rows)))
+		self.assertEqual(result.balance, Wallet(transaction_list=self.transactions).balance)
+
+	def test_ndjson(self):
+		"""Test the NDJSON export of a rejected withdrawal and of assets beyond the built-in currencies."""
+		path = self.directory / "outcomes.jsonl"
+		assets = AssetRegistry()
+		assets.intern("SOL")
+		transactions = [
+			Transaction(WalletActionEnum.DEPOSIT, "SOL", 2.0),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 1.0),
+			Transaction(WalletActionEnum.WITHDRAW, "SOL", 0.5),
+		]
+
+		export_replay(transactions, path, AssetWallet(transaction_list=(), assets=assets), chunk_size=2)
+		rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+		self.assertEqual(
+			rows,
+			[
+				{"index": 0, "action": "DEPOSIT", "currency": "SOL", "amount": 2.0, "accepted": True, "balance": 2.0},
+				{"index": 1, "action": "WITHDRAW", "currency": "USD", "amount": 1.0, "accepted": False, "balance": 0.0},
+				{"index": 2, "action": "WITHDRAW", "currency": "SOL", "amount": 0.5, "accepted": True, "balance": 1.5},
+			],
+		)
+
+	def test_flat_memory(self):
+		"""Test that exporting ten times more transactions does not need much more memory."""
+		small = export_peak(2_000, self.directory / "small.csv")
+		large = export_peak(20_000, self.directory / "large.csv")
+
+		self.assertLess(large, 2 * small)
+
+	def test_formats(self):
+		"""Test detecting formats from extensions."""
+		self.assertEqual([detect_export_format(f"x.{ext}") for ext in ("csv", "ndjson", "feather", "parquet")], ["csv", "ndjson", "arrow", "parquet"])
+
+		with self.assertRaises(ValueError):
+			detect_export_format("outcomes.xlsx")
+
+	@skipUnless(HAS_PYARROW, "pyarrow is not installed")
+	def test_arrow_and_parquet(self):
+		"""Test that the columnar exports hold the same outcomes."""
+		import pyarrow.feather  # noqa: PLC0415
+		import pyarrow.parquet  # noqa: PLC0415
+
+		for name, read in (("outcomes.arrow", pyarrow.feather.read_table), ("outcomes.parquet", pyarrow.parquet.read_table)):
+			export_replay(self.transactions, self.directory / name, chunk_size=1_000)
+			table = read(self.directory / name)
+
+			self.assertEqual(tuple(table.column_names), OUTCOME_COLUMNS)
+			outcomes = zip(table["accepted"].to_pylist(), table["balance"].to_pylist(), strict=True)
+			self.assertEqual(list(outcomes), expected_outcomes(self.transactions))
+
+	@skipIf(HAS_PYARROW, "pyarrow is installed")
+	def test_missing_pyarrow(self):
+		"""Test that columnar formats explain that pyarrow is needed."""
+		with self.assertRaisesRegex(ImportError, "pyarrow"):
+			export_replay(self.transactions, self.directory / "outcomes.parquet")
+
+	def test_headless(self):
+		"""Test exporting from the headless entry point."""
+		ledger, path = self.directory / "ledger.csv", self.directory / "outcomes.ndjson"
+		ledger.write_text(CSV, encoding="utf-8")
+		status, stdout, _ = run_main("--input", str(ledger), "--export", str(path))
+
+		self.assertEqual(status, 0)
+		self.assertEqual(json.loads(stdout)["rejected"], 1)
+		self.assertEqual([json.loads(line)["accepted"] for line in path.read_text(encoding="utf-8").splitlines()], [True] * 3 + [False, True, True])
+
+	def test_headless_rejects_processes(self):
+		"""Test that the headless entry point refuses to export while parsing in several processes."""
+		ledger = self.directory / "ledger.csv"
+		ledger.write_text(CSV, encoding="utf-8")
+
+		with self.assertRaises(SystemExit) as raised:
+			run_main("--input", str(ledger), "--export", str(self.directory / "outcomes.csv"), "--processes", "2")
+
+		self.assertEqual(raised.exception.code, 2)
+		self.assertFalse((self.directory / "outcomes.csv").exists())
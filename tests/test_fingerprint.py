@@ -0,0 +1,100 @@
+import math
+from unittest import TestCase
+
+from src.asset_wallet import AssetWallet
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction, TransactionBatch
+from src.fingerprint import MerkleTree, first_divergence, ledger_fingerprint, replay_fingerprint
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class CountingTree:
+	"""
+	Serves the nodes of a tree while counting how many were fetched, like a remote replica would.
+	"""
+
+	def __init__(self, tree: MerkleTree) -> None:
+		"""
+		Wraps a tree.
+
+		Args:
+			tree (MerkleTree): The tree to serve.
+		"""
+		self.tree = tree
+		self.fetched = 0
+
+	def __len__(self) -> int:
+		return len(self.tree)
+
+	def node(self, level: int, index: int) -> bytes:
+		self.fetched += 1
+		return self.tree.node(level, index)
+
+
+class TestLedgerFingerprint(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(5_000, seed=23)
+
+	def test_equal_ledgers(self):
+		"""Test that equal ledgers have equal roots, whether given as transactions or as a batch."""
+		tree = ledger_fingerprint(self.transactions, chunk_size=64)
+		batch_tree = ledger_fingerprint(TransactionBatch.from_transactions(self.transactions), chunk_size=64)
+
+		self.assertEqual(tree, batch_tree)
+		self.assertEqual((len(tree), tree.rows), (math.ceil(5_000 / 64), 5_000))
+		self.assertIsNone(first_divergence(tree, batch_tree))
+
+	def test_single_change(self):
+		"""Test that one changed row is located in its chunk with a logarithmic number of hash exchanges."""
+		local = ledger_fingerprint(self.transactions, chunk_size=16)
+
+		for row in (0, 1_234, 4_095, 4_999):
+			changed = list(self.transactions)
+			changed[row] = changed[row]._replace(amount=changed[row].amount + 1)
+			remote = CountingTree(ledger_fingerprint(changed, chunk_size=16))
+
+			self.assertNotEqual(local.root, remote.tree.root)
+			self.assertEqual(first_divergence(local, remote), row // 16)
+			self.assertLessEqual(remote.fetched, 2 * math.ceil(math.log2(len(local))) + 1)
+
+	def test_different_lengths(self):
+		"""Test that a prefix diverges at its end, and that a change inside it is found first."""
+		local = ledger_fingerprint(self.transactions, chunk_size=100)
+		prefix = ledger_fingerprint(self.transactions[:3_000], chunk_size=100)
+		partial = ledger_fingerprint(self.transactions[:3_050], chunk_size=100)
+
+		self.assertEqual(first_divergence(local, prefix), 30)
+		self.assertEqual(first_divergence(prefix, local), 30)
+		self.assertEqual(first_divergence(local, partial), 30)
+		self.assertEqual(first_divergence(ledger_fingerprint([]), local), 0)
+		self.assertNotEqual(ledger_fingerprint([]).root, ledger_fingerprint(self.transactions[:1]).root)
+
+		changed = self.transactions[:3_000]
+		changed[1_500] = changed[1_500]._replace(wallet_action=WalletActionEnum.DEPOSIT, amount=1e9)
+		self.assertEqual(first_divergence(local, ledger_fingerprint(changed, chunk_size=100)), 15)
+
+
+class TestReplayFingerprint(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(3_000, seed=7)
+
+	def test_replay_paths_agree(self):
+		"""Test that the reference wallet and the array-backed wallet produce the same replay fingerprint."""
+		reference = replay_fingerprint(Wallet([]), self.transactions, chunk_size=128)
+
+		self.assertEqual(reference.root, replay_fingerprint(AssetWallet([]), self.transactions, chunk_size=128).root)
+		self.assertNotEqual(reference.root, ledger_fingerprint(self.transactions, chunk_size=128).root)
+
+	def test_divergent_state(self):
+		"""Test that replays of the same ledger from different balances diverge where their decisions or balances do."""
+		transactions = [Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 1.0)] * 500
+		reference = replay_fingerprint(Wallet([]), transactions, chunk_size=50)
+		funded = replay_fingerprint(Wallet([], state={CurrencyEnum.USD: 1.0}), transactions, chunk_size=50)
+
+		self.assertEqual(first_divergence(reference, funded), 0)
+
+		accepted = replay_fingerprint(Wallet([]), [*transactions, Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 499.5)], chunk_size=50)
+		rejected = replay_fingerprint(Wallet([]), [*transactions, Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 500.5)], chunk_size=50)
+		self.assertEqual((accepted.rows, len(accepted)), (501, 11))
+		self.assertEqual(first_divergence(accepted, rejected), 10)
@@ -0,0 +1,111 @@
+import pathlib
+import tempfile
+from decimal import Decimal
+from itertools import starmap
+from unittest import TestCase
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.fixed_point import FixedPointWallet, from_minor_units, parse_minor_units_transaction, to_minor_units
+from src.history import BalanceHistory
+from src.snapshot import WalletSnapshot, resume
+from src.streaming import iter_json, stream_into_wallet
+from src.wallet import Wallet
+
+
+class TestMinorUnits(TestCase):
+	def test_to_minor_units(self):
+		"""Test exact conversion from strings, floats and decimals."""
+		self.assertEqual(to_minor_units("0.25", CurrencyEnum.BTC), 25_000_000)
+		self.assertEqual(to_minor_units("1000", CurrencyEnum.USD), 100_000)
+		self.assertEqual(to_minor_units(".5", CurrencyEnum.USD), 50)
+		self.assertEqual(to_minor_units("1.10", CurrencyEnum.USD), 110)
+		self.assertEqual(to_minor_units("1.100", CurrencyEnum.USD), 110)
+		self.assertEqual(to_minor_units(0.1, CurrencyEnum.ETH), 10**17)
+		self.assertEqual(to_minor_units(1e-08, CurrencyEnum.BTC), 1)
+		self.assertEqual(to_minor_units(Decimal("2.5E-7"), CurrencyEnum.BTC), 25)
+
+	def test_to_minor_units_rejects_excess_precision(self):
+		"""Test that amounts finer than the minor unit are rejected instead of rounded."""
+		for amount in ("0.001", 1e-9, "abc", "nan"):
+			with self.assertRaises(ValueError):
+				to_minor_units(amount, CurrencyEnum.USD if amount == "0.001" else CurrencyEnum.BTC)
+
+	def test_from_minor_units(self):
+		"""Test conversion back to exact decimals."""
+		self.assertEqual(from_minor_units(150_000_000, CurrencyEnum.BTC), Decimal("1.5"))
+		self.assertEqual(from_minor_units(1, CurrencyEnum.ETH), Decimal("1E-18"))
+
+
+class TestFixedPointWallet(TestCase):
+	def test_readme_example(self):
+		"""Test the README example with exact balances."""
+		transactions = [
+			parse_minor_units_transaction("DEPOSIT", "BTC", "1.5"),
+			parse_minor_units_transaction("DEPOSIT", "USD", "1000"),
+			parse_minor_units_transaction("WITHDRAW", "USD", "300"),
+			parse_minor_units_transaction("WITHDRAW", "BTC", "2.0"),
+			parse_minor_units_transaction("DEPOSIT", "ETH", "5.0"),
+			parse_minor_units_transaction("WITHDRAW", "BTC", "0.5"),
+		]
+		wallet = FixedPointWallet(transaction_list=transactions)
+
+		self.assertEqual(wallet.balance, {CurrencyEnum.BTC: Decimal(1), CurrencyEnum.USD: Decimal(700), CurrencyEnum.ETH: Decimal(5)})
+		self.assertEqual(wallet.rejections[0].requested, 200_000_000)
+
+	def test_no_drift_at_the_margin(self):
+		"""Test a withdrawal that floats wrongly reject after accumulated rounding error."""
+		deposits = [(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, "0.1")] * 10
+		withdrawal = (WalletActionEnum.WITHDRAW, CurrencyEnum.USD, "1.0")
+
+		float_wallet = Wallet(transaction_list=[(a, c, float(x)) for a, c, x in deposits])
+		exact_wallet = FixedPointWallet(transaction_list=list(starmap(parse_minor_units_transaction, deposits)))
+
+		self.assertFalse(float_wallet.process_transaction(*withdrawal[:2], float(withdrawal[2])))
+		self.assertTrue(exact_wallet.process_transaction(*withdrawal[:2], to_minor_units(withdrawal[2], CurrencyEnum.USD)))
+		self.assertEqual(exact_wallet.balance[CurrencyEnum.USD], 0)
+
+	def test_snapshot_round_trip(self):
+		"""Test that a snapshot keeps minor units beyond float precision exact, and resumes as a fixed-point wallet."""
+		units = 2**53 + 1
+		ledger = [(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, units), (WalletActionEnum.WITHDRAW, CurrencyEnum.ETH, 1)]
+
+		with tempfile.TemporaryDirectory() as directory:
+			path = pathlib.Path(directory) / "snapshot.json"
+			WalletSnapshot.from_wallet(FixedPointWallet(transaction_list=ledger[:1])).save(path)
+			wallet = resume(WalletSnapshot.load(path), ledger)
+
+		self.assertIsInstance(wallet, FixedPointWallet)
+		self.assertEqual(wallet.minor_balance, {CurrencyEnum.ETH: 2**53})
+
+		with self.assertRaises(ValueError):
+			WalletSnapshot.from_dict({"version": 1, "offset": 0, "state": {"ETH": 1.5}, "minor_units": True})
+
+	def test_rejects_history(self):
+		"""Test that a balance history, which stores floats, is refused."""
+		with self.assertRaises(ValueError):
+			FixedPointWallet(transaction_list=[], history=BalanceHistory())
+
+	def test_rejects_float_amounts(self):
+		"""Test that unconverted float amounts are refused."""
+		wallet = FixedPointWallet(transaction_list=[])
+
+		with self.assertRaises(ValueError) as context:
+			wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5)
+
+		self.assertIn("minor units", str(context.exception))
+
+	def test_streaming_parsers_feed_minor_units(self):
+		"""Test that JSON decimals reach the minor-unit parser as text, including wei precision."""
+		with tempfile.TemporaryDirectory() as tmp:
+			path = pathlib.Path(tmp) / "ledger.json"
+			path.write_text(
+				'[{"action": "DEPOSIT", "currency": "ETH", "amount": 0.123456789012345678},'
+				' {"action": "WITHDRAW", "currency": "ETH", "amount": "0.000000000000000001"}]',
+				encoding="utf-8",
+			)
+
+			self.assertEqual(next(iter_json(path, parse=parse_minor_units_transaction)).amount, 123_456_789_012_345_678)
+
+			wallet = stream_into_wallet(path, FixedPointWallet(transaction_list=()), parse=parse_minor_units_transaction)
+
+		self.assertEqual(wallet.balance, {CurrencyEnum.ETH: Decimal("0.123456789012345677")})
@@ -0,0 +1,62 @@
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+
+from tests.helpers import CSV, run_main
+
+
+class TestHeadless(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.path = pathlib.Path(self.tmp.name) / "ledger.csv"
+		self.path.write_text(CSV, encoding="utf-8")
+
+	def test_json_output(self):
+		"""Test the README example as JSON."""
+		status, stdout, _ = run_main("--input", str(self.path), "--format", "csv")
+
+		self.assertEqual(status, 0)
+		self.assertEqual(json.loads(stdout), {"balance": {"BTC": 1.0, "ETH": 5.0, "USD": 700.0}, "processed": 6, "rejected": 1})
+
+	def test_csv_output(self):
+		"""Test the CSV output with a detected format."""
+		status, stdout, _ = run_main("--input", str(self.path), "--output", "csv")
+
+		self.assertEqual(status, 0)
+		self.assertEqual(stdout, "currency,balance\nBTC,1.0\nETH,5.0\nUSD,700.0\n")
+
+	def test_invalid_input(self):
+		"""Test that bad files exit with status 1 and a message on stderr."""
+		self.path.write_text(CSV + "DEPOSIT,DOGE,1\n", encoding="utf-8")
+		status, stdout, stderr = run_main("--input", str(self.path))
+
+		self.assertEqual((status, stdout), (1, ""))
+		self.assertIn("Failed to replay", stderr)
+
+		status, _, _ = run_main("--input", str(self.path.with_name("missing.csv")))
+		self.assertEqual(status, 1)
+
+	def test_malformed_documents(self):
+		"""Test that a non-array JSON document and an unreadable CSV field also exit with status 1 and one line on stderr."""
+		json_path = self.path.with_name("object.json")
+		json_path.write_text('{"action": "DEPOSIT", "currency": "BTC", "amount": 1}', encoding="utf-8")
+		self.path.write_text(f'action,currency,amount\nDEPOSIT,"{"B" * 200_000}",1\n', encoding="utf-8")
+
+		for path, fmt in ((json_path, "json"), (self.path, "csv")):
+			with self.subTest(fmt=fmt):
+				status, stdout, stderr = run_main("--input", str(path), "--format", fmt)
+
+				self.assertEqual((status, stdout), (1, ""))
+				self.assertEqual(stderr.count("\n"), 1)
+				self.assertTrue(stderr.startswith("Failed to replay"))
+
+	def test_no_gui_imports(self):
+		"""Test that the headless entry point never imports the GUI or rendering libraries."""
+		code = "import sys, src.headless; print(sorted({'tkinter', 'prompt_toolkit', 'rich'} & set(sys.modules)))"
+		result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+		self.assertEqual(result.stdout.strip(), "[]")
@@ -0,0 +1,96 @@
+from collections import defaultdict
+from unittest import TestCase
+
+from src.asset_wallet import AssetWallet
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry
+from src.history import BalanceHistory
+from src.metrics import WalletMetrics
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestBalanceHistory(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(500, seed=11)
+		self.history = BalanceHistory(interval=16)
+		self.wallet = Wallet(transaction_list=self.transactions, history=self.history)
+
+	def test_balance_at_matches_prefix_replay(self):
+		"""Test that every point-in-time balance is exactly the balance of a replayed prefix."""
+		for index in (0, 1, 15, 16, 17, 255, 256, 499, 500):
+			with self.subTest(index=index):
+				self.assertEqual(self.history.balance_at(index), Wallet(transaction_list=self.transactions[:index]).balance)
+
+		self.assertEqual(self.history.balance_at(500), self.wallet.balance)
+
+	def test_balance_range(self):
+		"""Test that range queries follow one currency transaction by transaction."""
+		expected = [self.history.balance_at(index).get(CurrencyEnum.ETH, 0.0) for index in range(40, 90)]
+
+		self.assertEqual(self.history.balance_range(CurrencyEnum.ETH, 40, 90), expected)
+		self.assertEqual(self.history.balance_range(CurrencyEnum.ETH, 90, 90), [])
+
+		with self.assertRaises(ValueError):
+			self.history.balance_range(CurrencyEnum.ETH, 90, 40)
+
+	def test_rejected_mask(self):
+		"""Test that the rejected transactions match the wallet's rejection log."""
+		expected = [rejection.index for rejection in self.wallet.rejections]
+
+		self.assertEqual(self.history.rejected(), expected)
+		self.assertEqual(self.history.rejected(100, 200), [index for index in expected if 100 <= index < 200])
+		self.assertFalse(self.history.accepted(expected[0]))
+
+	def test_out_of_range(self):
+		"""Test that indices outside the recorded history are refused."""
+		with self.assertRaises(IndexError):
+			self.history.balance_at(501)
+
+		with self.assertRaises(IndexError):
+			self.history.accepted(500)
+
+		with self.assertRaises(ValueError):
+			BalanceHistory(interval=0)
+
+	def test_recording_starts_at_current_state(self):
+		"""Test a history attached to a resumed wallet, with metrics and the pre-validated mode."""
+		history = BalanceHistory(interval=4)
+		wallet = Wallet(
+			transaction_list=(),
+			state=defaultdict(float, {CurrencyEnum.USD: 10.0}),
+			transaction_count=100,
+			metrics=WalletMetrics(),
+			history=history,
+		)
+		wallet.process_transactions([(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0)] * 9, validated=True)
+		wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 4.0)
+
+		self.assertEqual(history.offset, 100)
+		self.assertEqual(history.balance_at(100), {CurrencyEnum.USD: 10.0})
+		self.assertEqual(history.balance_at(105), {CurrencyEnum.USD: 10.0, CurrencyEnum.BTC: 5.0})
+		self.assertEqual(history.balance_at(110), wallet.balance)
+		self.assertEqual(wallet.metrics.count, 10)
+
+		with self.assertRaises(IndexError):
+			history.balance_at(99)
+
+	def test_registered_assets(self):
+		"""Test a history of assets beyond the built-in currencies, including one registered after a checkpoint."""
+		assets = AssetRegistry()
+		assets.intern("SOL")
+		history = BalanceHistory(interval=2)
+		wallet = AssetWallet(transaction_list=[(WalletActionEnum.DEPOSIT, "SOL", 3.0)] * 3, assets=assets, history=history)
+		assets.intern("DOGE")
+		wallet.process_transaction(WalletActionEnum.DEPOSIT, "DOGE", 7.0)
+		wallet.process_transaction(WalletActionEnum.WITHDRAW, "SOL", 20.0)
+
+		self.assertEqual(history.balance_at(2), {"SOL": 6.0})
+		self.assertEqual(history.balance_at(5), {"SOL": 9.0, "DOGE": 7.0})
+		self.assertEqual(history.balance_range("SOL", 0, 5), [0.0, 3.0, 6.0, 9.0, 9.0])
+		self.assertEqual(history.balance_range("DOGE", 3, 5), [0.0, 7.0])
+		self.assertEqual(history.rejected(), [4])
+
+	def test_wallet_without_history_is_untouched(self):
+		"""Test that wallets without history keep the plain apply step."""
+		self.assertNotIn("_apply", vars(Wallet(transaction_list=[])))
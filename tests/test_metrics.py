@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from src.asset_wallet import AssetWallet
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry
+from src.metrics import WalletMetrics
+from src.wallet import Wallet
+
+
+class TestWalletMetrics(TestCase):
+	def setUp(self):
+		self.metrics = WalletMetrics()
+		self.wallet = Wallet(
+			transaction_list=[
+				(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5),
+				(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 1000),
+				(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 300),
+			],
+			metrics=self.metrics,
+		)
+		self.wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2, verbose=False)
+
+	def test_counters(self):
+		"""Test that construction and direct calls are both counted."""
+		self.assertEqual(self.metrics.count, 4)
+		self.assertEqual(self.metrics.transactions[WalletActionEnum.DEPOSIT, CurrencyEnum.BTC], 1)
+		self.assertEqual(self.metrics.transactions[WalletActionEnum.WITHDRAW, CurrencyEnum.BTC], 1)
+		self.assertEqual(self.metrics.rejected, {CurrencyEnum.BTC: 1})
+		self.assertGreater(self.metrics.latency_sum, 0)
+		self.assertEqual(self.wallet.balance, {CurrencyEnum.BTC: 1.5, CurrencyEnum.USD: 700.0})
+
+	def test_to_dict(self):
+		"""Test the dictionary export."""
+		exported = self.metrics.to_dict()
+
+		self.assertEqual(exported["transactions"]["WITHDRAW:USD"], 1)
+		self.assertEqual(exported["rejected_withdrawals"], {"BTC": 1})
+		self.assertEqual(exported["latency_seconds"]["count"], 4)
+		self.assertEqual(exported["latency_seconds"]["buckets"]["+Inf"], 4)
+
+	def test_to_prometheus(self):
+		"""Test the Prometheus text export."""
+		text = self.metrics.to_prometheus()
+
+		self.assertIn('wallet_transactions_total{action="DEPOSIT",currency="USD"} 1', text)
+		self.assertIn('wallet_rejected_withdrawals_total{currency="BTC"} 1', text)
+		self.assertIn('wallet_process_transaction_seconds_bucket{le="+Inf"} 4', text)
+		self.assertIn("wallet_process_transaction_seconds_count 4", text)
+
+	def test_registered_assets(self):
+		"""Test the exports of assets beyond the built-in currencies."""
+		assets = AssetRegistry()
+		assets.intern("SOL")
+		metrics = WalletMetrics()
+		AssetWallet(
+			transaction_list=[(WalletActionEnum.DEPOSIT, "SOL", 1.0), (WalletActionEnum.WITHDRAW, "SOL", 2.0)],
+			assets=assets,
+			metrics=metrics,
+		)
+
+		self.assertEqual(metrics.to_dict()["transactions"], {"DEPOSIT:SOL": 1, "WITHDRAW:SOL": 1})
+		self.assertEqual(metrics.to_dict()["rejected_withdrawals"], {"SOL": 1})
+		self.assertIn('wallet_rejected_withdrawals_total{currency="SOL"} 1', metrics.to_prometheus())
+
+	def test_disabled_wallet_keeps_plain_method(self):
+		"""Test that wallets without metrics are not wrapped at all."""
+		wallet = Wallet(transaction_list=[])
+
+		self.assertIs(wallet.process_transaction.__func__, Wallet.process_transaction)
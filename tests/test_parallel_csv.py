@@ -0,0 +1,99 @@
+import pathlib
+import tempfile
+from itertools import pairwise
+from unittest import TestCase
+
+import numpy as np
+
+from benchmarks.synthetic import generate_transactions, write_csv
+from src.batch import replay_batch
+from src.parallel_csv import iter_csv_chunks, iter_csv_parallel, replay_csv_parallel, split_byte_ranges
+from src.streaming import iter_csv, stream_into_wallet
+
+
+class TestParallelCsv(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.path = pathlib.Path(self.tmp.name) / "ledger.csv"
+		write_csv(self.path, generate_transactions(2_000, seed=3))
+
+	def test_ranges_cover_file_on_line_boundaries(self):
+		"""Test that the ranges are contiguous, cover the file and start on line boundaries."""
+		header, ranges = split_byte_ranges(self.path, chunk_bytes=1_000)
+		data = self.path.read_bytes()
+
+		self.assertEqual(header, ["action", "currency", "amount"])
+		self.assertEqual(ranges[0][0], data.index(b"\n") + 1)
+		self.assertEqual(ranges[-1][1], len(data))
+
+		for (_, end), (start, _) in pairwise(ranges):
+			self.assertEqual(end, start)
+			self.assertEqual(data[start - 1 : start], b"\n")
+
+	def test_matches_sequential_parser(self):
+		"""Test that chunks are reassembled in file order, in-process and in a pool."""
+		expected = list(iter_csv(self.path))
+
+		for processes in (1, 3):
+			with self.subTest(processes=processes):
+				self.assertEqual(list(iter_csv_parallel(self.path, processes=processes, chunk_bytes=2_000)), expected)
+
+	def test_replay(self):
+		"""Test wallet and batch replay of the columnar chunks."""
+		expected = stream_into_wallet(self.path)
+		wallet = replay_csv_parallel(self.path, processes=2, chunk_bytes=5_000)
+
+		self.assertEqual(wallet.balance, expected.balance)
+		self.assertEqual(wallet.transaction_count, expected.transaction_count)
+
+		columns = [np.concatenate(column) for column in zip(*(c.to_numpy() for c in iter_csv_chunks(self.path, processes=1)), strict=True)]
+		self.assertEqual(replay_batch(*columns).balance, expected.balance)
+
+	def test_invalid_row_has_global_line_number(self):
+		"""Test that errors in later chunks report the same line as the sequential parser."""
+		lines = self.path.read_text(encoding="utf-8").splitlines()
+		lines[1500] = "DEPOSIT,DOGE,1"
+		self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+		with self.assertRaises(ValueError) as expected:
+			list(iter_csv(self.path))
+
+		for processes in (1, 2):
+			parsed = []
+
+			with self.subTest(processes=processes), self.assertRaises(ValueError) as context:
+				parsed.extend(iter_csv_parallel(self.path, processes=processes, chunk_bytes=1_000))
+
+			self.assertEqual(str(context.exception), str(expected.exception))
+			self.assertTrue(str(context.exception).startswith("Invalid row 1501:"))
+			self.assertEqual(len(parsed), 1499)
+
+	def test_missing_headers(self):
+		"""Test that files without the expected headers are refused."""
+		self.path.write_text("a,b,c\n1,2,3\n", encoding="utf-8")
+
+		with self.assertRaises(ValueError):
+			list(iter_csv_parallel(self.path, processes=1))
+
+	def test_blank_lines(self):
+		"""Test that blank lines are skipped in every range, as by the sequential parser, without shifting line numbers."""
+		lines = self.path.read_text(encoding="utf-8").splitlines()
+		lines[700:700] = ["", ""]
+		lines[1200] = ""
+		self.path.write_text("\r\n".join(lines) + "\r\n\r\n", encoding="utf-8")
+		expected = list(iter_csv(self.path))
+
+		self.assertEqual(list(iter_csv_parallel(self.path, processes=1, chunk_bytes=1_000)), expected)
+
+		lines[1500] = "DEPOSIT,DOGE,1"
+		self.path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+		with self.assertRaisesRegex(ValueError, "^Invalid row 1501:"):
+			list(iter_csv_parallel(self.path, processes=1, chunk_bytes=1_000))
+
+	def test_processes_must_be_positive(self):
+		"""Test that zero or negative process counts are refused rather than replaced by the CPU count."""
+		for processes in (0, -1):
+			with self.subTest(processes=processes), self.assertRaises(ValueError):
+				list(iter_csv_parallel(self.path, processes=processes))
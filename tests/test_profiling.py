@@ -0,0 +1,134 @@
+import io
+import pathlib
+import pstats
+import tempfile
+import tracemalloc
+from unittest import TestCase
+from unittest.mock import patch
+
+from rich.console import Console
+
+from benchmarks.synthetic import write_csv
+from src import cli
+from src.common.types import TransactionBatch
+from src.profiling import PipelineProfiler
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestPipelineProfiler(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.directory = pathlib.Path(self.tmp.name)
+		self.transactions = random_transactions(2_000, seed=24)
+
+	def test_disabled(self):
+		"""Test that a disabled profiler records nothing and leaves memory untraced."""
+		profiler = PipelineProfiler()
+
+		with profiler.stage("replay", rows=2_000) as stage:
+			Wallet(transaction_list=self.transactions)
+
+		self.assertEqual(profiler.stages, [])
+		self.assertEqual(stage.wall_seconds, 0.0)
+		self.assertFalse(tracemalloc.is_tracing())
+
+	def test_stages(self):
+		"""Test that each stage records its rows, times and peak memory, in order."""
+		profiler = PipelineProfiler(enabled=True, memory=True)
+
+		with profiler.stage("encode") as stage:
+			batch = TransactionBatch.from_transactions(self.transactions)
+			stage.rows = len(batch)
+
+		with profiler.stage("allocate"):
+			buffer = bytearray(8 << 20)
+
+		profiler.finish()
+
+		encode, allocate = profiler.stages
+		self.assertEqual([stage.name for stage in profiler.stages], ["encode", "allocate"])
+		self.assertEqual(encode.rows, 2_000)
+		self.assertGreater(encode.wall_seconds, 0.0)
+		self.assertGreater(encode.rows_per_second, 0.0)
+		self.assertEqual(allocate.rows_per_second, 0.0)
+		self.assertGreaterEqual(allocate.peak_memory_bytes, len(buffer))
+		self.assertFalse(tracemalloc.is_tracing())
+
+	def test_failing_stage(self):
+		"""Test that a stage that raises is still recorded."""
+		profiler = PipelineProfiler(enabled=True)
+
+		with self.assertRaises(ValueError), profiler.stage("replay"):
+			float("invalid")
+
+		self.assertEqual([(stage.name, stage.peak_memory_bytes) for stage in profiler.stages], [("replay", None)])
+
+	def test_cprofile_dump(self):
+		"""Test that the cProfile statistics cover the stages and load with pstats."""
+		output = self.directory / "cli.prof"
+		profiler = PipelineProfiler(enabled=True, output=output)
+
+		with profiler.stage("replay"):
+			Wallet(transaction_list=self.transactions)
+
+		with profiler.stage("input", interactive=True):
+			TransactionBatch.from_transactions(self.transactions)
+
+		profiler.finish()
+
+		functions = {name for _, _, name in pstats.Stats(str(output)).stats}
+		self.assertIn("process_transaction", functions)
+		self.assertNotIn("from_transactions", functions)
+		self.assertTrue(profiler.stages[1].interactive)
+		self.assertGreater(profiler.stages[1].wall_seconds, 0.0)
+
+	def test_default_memory(self):
+		"""Test that an enabled profiler leaves memory untraced unless asked to."""
+		profiler = PipelineProfiler(enabled=True)
+
+		with profiler.stage("replay") as stage:
+			self.assertFalse(tracemalloc.is_tracing())
+
+		self.assertIsNone(stage.peak_memory_bytes)
+
+	def test_cli_parse_stage(self):
+		"""Test that the CLI parsers time themselves under the module's profiler."""
+		path = self.directory / "transactions.csv"
+		write_csv(path, self.transactions)
+		profiler = PipelineProfiler(enabled=True)
+
+		with patch.object(cli, "profiler", profiler):
+			batch = cli.parse_csv(path)
+
+		profiler.finish()
+
+		self.assertEqual([(stage.name, stage.rows) for stage in profiler.stages], [("parse_csv", len(batch))])
+		self.assertEqual(len(batch), 2_000)
+		self.assertEqual(cli.render_profile(profiler.stages).row_count, 1)
+
+	def test_cli_arguments(self):
+		"""Test the profiling options of the CLI."""
+		self.assertFalse(cli.parse_args([]).profile)
+		self.assertFalse(cli.parse_args(["--profile"]).profile_memory)
+		self.assertEqual(cli.parse_args(["--profile", "--profile-output", "run.prof"]).profile_output, pathlib.Path("run.prof"))
+
+	def test_cli_failure_still_reports(self):
+		"""Test that a failing replay still dumps the statistics of the stages run so far."""
+		output = self.directory / "cli.prof"
+		batch = TransactionBatch.from_transactions(self.transactions)
+		profiler = PipelineProfiler()
+
+		with (
+			patch.object(cli, "profiler", profiler),
+			patch.object(cli, "console", Console(file=io.StringIO())),
+			patch.object(cli, "pick_main_flow", return_value="manual"),
+			patch.object(cli, "manual_input_flow", return_value=batch),
+			patch.object(cli, "summarize", side_effect=RuntimeError("boom")),
+			self.assertRaises(SystemExit),
+		):
+			cli.main(["--profile-output", str(output)])
+
+		self.assertEqual([stage.name for stage in profiler.stages], ["replay"])
+		self.assertTrue(output.exists())
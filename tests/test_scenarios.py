@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction, TransactionBatch
+from src.fixed_point import FixedPointWallet
+from src.scenarios import evaluate_scenario, run_scenarios
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestFork(TestCase):
+	def test_fork_is_independent(self):
+		"""Test that the fork and its base never see each other's later transactions."""
+		base = Wallet(transaction_list=random_transactions(500, seed=3))
+		balance, count = base.balance, base.transaction_count
+		fork = base.fork()
+
+		self.assertEqual(fork.balance, balance)
+		self.assertEqual(fork.transaction_count, count)
+		self.assertEqual(fork.rejections.total, 0)
+
+		fork.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0, verbose=False)
+		self.assertEqual(base.balance, balance)
+		self.assertEqual(base.transaction_count, count)
+
+		base.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 1.0, verbose=False)
+		self.assertEqual(fork.transaction_count, count + 1)
+		self.assertEqual(fork.balance[CurrencyEnum.BTC], balance.get(CurrencyEnum.BTC, 0.0) + 1.0)
+
+	def test_fixed_point_fork(self):
+		"""Test that forking keeps the wallet type and its exact rejection log."""
+		base = FixedPointWallet(transaction_list=[Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 150)])
+		fork = base.fork()
+		fork.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 200, verbose=False)
+
+		self.assertIsInstance(fork, FixedPointWallet)
+		self.assertIs(type(fork.rejections), type(base.rejections))
+		self.assertEqual(fork.minor_balance, base.minor_balance)
+		self.assertEqual(fork.rejections.total, 1)
+		self.assertEqual(base.rejections.total, 0)
+
+
+class TestScenarios(TestCase):
+	def setUp(self):
+		self.prefix = random_transactions(2_000, seed=4)
+		self.base = Wallet(transaction_list=self.prefix)
+		self.scenarios = {f"tail-{seed}": random_transactions(200, seed=seed) for seed in range(10, 16)}
+
+	def test_matches_full_replay(self):
+		"""Test that each scenario ends like a replay of the prefix followed by its tail."""
+		results = run_scenarios(self.base, self.scenarios)
+
+		self.assertEqual(list(results), list(self.scenarios))
+
+		for name, tail in self.scenarios.items():
+			replayed = Wallet(transaction_list=[*self.prefix, *tail])
+			self.assertEqual(results[name].balance, replayed.balance)
+			self.assertEqual(results[name].processed, len(tail))
+
+	def test_rejected_positions(self):
+		"""Test that the rejected positions point into the tail."""
+		tail = [
+			Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 5.0),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.ETH, 1e12),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.ETH, 1.0),
+			Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.ETH, 1e12),
+		]
+		result = evaluate_scenario(self.base, tail)
+
+		self.assertEqual(result.rejected, (1, 3))
+		self.assertEqual(self.base.transaction_count, len(self.prefix))
+
+	def test_processes_match_in_process(self):
+		"""Test that worker processes give the same results, in the same order, including batch tails."""
+		scenarios = self.scenarios | {"batch": TransactionBatch.from_transactions(random_transactions(200, seed=20))}
+		expected = run_scenarios(self.base, scenarios)
+
+		self.assertEqual(run_scenarios(self.base, scenarios, processes=2, scenarios_per_task=2), expected)
+
+	def test_invalid_arguments(self):
+		"""Test that non-positive processes or scenarios per task are rejected."""
+		for processes in (0, -1):
+			with self.subTest(processes=processes), self.assertRaises(ValueError):
+				run_scenarios(self.base, self.scenarios, processes=processes)
+
+		with self.assertRaises(ValueError):
+			run_scenarios(self.base, self.scenarios, scenarios_per_task=0)
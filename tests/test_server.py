@@ -0,0 +1,170 @@
+import asyncio
+import contextlib
+import pathlib
+import tempfile
+from unittest import IsolatedAsyncioTestCase
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.server import WalletServer, parse_line, run_load
+
+
+class DisconnectedWriter:
+	"""
+	Stands in for the output of a client that disconnected: every write fails.
+	"""
+
+	def __init__(self) -> None:
+		"""
+		Starts open.
+		"""
+		self.closed = False
+
+	@staticmethod
+	def write(_data: bytes) -> None:
+		raise ConnectionResetError
+
+	@staticmethod
+	async def drain() -> None:
+		raise ConnectionResetError
+
+	def close(self) -> None:
+		self.closed = True
+
+	async def wait_closed(self) -> None:
+		pass
+
+
+class RecordingWriter:
+	"""
+	Stands in for the output of a connected client: every write is kept.
+	"""
+
+	def __init__(self) -> None:
+		"""
+		Starts open with nothing written.
+		"""
+		self.data = bytearray()
+		self.closed = False
+
+	def write(self, data: bytes) -> None:
+		self.data += data
+
+	async def drain(self) -> None:
+		pass
+
+	def close(self) -> None:
+		self.closed = True
+
+	async def wait_closed(self) -> None:
+		pass
+
+
+class TestWalletServer(IsolatedAsyncioTestCase):
+	async def asyncSetUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.path = str(pathlib.Path(self.tmp.name) / "wallet.sock")
+		self.server = WalletServer(queue_size=8, batch_size=4)
+		self.task = asyncio.create_task(self.server.serve(unix_path=self.path))
+
+		while not pathlib.Path(self.path).exists():  # noqa: ASYNC110
+			await asyncio.sleep(0.01)
+
+	async def asyncTearDown(self):
+		self.task.cancel()
+
+		with contextlib.suppress(asyncio.CancelledError):
+			await self.task
+
+	def test_parse_line(self):
+		"""Test the plain and JSON line formats."""
+		expected = (WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5)
+
+		self.assertEqual(parse_line("deposit btc 1.5\n"), expected)
+		self.assertEqual(parse_line("DEPOSIT,BTC,1.5"), expected)
+		self.assertEqual(parse_line('{"action": "DEPOSIT", "currency": "BTC", "amount": 1.5}'), expected)
+
+		with self.assertRaises(ValueError):
+			parse_line("DEPOSIT BTC")
+
+	async def test_replies_in_order(self):
+		"""Test that each line gets its own reply, in order, and the wallet follows the README rules."""
+		reader, writer = await asyncio.open_unix_connection(self.path)
+		writer.write(b"DEPOSIT BTC 1.5\nWITHDRAW BTC 2\nnot a transaction\nWITHDRAW BTC 0.5\n")
+		await writer.drain()
+
+		replies = [await reader.readline() for _ in range(4)]
+		writer.close()
+		await writer.wait_closed()
+
+		self.assertEqual(replies[0], b"OK\n")
+		self.assertEqual(replies[1], b"REJECTED\n")
+		self.assertTrue(replies[2].startswith(b"ERROR "))
+		self.assertEqual(replies[3], b"OK\n")
+		self.assertEqual(self.server.wallet.balance, {CurrencyEnum.BTC: 1.0})
+
+	async def test_load_generator(self):
+		"""Test that the load generator gets a reply for every transaction through a small queue."""
+		report = await run_load(unix_path=self.path, connections=3, transactions=500, window=16)
+
+		self.assertEqual(report.accepted + report.rejected, 500)
+		self.assertEqual(report.errors, 0)
+		self.assertEqual(self.server.stats.accepted, report.accepted)
+		self.assertLessEqual(report.p50_ms, report.p99_ms)
+
+	async def test_client_disconnects_mid_pipeline(self):
+		"""Test that a connection whose client is gone ends even with a full reply queue and more input pending."""
+		server = WalletServer(max_in_flight=2)
+		applier = asyncio.create_task(server.apply_forever())
+		self.addAsyncCleanup(self.cancel, applier)
+
+		reader = asyncio.StreamReader()
+		reader.feed_data(b"DEPOSIT BTC 1\n" * 50)
+
+		writer = DisconnectedWriter()
+		await asyncio.wait_for(server.handle_connection(reader, writer), timeout=5)
+		await asyncio.sleep(0.01)
+
+		self.assertTrue(writer.closed)
+		self.assertTrue(server.queue.empty())
+		self.assertLess(server.stats.accepted, 50)
+
+	async def test_line_over_limit(self):
+		"""Test that an oversized line gets an error reply after the earlier ones and closes the connection cleanly."""
+		server = WalletServer()
+		applier = asyncio.create_task(server.apply_forever())
+		self.addAsyncCleanup(self.cancel, applier)
+
+		reader = asyncio.StreamReader(limit=64)
+		reader.feed_data(b"DEPOSIT BTC 1\n" + b"9" * 200 + b"\nDEPOSIT BTC 1\n")
+		reader.feed_eof()
+
+		writer = RecordingWriter()
+		await asyncio.wait_for(server.handle_connection(reader, writer), timeout=5)
+		replies = bytes(writer.data).splitlines()
+
+		self.assertTrue(writer.closed)
+		self.assertEqual(replies[0], b"OK")
+		self.assertTrue(replies[1].startswith(b"ERROR Line too long"))
+		self.assertEqual(len(replies), 2)
+		self.assertEqual(server.stats.invalid, 1)
+
+	async def test_line_over_limit_over_socket(self):
+		"""Test that a client sending an oversized line reads an error reply before the server closes the socket."""
+		reader, writer = await asyncio.open_unix_connection(self.path)
+		writer.write(b"DEPOSIT BTC 1\n" + b"9" * (1 << 17) + b"\n")
+		await writer.drain()
+
+		replies = await asyncio.wait_for(reader.read(), timeout=5)
+		writer.close()
+		await writer.wait_closed()
+
+		self.assertEqual(replies.splitlines()[0], b"OK")
+		self.assertTrue(replies.splitlines()[1].startswith(b"ERROR Line too long"))
+
+	@staticmethod
+	async def cancel(task: asyncio.Task) -> None:
+		task.cancel()
+
+		with contextlib.suppress(asyncio.CancelledError):
+			await task
@@ -0,0 +1,62 @@
+import random
+from unittest import TestCase
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AccountTransaction
+from src.sharding import partition_by_account, replay_accounts
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestReplayAccounts(TestCase):
+	def setUp(self):
+		rng = random.Random(3)  # noqa: S311
+		self.transactions = [AccountTransaction(f"acct-{rng.randrange(40)}", *tx) for tx in random_transactions(4_000, seed=3)]
+
+	def expected(self) -> dict:
+		"""
+		Replays each account with its own wallet, one transaction at a time.
+
+		Returns:
+			dict: The balance of each account.
+		"""
+		wallets: dict[str, Wallet] = {}
+
+		for account_id, *tx in self.transactions:
+			wallets.setdefault(account_id, Wallet(transaction_list=[])).process_transaction(*tx, verbose=False)
+
+		return {account_id: wallet.balance for account_id, wallet in wallets.items()}
+
+	def test_partition_keeps_per_account_order(self):
+		"""Test that partitioning keeps the relative order of each account's transactions."""
+		partitions = partition_by_account(self.transactions)
+
+		for account_id, transactions in partitions.items():
+			self.assertEqual(transactions, [tuple(tx[1:]) for tx in self.transactions if tx.account_id == account_id])
+
+	def test_single_process_matches_wallets(self):
+		"""Test the in-process debugging mode against independent wallets."""
+		self.assertEqual(replay_accounts(self.transactions, processes=1), self.expected())
+
+	def test_process_pool_matches_wallets(self):
+		"""Test the process pool against independent wallets, including account order."""
+		balances = replay_accounts(self.transactions, processes=2)
+
+		self.assertEqual(balances, self.expected())
+		self.assertEqual(list(balances), list(self.expected()))
+
+	def test_invalid_transaction_raises_error(self):
+		"""Test that invalid transactions surface as ValueError."""
+		transactions = [AccountTransaction("a", WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, -1.0)]
+
+		with self.assertRaises(ValueError):
+			replay_accounts(transactions, processes=1)
+
+	def test_processes_must_be_positive(self):
+		"""Test that zero processes are refused rather than replaced by the CPU count."""
+		with self.assertRaises(ValueError):
+			replay_accounts(self.transactions, processes=0)
+
+	def test_empty_dump(self):
+		"""Test that an empty dump yields no balances."""
+		self.assertEqual(replay_accounts([], processes=2), {})
@@ -0,0 +1,83 @@
+import pathlib
+import tempfile
+from unittest import TestCase
+
+from src.asset_wallet import AssetWallet
+from src.binary_ledger import BinaryLedger, write_binary_ledger
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import AssetRegistry, TransactionBatch
+from src.snapshot import WalletSnapshot, resume
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestWalletSnapshot(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.ledger = random_transactions(3_000, seed=5, withdraw_ratio=0.55)
+
+		self.full = Wallet(transaction_list=[])
+		self.full.process_transactions(self.ledger, verbose=False)
+
+		self.prefix = Wallet(transaction_list=[])
+		self.prefix.process_transactions(self.ledger[:1_000], verbose=False)
+
+	def test_save_and_load_round_trip(self):
+		"""Test that a saved snapshot restores the exact balances and offset."""
+		path = pathlib.Path(self.tmp.name) / "snapshot.json"
+		WalletSnapshot.from_wallet(self.prefix).save(path)
+
+		restored = WalletSnapshot.load(path).restore()
+
+		self.assertEqual(restored.balance, self.prefix.balance)
+		self.assertEqual(restored.transaction_count, 1_000)
+
+	def test_resume_matches_full_replay(self):
+		"""Test that resuming from a snapshot matches a full replay for lists, iterators, binary ledgers and batches."""
+		snapshot = WalletSnapshot.from_wallet(self.prefix)
+		path = pathlib.Path(self.tmp.name) / "ledger.bin"
+		write_binary_ledger(path, self.ledger)
+
+		for ledger in (self.ledger, iter(self.ledger), BinaryLedger.open(path), TransactionBatch.from_transactions(self.ledger)):
+			wallet = resume(snapshot, ledger)
+
+			self.assertEqual(wallet.balance, self.full.balance)
+			self.assertEqual(wallet.transaction_count, len(self.ledger))
+
+	def test_resume_chain(self):
+		"""Test that snapshots taken from resumed wallets stay cumulative."""
+		first = resume(WalletSnapshot.from_wallet(self.prefix), self.ledger[:2_000])
+		second = resume(WalletSnapshot.from_wallet(first), self.ledger)
+
+		self.assertEqual(second.balance, self.full.balance)
+
+	def test_resume_short_ledger_raises_error(self):
+		"""Test that a ledger shorter than the snapshot offset is rejected."""
+		snapshot = WalletSnapshot.from_wallet(self.prefix)
+
+		for ledger in (self.ledger[:10], iter(self.ledger[:10])):
+			with self.assertRaises(ValueError):
+				resume(snapshot, ledger)
+
+	def test_unsupported_version_raises_error(self):
+		"""Test that documents of another version are rejected."""
+		with self.assertRaises(ValueError):
+			WalletSnapshot.from_dict({"version": 99, "offset": 0, "state": {}})
+
+	def test_registered_assets(self):
+		"""Test that a snapshot of assets beyond the built-in currencies round-trips through the wallet's registry."""
+		path = pathlib.Path(self.tmp.name) / "snapshot.json"
+		assets = AssetRegistry()
+		assets.intern("SOL")
+		ledger = [(WalletActionEnum.DEPOSIT, "SOL", 2.5), (WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 4.0), (WalletActionEnum.WITHDRAW, "SOL", 1.0)]
+		WalletSnapshot.from_wallet(AssetWallet(transaction_list=ledger[:2], assets=assets)).save(path)
+
+		wallet = resume(WalletSnapshot.load(path, assets), ledger)
+
+		self.assertIsInstance(wallet, AssetWallet)
+		self.assertEqual(wallet.balance, {"SOL": 1.5, CurrencyEnum.USD: 4.0})
+		self.assertEqual(wallet.transaction_count, 3)
+
+		with self.assertRaises(ValueError):
+			WalletSnapshot.load(path)
@@ -0,0 +1,139 @@
+import json
+import pathlib
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from src import streaming
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.streaming import chunked, iter_csv, iter_json, iter_ndjson, iter_transactions, stream_into_wallet
+from src.wallet import Wallet
+
+SAMPLE_DATA = pathlib.Path(__file__).parent.parent / "sample_data"
+
+EXPECTED = [
+	Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 0.25),
+	Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 1.0),
+	Transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 100.0),
+]
+
+
+class TestStreaming(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+
+	def write(self, name: str, content: str) -> pathlib.Path:
+		path = pathlib.Path(self.tmp.name) / name
+		path.write_text(content, encoding="utf-8")
+		return path
+
+	def test_sample_files(self):
+		"""Test that every sample file parses to the same transactions."""
+		self.assertEqual(list(iter_csv(SAMPLE_DATA / "example.csv")), EXPECTED)
+		self.assertEqual(list(iter_json(SAMPLE_DATA / "example.json")), EXPECTED)
+		self.assertEqual(list(iter_transactions(SAMPLE_DATA / "example.json")), EXPECTED)
+
+	def test_json_across_read_boundaries(self):
+		"""Test that items split across reads are decoded correctly."""
+		items = [{"action": "deposit", "currency": "usd", "amount": 12345.678 + i} for i in range(50)]
+		path = self.write("ledger.json", json.dumps(items, indent=2))
+
+		for read_size in (1, 3, 17, 4096):
+			parsed = list(iter_json(path, read_size=read_size))
+			self.assertEqual([tx.amount for tx in parsed], [item["amount"] for item in items])
+
+	def test_empty_json_array(self):
+		"""Test that an empty JSON array yields nothing."""
+		self.assertEqual(list(iter_json(self.write("empty.json", " [ ] "))), [])
+
+	def test_json_must_be_a_list(self):
+		"""Test that a non-array JSON document is rejected."""
+		with self.assertRaises(TypeError):
+			list(iter_json(self.write("object.json", '{"action": "DEPOSIT"}')))
+
+	def test_ndjson(self):
+		"""Test newline-delimited JSON, skipping blank lines."""
+		lines = [json.dumps({"action": tx.wallet_action, "currency": tx.currency, "amount": tx.amount}) for tx in EXPECTED]
+		path = self.write("ledger.ndjson", "\n".join([*lines[:1], "", *lines[1:]]))
+
+		self.assertEqual(list(iter_ndjson(path)), EXPECTED)
+		self.assertEqual(list(iter_transactions(path)), EXPECTED)
+
+	def test_invalid_rows_report_their_position(self):
+		"""Test that errors keep the row and item numbering of the original parsers."""
+		csv_path = self.write("bad.csv", "action,currency,amount\nDEPOSIT,BTC,1\nDEPOSIT,DOGE,1\n")
+
+		with self.assertRaises(ValueError) as context:
+			list(iter_csv(csv_path))
+
+		self.assertIn("Invalid row 3", str(context.exception))
+
+		json_path = self.write("bad.json", '[{"action": "DEPOSIT", "currency": "BTC", "amount": -1}]')
+
+		with self.assertRaises(ValueError) as context:
+			list(iter_json(json_path))
+
+		self.assertIn("Invalid item at index 1", str(context.exception))
+
+	def test_malformed_json_item_before_large_tail(self):
+		"""Test that a malformed item fails without reading the rest of the file, and that an open string stops at the item limit."""
+		tail = ", ".join([json.dumps({"action": "DEPOSIT", "currency": "BTC", "amount": 1})] * 200_000)
+		malformed = self.write("malformed.json", f'[{{"action": DEPOSIT, "currency": "BTC", "amount": 1}}, {tail}]')
+		unterminated = self.write("unterminated.json", f'[{{"action": "DEPOSIT, "currency": "BTC", "amount": 1}}, {tail}]')
+
+		reader = streaming._JsonArrayReader  # noqa: SLF001
+
+		with patch.object(reader, "_fill", autospec=True, side_effect=reader._fill) as fill:  # noqa: SLF001
+			with self.assertRaises(ValueError):
+				list(iter_json(malformed, read_size=1_024))
+
+			self.assertLessEqual(fill.call_count, 2)
+			fill.reset_mock()
+
+			with self.assertRaises(ValueError):
+				list(iter_json(unterminated, read_size=1_024, max_item_size=4_096))
+
+			self.assertLessEqual(fill.call_count, 6)
+
+	def test_csv_blank_lines(self):
+		"""Test that blank lines in the middle and at the end of a CSV file are skipped, with rows still numbered as lines."""
+		path = self.write("blank.csv", "action,currency,amount\r\nDEPOSIT,BTC,0.25\r\n\r\nDEPOSIT,ETH,1\r\nWITHDRAW,USD,100\r\n\r\n")
+		self.assertEqual(list(iter_csv(path)), EXPECTED)
+
+		path = self.write("blank_bad.csv", "action,currency,amount\n\nDEPOSIT,DOGE,1\n")
+
+		with self.assertRaises(ValueError) as context:
+			list(iter_csv(path))
+
+		self.assertIn("Invalid row 3", str(context.exception))
+
+	def test_missing_csv_headers(self):
+		"""Test that a CSV file without the required headers is rejected."""
+		with self.assertRaises(ValueError) as context:
+			list(iter_csv(self.write("bad.csv", "type,asset,value\n")))
+
+		self.assertIn("CSV must include headers", str(context.exception))
+
+	def test_chunked(self):
+		"""Test splitting an iterable into bounded chunks."""
+		self.assertEqual(list(chunked(range(5), 2)), [[0, 1], [2, 3], [4]])
+		self.assertEqual(list(chunked([], 2)), [])
+
+	def test_stream_into_wallet_matches_wallet(self):
+		"""Test that a chunked streaming replay matches a full Wallet replay."""
+		rows = "\n".join(f"{'WITHDRAW' if i % 3 else 'DEPOSIT'},{('BTC', 'ETH', 'USD')[i % 3]},{i % 7 + 0.5}" for i in range(200))
+		path = self.write("ledger.csv", "action,currency,amount\n" + rows)
+
+		wallet = stream_into_wallet(path, chunk_size=16)
+		expected = Wallet(transaction_list=[])
+		expected.process_transactions(iter_csv(path), verbose=False)
+
+		self.assertEqual(wallet.balance, expected.balance)
+
+	def test_wallet_accepts_generator(self):
+		"""Test that Wallet consumes any iterable of transactions."""
+		wallet = Wallet(transaction_list=(tx for tx in EXPECTED if tx.wallet_action == WalletActionEnum.DEPOSIT))
+
+		self.assertEqual(wallet.balance, {CurrencyEnum.BTC: 0.25, CurrencyEnum.ETH: 1.0})
@@ -0,0 +1,69 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from src import cli
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import TransactionBatch
+from src.summary import LedgerSummary, summarize
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestLedgerSummary(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(1_000, seed=8)
+		self.wallet = Wallet(transaction_list=[])
+		self.summary = summarize(self.transactions, self.wallet, top_n=5)
+
+	def test_replays_into_wallet(self):
+		"""Test that summarizing replays the transactions like a plain wallet."""
+		self.assertEqual(self.wallet.balance, Wallet(transaction_list=self.transactions).balance)
+
+	def test_validated_skips_checks(self):
+		"""Test that pre-validated transactions take the apply-only path and summarize the same way."""
+		wallet = Wallet(transaction_list=[])
+
+		with patch.object(Wallet, "_validate_transaction", side_effect=AssertionError("validated twice")):
+			summary = summarize(self.transactions, wallet, top_n=5, validated=True)
+
+		self.assertEqual(wallet.balance, self.wallet.balance)
+		self.assertEqual((summary.counts, summary.rejected), (self.summary.counts, self.summary.rejected))
+
+	def test_counts_and_totals(self):
+		"""Test the per action and currency aggregates and the rejected withdrawals."""
+		self.assertEqual(self.summary.count, 1_000)
+		self.assertEqual(sum(self.summary.counts.values()), 1_000)
+
+		deposits = [tx.amount for tx in self.transactions if tx[:2] == (WalletActionEnum.DEPOSIT, CurrencyEnum.BTC)]
+		self.assertEqual(self.summary.counts[WalletActionEnum.DEPOSIT, CurrencyEnum.BTC], len(deposits))
+		self.assertAlmostEqual(self.summary.totals[WalletActionEnum.DEPOSIT, CurrencyEnum.BTC], sum(deposits))
+
+		self.assertEqual(sum(self.summary.rejected.values()), self.wallet.rejections.total)
+
+	def test_largest(self):
+		"""Test that the heap keeps the top N per currency, largest first."""
+		for currency in CurrencyEnum:
+			amounts = sorted((tx.amount for tx in self.transactions if tx.currency == currency), reverse=True)[:5]
+			largest = self.summary.largest(currency)
+
+			self.assertEqual([tx.amount for tx in largest], amounts)
+			self.assertEqual(self.transactions[largest[0].index].amount, largest[0].amount)
+
+	def test_rejections_in_top_n(self):
+		"""Test that a large rejected withdrawal is reported as such."""
+		summary = LedgerSummary(top_n=2)
+		summary.add(0, WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 10.0, accepted=True)
+		summary.add(1, WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 50.0, accepted=False)
+		summary.add(2, WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 1.0, accepted=True)
+
+		self.assertEqual([(tx.index, tx.accepted) for tx in summary.largest(CurrencyEnum.USD)], [(1, False), (0, True)])
+		self.assertEqual(summary.to_dict()["rejected_withdrawals"], {"USD": {"count": 1, "total": 50.0}})
+
+	def test_page_renders_only_the_window(self):
+		"""Test that a transaction page holds one window of rows, whatever the ledger size."""
+		batch = TransactionBatch.from_transactions(self.transactions * 100)
+		page = cli.render_page(batch, 50_000)
+
+		self.assertEqual(page.row_count, cli.PAGE_SIZE)
+		self.assertEqual(page.title, f"Transactions 50001-{50_000 + cli.PAGE_SIZE} of 100000")
+		self.assertEqual(cli.render_page(batch, 99_990).row_count, 10)
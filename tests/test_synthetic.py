@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from benchmarks.synthetic import generate_transactions
+from src.batch import encode_transactions, replay_batch
+from src.common.enums import CurrencyEnum, WalletActionEnum
+
+
+class TestGenerateTransactions(TestCase):
+	def test_reproducible(self):
+		"""Test that the same seed yields the same ledger."""
+		self.assertEqual(list(generate_transactions(500, seed=4)), list(generate_transactions(500, seed=4)))
+		self.assertNotEqual(list(generate_transactions(500, seed=4)), list(generate_transactions(500, seed=5)))
+
+	def test_failing_withdrawals_are_exactly_the_planned_ones(self):
+		"""Test that only the withdrawals generated to fail are rejected by a replay."""
+		transactions = list(generate_transactions(20_000, seed=1, withdraw_ratio=0.5, failing_ratio=0.3))
+		withdrawals = sum(tx.wallet_action == WalletActionEnum.WITHDRAW for tx in transactions)
+		rejected = len(replay_batch(*encode_transactions(transactions)).rejected)
+
+		self.assertAlmostEqual(rejected / withdrawals, 0.3 * 0.5 / (0.5 * 0.3 + 0.5 * 0.7), delta=0.05)
+		self.assertGreater(withdrawals, 0.35 * len(transactions))
+
+	def test_currency_mix(self):
+		"""Test that currencies follow the requested weights."""
+		transactions = list(generate_transactions(10_000, seed=2, currency_mix={CurrencyEnum.BTC: 3, CurrencyEnum.USD: 1}))
+		btc = sum(tx.currency == CurrencyEnum.BTC for tx in transactions)
+
+		self.assertNotIn(CurrencyEnum.ETH, {tx.currency for tx in transactions})
+		self.assertAlmostEqual(btc / len(transactions), 0.75, delta=0.02)
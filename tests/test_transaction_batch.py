@@ -0,0 +1,62 @@
+import pathlib
+from array import array
+from unittest import TestCase
+
+from src.batch import encode_transactions, replay_batch
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction, TransactionBatch
+from src.streaming import iter_csv, load_batch
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+SAMPLE_DATA = pathlib.Path(__file__).parent.parent / "sample_data"
+
+
+class TestTransactionBatch(TestCase):
+	def setUp(self):
+		self.transactions = random_transactions(200, seed=2)
+		self.batch = TransactionBatch.from_transactions(self.transactions)
+
+	def test_round_trip(self):
+		"""Test that iteration, indexing and slicing decode the original transactions."""
+		self.assertEqual(len(self.batch), 200)
+		self.assertEqual(list(self.batch), self.transactions)
+		self.assertEqual(self.batch[-1], self.transactions[-1])
+		self.assertIsInstance(self.batch[5], Transaction)
+		self.assertEqual(list(self.batch[10:20]), self.transactions[10:20])
+		self.assertIsInstance(self.batch[10:20], TransactionBatch)
+
+	def test_append_and_extend(self):
+		"""Test appending single transactions and whole batches."""
+		batch = TransactionBatch()
+		batch.append(self.transactions[0])
+		batch.extend(self.transactions[1:100])
+		batch.extend(self.batch[100:])
+
+		self.assertEqual(batch, self.batch)
+		self.assertEqual(batch.nbytes, 200 * 11)
+
+		with self.assertRaises(ValueError):
+			batch.append(("TRANSFER", CurrencyEnum.BTC, 1.0))
+
+	def test_compact_columns(self):
+		"""Test the column types."""
+		self.assertEqual([column.typecode for column in self.batch.columns], ["B", "H", "d"])
+		self.assertIsInstance(self.batch.amounts, array)
+
+	def test_wallet_and_batch_engine_accept_batches(self):
+		"""Test that a batch replays like the list it was built from."""
+		expected = Wallet(transaction_list=self.transactions).balance
+
+		self.assertEqual(Wallet(transaction_list=self.batch).balance, expected)
+		self.assertEqual(replay_batch(*self.batch.columns).balance, expected)
+
+		for column, encoded in zip(encode_transactions(self.batch), encode_transactions(self.transactions), strict=True):
+			self.assertEqual(column.tolist(), encoded.tolist())
+
+	def test_load_batch(self):
+		"""Test that the parsers fill a batch directly."""
+		batch = load_batch(SAMPLE_DATA / "example.csv")
+
+		self.assertEqual(list(batch), list(iter_csv(SAMPLE_DATA / "example.csv")))
+		self.assertEqual(batch[0], Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 0.25))
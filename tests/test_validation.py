@@ -0,0 +1,68 @@
+from unittest import TestCase
+
+from src.batch import encode_transactions
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.validation import MAX_REPORTED_ROWS, BatchValidationError, find_invalid_columns, find_invalid_rows, validate_columns, validate_transactions
+
+VALID = [
+	(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5),
+	(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 300.0),
+]
+
+
+class TestValidation(TestCase):
+	def test_valid_batch(self):
+		"""Test that a valid batch is returned materialized."""
+		self.assertEqual(validate_transactions(iter(VALID)), VALID)
+		self.assertEqual(find_invalid_rows(VALID), [])
+
+	def test_reports_every_invalid_row(self):
+		"""Test that every bad row is reported with its index, not only the first."""
+		transactions = [
+			VALID[0],
+			("TRANSFER", CurrencyEnum.BTC, 1.0),
+			(WalletActionEnum.DEPOSIT, "DOGE", 1.0),
+			(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, -1.0),
+			(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, float("nan")),
+			(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, "1"),
+			(WalletActionEnum.DEPOSIT, CurrencyEnum.ETH),
+			VALID[1],
+		]
+
+		with self.assertRaises(BatchValidationError) as context:
+			validate_transactions(transactions)
+
+		self.assertEqual([error.index for error in context.exception.errors], [1, 2, 3, 4, 5, 6])
+		self.assertIn("Unsupported wallet action: TRANSFER", context.exception.errors[0].reason)
+		self.assertIn("Unsupported currency: DOGE", context.exception.errors[1].reason)
+		self.assertIn("Malformed transaction", context.exception.errors[5].reason)
+		self.assertIsInstance(context.exception, ValueError)
+
+	def test_message_is_bounded(self):
+		"""Test that the message summarizes long error lists."""
+		transactions = [(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 0.0)] * (MAX_REPORTED_ROWS + 5)
+
+		with self.assertRaises(BatchValidationError) as context:
+			validate_transactions(transactions)
+
+		self.assertEqual(len(context.exception.errors), MAX_REPORTED_ROWS + 5)
+		self.assertIn("and 5 more", str(context.exception))
+
+	def test_columns(self):
+		"""Test vectorized validation of encoded columns."""
+		actions, currencies, amounts = encode_transactions(VALID * 3)
+		validate_columns(actions, currencies, amounts)
+
+		actions[1], currencies[2], amounts[2], amounts[5] = 7, 9, 0.0, -2.0
+		errors = find_invalid_columns(actions, currencies, amounts)
+
+		self.assertEqual([error.index for error in errors], [1, 2, 5])
+		self.assertEqual(errors[1].reason, "Unsupported currency code: 9")
+
+		with self.assertRaises(BatchValidationError):
+			validate_columns(actions, currencies, amounts)
+
+	def test_columns_length_mismatch(self):
+		"""Test that columns of different lengths are refused."""
+		with self.assertRaises(ValueError):
+			find_invalid_columns([0], [0, 1], [1.0])
@@ -0,0 +1,106 @@
+import math
+import os
+import pathlib
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.common.types import Transaction
+from src.valuation import PriceCache, PriceSeries, read_price_series, value_wallets, write_price_series
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+DAY = 86_400
+
+
+class TestPriceSeries(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.directory = pathlib.Path(self.tmp.name)
+		self.series = PriceSeries([3 * DAY, DAY, 2 * DAY], [30.0, 10.0, 20.0])
+
+	def test_as_of(self):
+		"""Test that lookups take the latest earlier price, and NaN before the first one."""
+		prices = self.series.as_of([0, DAY, DAY + 1, 2 * DAY, 10 * DAY])
+
+		self.assertTrue(math.isnan(prices[0]))
+		self.assertEqual(prices[1:].tolist(), [10.0, 10.0, 20.0, 30.0])
+		self.assertTrue(np.isnan(PriceSeries([], []).as_of([DAY])).all())
+
+	def test_files(self):
+		"""Test that CSV and binary files load to the same sorted series."""
+		csv_path, binary_path = self.directory / "btc.csv", self.directory / "btc.bin"
+		csv_path.write_text("Timestamp,Price\n1970-01-04,30\n86400,10\n1970-01-03T00:00:00+00:00,20\n", encoding="utf-8")
+		write_price_series(binary_path, self.series)
+
+		for path in (csv_path, binary_path):
+			series = read_price_series(path)
+			self.assertEqual(series.timestamps.tolist(), [DAY, 2 * DAY, 3 * DAY])
+			self.assertEqual(series.prices.tolist(), [10.0, 20.0, 30.0])
+
+		csv_path.write_text("timestamp,value\n1,2\n", encoding="utf-8")
+
+		with self.assertRaises(ValueError):
+			read_price_series(csv_path)
+
+	def test_cache(self):
+		"""Test LRU eviction and reloading of changed files."""
+		paths = [self.directory / f"{name}.bin" for name in ("a", "b", "c")]
+
+		for path in paths:
+			write_price_series(path, self.series)
+
+		cache = PriceCache(capacity=2)
+		first = cache.get(paths[0])
+		self.assertIs(cache.get(paths[0]), first)
+
+		cache.get(paths[1])
+		cache.get(paths[2])
+		self.assertEqual(len(cache), 2)
+		self.assertIsNot(cache.get(paths[0]), first)
+		self.assertEqual((cache.hits, cache.misses), (1, 4))
+
+		write_price_series(paths[0], PriceSeries([DAY], [5.0]))
+		stat = paths[0].stat()
+		os.utime(paths[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+		self.assertEqual(cache.get(paths[0]).prices.tolist(), [5.0])
+
+
+class TestValueWallets(TestCase):
+	def test_matches_loop(self):
+		"""Test the matrix valuation against pricing every wallet at every timestamp one by one."""
+		wallets = [Wallet(transaction_list=random_transactions(200, seed=seed)) for seed in range(20)]
+		prices = {
+			CurrencyEnum.BTC: PriceSeries(np.arange(0, 100 * DAY, DAY), np.linspace(100, 200, 100)),
+			CurrencyEnum.ETH: PriceSeries(np.arange(0, 100 * DAY, 7 * DAY), np.linspace(10, 20, 15)),
+		}
+		timestamps = np.arange(0, 120 * DAY, DAY // 2)
+		values = value_wallets(wallets, prices, timestamps)
+
+		self.assertEqual(values.shape, (20, len(timestamps)))
+
+		for row, wallet in enumerate(wallets):
+			for column, when in enumerate(timestamps[::37]):
+				expected = sum(
+					amount * (1.0 if currency == CurrencyEnum.USD else prices[currency].as_of([when])[0])
+					for currency, amount in wallet.balance.items()
+				)
+				self.assertAlmostEqual(values[row, column * 37], expected, places=6)
+
+	def test_missing_prices(self):
+		"""Test that only wallets holding a currency without a price yet are NaN, and that unpriced currencies fail."""
+		wallets = [
+			Wallet(transaction_list=[Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 2.0)]),
+			Wallet(transaction_list=[Transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 5.0)]),
+		]
+		values = value_wallets(wallets, {CurrencyEnum.BTC: PriceSeries([DAY], [10.0])}, [0, DAY])
+
+		self.assertTrue(math.isnan(values[0, 0]))
+		self.assertEqual(values[0, 1], 20.0)
+		self.assertEqual(values[1].tolist(), [5.0, 5.0])
+
+		with self.assertRaises(ValueError):
+			value_wallets(wallets, {}, [DAY])
@@ -0,0 +1,172 @@
+import os
+import pathlib
+import tempfile
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.snapshot import WalletSnapshot
+from src.wal import LOG_FILE, RECORD_SIZE, SNAPSHOT_FILE, DurableWallet, LogRecord, WriteAheadLog, read_log
+from src.wallet import Wallet
+from tests.helpers import random_transactions
+
+
+class TestWriteAheadLog(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.directory = pathlib.Path(self.tmp.name)
+
+	def test_records_round_trip(self):
+		"""Test that appended records are read back in order once synced."""
+		records = [LogRecord(i, WalletActionEnum.DEPOSIT, CurrencyEnum.ETH, 0.1 * (i + 1)) for i in range(10)]
+
+		with WriteAheadLog(self.directory / LOG_FILE, max_delay=0) as log:
+			for record in records:
+				log.append(record)
+
+			log.sync()
+			self.assertEqual(read_log(log.path), (records, 10 * RECORD_SIZE))
+
+	def test_group_commit_batches_concurrent_callers(self):
+		"""Test that concurrent commits share syncs, and that every caller is acknowledged."""
+		with WriteAheadLog(self.directory / LOG_FILE, max_delay=0.05) as log:
+
+			def commit(index: int) -> None:
+				log.wait(log.append(LogRecord(index, WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0)))
+
+			threads = [threading.Thread(target=commit, args=(i,)) for i in range(20)]
+
+			for thread in threads:
+				thread.start()
+
+			for thread in threads:
+				thread.join()
+
+			self.assertLess(log.syncs, 20)
+			self.assertEqual(len(read_log(log.path)[0]), 20)
+
+	def test_short_writes(self):
+		"""Test that a group is acknowledged only once every byte of it is written, however short each write is."""
+		write = os.write
+
+		with (
+			patch.object(os, "write", side_effect=lambda fd, data: write(fd, data[:5])),
+			WriteAheadLog(self.directory / LOG_FILE, max_delay=0.01) as log,
+		):
+			records = [LogRecord(i, WalletActionEnum.DEPOSIT, CurrencyEnum.USD, 1.0) for i in range(3)]
+			log.wait(max(log.append(record) for record in records))
+
+			self.assertEqual(read_log(log.path), (records, 3 * RECORD_SIZE))
+
+	def test_invalid_settings(self):
+		"""Test that a negative delay or empty batches are refused."""
+		with self.assertRaises(ValueError):
+			WriteAheadLog(self.directory / LOG_FILE, max_batch=0)
+
+
+class TestDurableWallet(TestCase):
+	def setUp(self):
+		self.tmp = tempfile.TemporaryDirectory()
+		self.addCleanup(self.tmp.cleanup)
+		self.directory = pathlib.Path(self.tmp.name)
+		self.transactions = random_transactions(300, seed=5)
+
+	def test_recovers_after_crash(self):
+		"""Test that a wallet reopened without a clean shutdown has every acknowledged transaction."""
+		wallet = DurableWallet.open(self.directory, max_delay=0)
+
+		for transaction in self.transactions:
+			wallet.process_transaction(*transaction)
+
+		# A crash in the middle of a write leaves a torn record behind.
+		with (self.directory / LOG_FILE).open("ab") as f:
+			f.write(b"\x00" * (RECORD_SIZE // 2))
+
+		with DurableWallet.open(self.directory) as recovered:
+			self.assertEqual(recovered.balance, Wallet(transaction_list=self.transactions).balance)
+			self.assertEqual(recovered.wallet.transaction_count, 300)
+			self.assertEqual((self.directory / LOG_FILE).stat().st_size, 300 * RECORD_SIZE)
+
+		wallet.close()
+
+	def test_checkpoint_then_more_transactions(self):
+		"""Test recovery from a snapshot plus the log written after it."""
+		with DurableWallet.open(self.directory, max_delay=0) as wallet:
+			for transaction in self.transactions[:200]:
+				wallet.process_transaction(*transaction)
+
+			snapshot = wallet.checkpoint()
+
+			for transaction in self.transactions[200:]:
+				wallet.process_transaction(*transaction)
+
+		self.assertEqual(snapshot.offset, 200)
+		self.assertEqual(len(read_log(self.directory / LOG_FILE)[0]), 100)
+
+		with DurableWallet.open(self.directory) as recovered:
+			self.assertEqual(recovered.balance, Wallet(transaction_list=self.transactions).balance)
+
+	def test_log_covered_by_snapshot_is_skipped(self):
+		"""Test a crash between saving a snapshot and emptying the log."""
+		with DurableWallet.open(self.directory, max_delay=0) as wallet:
+			for transaction in self.transactions:
+				wallet.process_transaction(*transaction)
+
+			WalletSnapshot.from_wallet(wallet.wallet).save(self.directory / SNAPSHOT_FILE)
+
+		with DurableWallet.open(self.directory) as recovered:
+			self.assertEqual(recovered.balance, Wallet(transaction_list=self.transactions).balance)
+			self.assertEqual(recovered.wallet.transaction_count, 300)
+
+	def test_invalid_transaction_is_not_logged(self):
+		"""Test that a rejected call leaves the log untouched."""
+		with DurableWallet.open(self.directory, max_delay=0) as wallet, self.assertRaises(ValueError):
+			wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, -1.0)
+
+		self.assertEqual(read_log(self.directory / LOG_FILE), ([], 0))
+
+	def test_append_after_close(self):
+		"""Test that a closed wallet refuses transactions without touching its balances."""
+		wallet = DurableWallet.open(self.directory, max_delay=0)
+		wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0)
+		wallet.close()
+
+		with self.assertRaises(ValueError):
+			wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0)
+
+		self.assertEqual((wallet.balance, wallet.wallet.transaction_count), ({CurrencyEnum.BTC: 1.0}, 1))
+
+	def test_writer_failure(self):
+		"""Test that once the log cannot be synced, the wallet refuses every later transaction and checkpoint."""
+		with DurableWallet.open(self.directory, max_delay=0) as wallet:
+			wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0)
+
+			with patch("src.wal._sync", side_effect=OSError("disk full")), self.assertRaises(OSError):
+				wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 2.0)
+
+			for call in (lambda: wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 4.0), wallet.checkpoint):
+				with self.assertRaises(OSError):
+					call()
+
+			self.assertEqual(wallet.wallet.transaction_count, 2)
+
+		with DurableWallet.open(self.directory) as recovered:
+			self.assertEqual(recovered.wallet.transaction_count, 2)
+			self.assertFalse((self.directory / SNAPSHOT_FILE).exists())
+
+	def test_checkpoint_syncs_directory(self):
+		"""Test that the snapshot's rename is synced before the log is emptied."""
+		calls = []
+
+		with DurableWallet.open(self.directory, max_delay=0) as wallet:
+			wallet.process_transaction(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.0)
+
+			with (
+				patch("src.snapshot._sync_directory", side_effect=lambda directory: calls.append(("directory", directory))),
+				patch.object(wallet.log, "truncate", side_effect=lambda: calls.append(("truncate", None))),
+			):
+				wallet.checkpoint()
+
+		self.assertEqual(calls, [("directory", self.directory), ("truncate", None)])
@@ -2,6 +2,7 @@ from unittest import TestCase
 from unittest.mock import patch
 
 from src.common.enums import CurrencyEnum, WalletActionEnum
+from src.rejections import RejectionLog
 from src.wallet import Wallet
 
 
@@ -21,7 +22,7 @@ class TestWallet(TestCase):
 		]
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(2, "BTC")):
-			wallet = Wallet(transaction_list=transactions)
+			wallet = Wallet(transaction_list=transactions, verbose=True)
 
 			self.assertEqual(wallet.balance[CurrencyEnum.BTC], 1.0)
 			self.assertEqual(wallet.balance[CurrencyEnum.ETH], 5.0)
@@ -96,7 +97,7 @@ class TestWallet(TestCase):
 		wallet = Wallet(transaction_list=transactions)
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(5, "BTC")):
-			result = wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 5.0)
+			result = wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 5.0, verbose=True)
 
 		self.assertFalse(result)
 		self.assertEqual(wallet.balance[CurrencyEnum.BTC], 1.0)
@@ -106,7 +107,7 @@ class TestWallet(TestCase):
 		wallet = Wallet(transaction_list=[])
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(1, "BTC")):
-			result = wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 1.0)
+			result = wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 1.0, verbose=True)
 
 		self.assertFalse(result)
 
@@ -133,6 +134,42 @@ class TestWallet(TestCase):
 
 		self.assertEqual(wallet.balance[CurrencyEnum.USD], 1000.0)
 
+	# Rejection Log Tests
+	def test_rejections_are_silent_by_default(self):
+		"""Test that skipped withdrawals do not warn unless the wallet opts in."""
+		transactions = [(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 1.0)]
+
+		with patch("src.wallet.warn") as mock_warn:
+			wallet = Wallet(transaction_list=transactions)
+
+		mock_warn.assert_not_called()
+		self.assertEqual(wallet.rejections.total, 1)
+
+	def test_rejection_log_records_details(self):
+		"""Test that skipped withdrawals are recorded with their index, requested amount and available balance."""
+		transactions = [
+			(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5),
+			(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2.0),
+			(WalletActionEnum.WITHDRAW, CurrencyEnum.ETH, 0.5),
+		]
+		wallet = Wallet(transaction_list=transactions)
+
+		self.assertEqual(
+			list(wallet.rejections),
+			[(1, CurrencyEnum.BTC, 2.0, 1.5), (2, CurrencyEnum.ETH, 0.5, 0.0)],
+		)
+		self.assertEqual(wallet.rejections[0].available, 1.5)
+
+	def test_rejection_log_is_bounded(self):
+		"""Test that rejections beyond the capacity are counted but not stored."""
+		wallet = Wallet(transaction_list=[], rejections=RejectionLog(capacity=2))
+		result = wallet.process_transactions([(WalletActionEnum.WITHDRAW, CurrencyEnum.USD, 1.0)] * 5)
+
+		self.assertEqual(len(wallet.rejections), 2)
+		self.assertEqual(wallet.rejections.total, 5)
+		self.assertEqual(wallet.rejections.dropped, 3)
+		self.assertEqual((result.processed, result.accepted, result.rejected), (5, 0, 5))
+
 	# Validation Tests
 	def test_invalid_currency_raises_error(self):
 		"""Test that invalid currency raises ValueError."""
@@ -230,13 +267,13 @@ class TestWallet(TestCase):
 		wallet = Wallet(transaction_list=transactions)
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(10, "BTC")):
-			wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 10.0)
+			wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 10.0, verbose=True)
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(5, "BTC")):
-			wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 5.0)
+			wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 5.0, verbose=True)
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(2, "BTC")):
-			wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2.0)
+			wallet.process_transaction(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2.0, verbose=True)
 
 		self.assertEqual(wallet.balance[CurrencyEnum.BTC], 1.0)
 
@@ -262,8 +299,25 @@ class TestWallet(TestCase):
 		]
 
 		with self.assertWarns(UserWarning, msg=self.WARN_MSG.format(5, "BTC")):
-			wallet_2 = Wallet(transaction_list=transactions_2)
+			wallet_2 = Wallet(transaction_list=transactions_2, verbose=True)
 
 		# First wallet should have 5.0, second should have 10.0
 		self.assertEqual(wallet_1.balance[CurrencyEnum.BTC], 5.0)
 		self.assertEqual(wallet_2.balance[CurrencyEnum.BTC], 10.0)
+
+	def test_validated_replay_matches_checked_replay(self):
+		"""Test that the pre-validated mode skips the per-call checks without changing the outcome."""
+		transactions = [
+			(WalletActionEnum.DEPOSIT, CurrencyEnum.BTC, 1.5),
+			(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 2.0),
+			(WalletActionEnum.WITHDRAW, CurrencyEnum.BTC, 0.5),
+		]
+		checked = Wallet(transaction_list=[])
+		validated = Wallet(transaction_list=[])
+
+		with patch.object(Wallet, "_validate_transaction") as mock_validate:
+			result = validated.process_transactions(transactions, validated=True)
+
+		mock_validate.assert_not_called()
+		self.assertEqual(result, checked.process_transactions(transactions))
+		self.assertEqual(validated.transaction_count, 3)